@@ -1,8 +1,10 @@
 # FC7 TTC output delay configuration script
 # Usage: python config_delays.py [crate] [slot] [fmc] [options]
 
-import uhal, sys, getopt, ctypes
-uhal.disableLogging()
+import fc7_client, fc7_fanout, fc7_transaction, sys, getopt, ctypes
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT()
 
 # help menu
 def HELP_MENU():
@@ -34,9 +36,10 @@ except getopt.GetoptError:
     HELP_MENU()
     sys.exit(2)
 
-uri = "ipbusudp-2.0://192.168."+sys.argv[1]+"."+sys.argv[2]+":50001"
-address_table = "file://address_tables/address_table.xml"
-fc7 = uhal.getDevice("hw_id", uri, address_table)
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2], "file://address_tables/address_table.xml")
+
+# all options of this command line go out together
+tx = fc7_transaction.Transaction(fc7)
 
 for opt, arg in opts:
     # help menu
@@ -46,48 +49,43 @@ for opt, arg in opts:
 
     # TTC output delay for SFP 1
     elif opt in ("-a"):
-        fc7.getNode("TTC.DELAY0."+fmc).write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print 'TTC output delay set for SFP 1.'
+        tx.write("TTC.DELAY0."+fmc, ctypes.c_uint32(int(arg)).value)
+        tx.note('TTC output delay set for SFP 1.')
 
     # TTC output delay for SFP 2
     elif opt in ("-b"):
-        fc7.getNode("TTC.DELAY1."+fmc).write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print 'TTC output delay set for SFP 2.'
+        tx.write("TTC.DELAY1."+fmc, ctypes.c_uint32(int(arg)).value)
+        tx.note('TTC output delay set for SFP 2.')
 
     # TTC output delay for SFP 3
     elif opt in ("-c"):
-        fc7.getNode("TTC.DELAY2."+fmc).write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print 'TTC output delay set for SFP 3.'
+        tx.write("TTC.DELAY2."+fmc, ctypes.c_uint32(int(arg)).value)
+        tx.note('TTC output delay set for SFP 3.')
 
     # TTC output delay for SFP 4
     elif opt in ("-d"):
-        fc7.getNode("TTC.DELAY3."+fmc).write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print 'TTC output delay set for SFP 4.'
+        tx.write("TTC.DELAY3."+fmc, ctypes.c_uint32(int(arg)).value)
+        tx.note('TTC output delay set for SFP 4.')
 
     # TTC output delay for SFP 5
     elif opt in ("-e"):
-        fc7.getNode("TTC.DELAY4."+fmc).write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print 'TTC output delay set for SFP 5.'
+        tx.write("TTC.DELAY4."+fmc, ctypes.c_uint32(int(arg)).value)
+        tx.note('TTC output delay set for SFP 5.')
 
     # TTC output delay for SFP 6
     elif opt in ("-f"):
-        fc7.getNode("TTC.DELAY5."+fmc).write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print 'TTC output delay set for SFP 6.'
+        tx.write("TTC.DELAY5."+fmc, ctypes.c_uint32(int(arg)).value)
+        tx.note('TTC output delay set for SFP 6.')
 
     # TTC output delay for SFP 7
     elif opt in ("-g"):
-        fc7.getNode("TTC.DELAY6."+fmc).write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print 'TTC output delay set for SFP 7.'
+        tx.write("TTC.DELAY6."+fmc, ctypes.c_uint32(int(arg)).value)
+        tx.note('TTC output delay set for SFP 7.')
 
     # TTC output delay for SFP 8
     elif opt in ("-h"):
-        fc7.getNode("TTC.DELAY7."+fmc).write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print 'TTC output delay set for SFP 8.'
+        tx.write("TTC.DELAY7."+fmc, ctypes.c_uint32(int(arg)).value)
+        tx.note('TTC output delay set for SFP 8.')
+
+# send whatever is still queued
+tx.flush()
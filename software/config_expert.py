@@ -1,8 +1,10 @@
 # FC7 expert configuration script
 # Usage: python config_expert.py [crate] [slot] [options]
 
-import uhal, sys, getopt, ctypes, time
-uhal.disableLogging()
+import fc7_client, fc7_fanout, fc7_transaction, sys, getopt, ctypes, time
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT()
 
 # help menu
 def HELP_MENU():
@@ -48,9 +50,10 @@ except getopt.GetoptError:
     HELP_MENU()
     sys.exit(2)
 
-uri = "ipbusudp-2.0://192.168."+sys.argv[1]+"."+sys.argv[2]+":50001"
-address_table = "file://$GM2DAQ_DIR/address_tables/FC7_CCC.xml"
-fc7 = uhal.getDevice("hw_id", uri, address_table)
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2])
+
+# all options of this command line go out together
+tx = fc7_transaction.Transaction(fc7)
 
 for opt, arg in opts:
     # help menu
@@ -61,106 +64,80 @@ for opt, arg in opts:
     # TTS manual tap delay mode
     elif opt in ("-t"):
         if arg=='on':
-            fc7.getNode("TTS.RX.TAP.MANUAL").write(1)
-            fc7.dispatch()
-            print( 'TTS manual tap delay enabled.')
+            tx.write("TTS.RX.TAP.MANUAL", 1)
+            tx.note('TTS manual tap delay enabled.')
         elif arg=='off':
-            fc7.getNode("TTS.RX.TAP.MANUAL").write(0)
-            fc7.dispatch()
-            print( 'TTS manual tap delay disabled.')
+            tx.write("TTS.RX.TAP.MANUAL", 0)
+            tx.note('TTS manual tap delay disabled.')
 
     # TTS tap delay value
     elif opt in ("-d"):
-        fc7.getNode("TTS.RX.TAP.DELAY").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print( 'TTS tap delay value set.')
+        tx.write("TTS.RX.TAP.DELAY", ctypes.c_uint32(int(arg)).value)
+        tx.note('TTS tap delay value set.')
         
     # toggle TTS tap delay strobe
     elif opt in ("-u"):
-        fc7.getNode("TTS.RX.TAP.STROBE").write(1)
-        fc7.dispatch()
-        fc7.getNode("TTS.RX.TAP.STROBE").write(0)
-        fc7.dispatch()
-        print( 'TTS tap delay strobe toggled.')
+        tx.pulse("TTS.RX.TAP.STROBE")
+        tx.note('TTS tap delay strobe toggled.')
 
     # toggle TTS realign setting
     elif opt in ("-r"):
-        fc7.getNode("TTS.RX.REALIGN").write(1)
-        fc7.dispatch()
-        fc7.getNode("TTS.RX.REALIGN").write(0)
-        fc7.dispatch()
-        print( 'TTS realign setting toggled.')
+        tx.pulse("TTS.RX.REALIGN")
+        tx.note('TTS realign setting toggled.')
         
     # reset TTS receiver logic
     elif opt in ("-o"):
         if arg=='L08':
-            fc7.getNode("TTS.RX.RESET.L08").write(1)
-            fc7.dispatch()
-            fc7.getNode("TTS.RX.RESET.L08").write(0)
-            fc7.dispatch()
-            print( 'Reset to L08 TTS receiver logic issued.')
+            tx.pulse("TTS.RX.RESET.L08")
+            tx.note('Reset to L08 TTS receiver logic issued.')
         elif arg=='L12':
-            fc7.getNode("TTS.RX.RESET.L12").write(1)
-            fc7.dispatch()
-            fc7.getNode("TTS.RX.RESET.L12").write(0)
-            fc7.dispatch()
-            print( 'Reset to L12 TTS receiver logic issued.')
+            tx.pulse("TTS.RX.RESET.L12")
+            tx.note('Reset to L12 TTS receiver logic issued.')
         
     # reset TTC decoder logic
     elif opt in ("-g"):
-        fc7.getNode("TTC.DECODER.RST").write(1)
-        fc7.dispatch()
-        fc7.getNode("TTC.DECODER.RST").write(0)
-        fc7.dispatch()
-        print( 'Reset to TTC decoder logic issued.')
+        tx.pulse("TTC.DECODER.RST")
+        tx.note('Reset to TTC decoder logic issued.')
 
     # transceiver channel select
     elif opt in ("-c"):
-        fc7.getNode("I2C.CHANNEL").write(ctypes.c_uint32(int(arg,2)).value)
-        fc7.dispatch()
-        print( 'Transceiver channel select set.')
+        tx.write("I2C.CHANNEL", ctypes.c_uint32(int(arg,2)).value)
+        tx.note('Transceiver channel select set.')
         
     # transceiver EEPROM map select
     elif opt in ("-m"):
-        fc7.getNode("I2C.EEPROM.MAP").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print( 'Transceiver EEPROM map select set.')
+        tx.write("I2C.EEPROM.MAP", ctypes.c_uint32(int(arg)).value)
+        tx.note('Transceiver EEPROM map select set.')
         
     # transceiver EEPROM start address
     elif opt in ("-a"):
-        fc7.getNode("I2C.EEPROM.ADR").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print( 'Transceiver EEPROM start address set.')
+        tx.write("I2C.EEPROM.ADR", ctypes.c_uint32(int(arg)).value)
+        tx.note('Transceiver EEPROM start address set.')
         
     # transceiver EEPROM register count
     elif opt in ("-n"):
-        fc7.getNode("I2C.EEPROM.NUM").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print( 'Transceiver EEPROM register count set.')
+        tx.write("I2C.EEPROM.NUM", ctypes.c_uint32(int(arg)).value)
+        tx.note('Transceiver EEPROM register count set.')
         
     # read transceiver EEPROM
     elif opt in ("-x"):
         if arg=='L08':
-            fc7.getNode("I2C.READ.L08").write(1)
-            fc7.dispatch()
-            fc7.getNode("I2C.READ.L08").write(0)
-            fc7.dispatch()
+            tx.pulse("I2C.READ.L08")
+            tx.flush()
             time.sleep(2)
-            regs = fc7.getNode("STATUS").readBlock(14)
-            fc7.dispatch()
+            regs = tx.readBlock("STATUS", 14)
+            tx.flush()
             val1 = '{0:032b}'.format(int(regs.value()[10]))[0:32]
             val2 = '{0:032b}'.format(int(regs.value()[11]))[0:32]
             val3 = '{0:032b}'.format(int(regs.value()[12]))[0:32]
             val4 = '{0:032b}'.format(int(regs.value()[13]))[0:32]
             print( 'L08 I2C read returned : 0x '+('%x' % int(val4+val3+val2+val1,2)).zfill(32)+'.')
         elif arg=='L12':
-            fc7.getNode("I2C.READ.L12").write(1)
-            fc7.dispatch()
-            fc7.getNode("I2C.READ.L12").write(0)
-            fc7.dispatch()
+            tx.pulse("I2C.READ.L12")
+            tx.flush()
             time.sleep(2)
-            regs = fc7.getNode("STATUS").readBlock(14)
-            fc7.dispatch()
+            regs = tx.readBlock("STATUS", 14)
+            tx.flush()
             val1 = '{0:032b}'.format(int(regs.value()[6]))[0:32]
             val2 = '{0:032b}'.format(int(regs.value()[7]))[0:32]
             val3 = '{0:032b}'.format(int(regs.value()[8]))[0:32]
@@ -170,113 +147,91 @@ for opt, arg in opts:
     # reset FMC I2C expander chips
     elif opt in ("-e"):
         if arg=='L08':
-            fc7.getNode("I2C.RESET.L08").write(1)
-            fc7.dispatch()
-            fc7.getNode("I2C.RESET.L08").write(0)
-            fc7.dispatch()
-            print( 'Reset to L08 FMC I2C expander chips issued.')
+            tx.pulse("I2C.RESET.L08")
+            tx.note('Reset to L08 FMC I2C expander chips issued.')
         elif arg=='L12':
-            fc7.getNode("I2C.RESET.L12").write(1)
-            fc7.dispatch()
-            fc7.getNode("I2C.RESET.L12").write(0)
-            fc7.dispatch()
-            print( 'Reset to L12 FMC I2C expander chips issued.')
+            tx.pulse("I2C.RESET.L12")
+            tx.note('Reset to L12 FMC I2C expander chips issued.')
         
     # requested L12 FMC ID number, in binary
     elif opt in ("-i"):
-        fc7.getNode("FMC.ID.REQUEST.L12").write(ctypes.c_uint32(int(arg,2)).value)
-        fc7.dispatch()
-        print( 'Requested L12 FMC ID number set.')
+        tx.write("FMC.ID.REQUEST.L12", ctypes.c_uint32(int(arg,2)).value)
+        tx.note('Requested L12 FMC ID number set.')
         
     # requested L08 FMC ID number, in binary
     elif opt in ("-j"):
-        fc7.getNode("FMC.ID.REQUEST.L08").write(ctypes.c_uint32(int(arg,2)).value)
-        fc7.dispatch()
-        print( 'Requested L08 FMC ID number set.')
+        tx.write("FMC.ID.REQUEST.L08", ctypes.c_uint32(int(arg,2)).value)
+        tx.note('Requested L08 FMC ID number set.')
         
     # write requested FMC ID numbers
     elif opt in ("-w"):
-        fc7.getNode("FMC.ID.WRITE").write(1)
-        fc7.dispatch()
-        fc7.getNode("FMC.ID.WRITE").write(0)
-        fc7.dispatch()
-        print( 'Requested FMC ID numbers written.')
+        tx.pulse("FMC.ID.WRITE")
+        tx.note('Requested FMC ID numbers written.')
 
     # begin-of-cycle left output trigger delay
     elif opt in ("-s"):
-        fc7.getNode("OTRIG.DELAY.A").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print( 'Begin-of-cycle left output trigger delay set.')
+        tx.write("OTRIG.DELAY.A", ctypes.c_uint32(int(arg)).value)
+        tx.note('Begin-of-cycle left output trigger delay set.')
 
     # begin-of-cycle left output trigger width
     elif opt in ("-l"):
-        fc7.getNode("OTRIG.WIDTH.A").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print( 'Begin-of-cycle left output trigger width set.')
+        tx.write("OTRIG.WIDTH.A", ctypes.c_uint32(int(arg)).value)
+        tx.note('Begin-of-cycle left output trigger width set.')
 
     # begin-of-cycle left output trigger disable
     elif opt in ("-f"):
         if arg=='on':
-            fc7.getNode("OTRIG.DISABLE.A").write(0)
-            fc7.dispatch()
-            print( 'Begin-of-cycle left output trigger enabled.')
+            tx.write("OTRIG.DISABLE.A", 0)
+            tx.note('Begin-of-cycle left output trigger enabled.')
         elif arg=='off':
-            fc7.getNode("OTRIG.DISABLE.A").write(1)
-            fc7.dispatch()
-            print( 'Begin-of-cycle left output trigger disabled.')
+            tx.write("OTRIG.DISABLE.A", 1)
+            tx.note('Begin-of-cycle left output trigger disabled.')
 
     # begin-of-cycle right output trigger delay
     elif opt in ("-k"):
-        fc7.getNode("OTRIG.DELAY.B").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print( 'Begin-of-cycle right output trigger delay set.')
+        tx.write("OTRIG.DELAY.B", ctypes.c_uint32(int(arg)).value)
+        tx.note('Begin-of-cycle right output trigger delay set.')
 
     # begin-of-cycle right output trigger width
     elif opt in ("-p"):
-        fc7.getNode("OTRIG.WIDTH.B").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print( 'Begin-of-cycle right output trigger width set.')
+        tx.write("OTRIG.WIDTH.B", ctypes.c_uint32(int(arg)).value)
+        tx.note('Begin-of-cycle right output trigger width set.')
 
     # begin-of-cycle right output trigger disable
     elif opt in ("-q"):
         if arg=='on':
-            fc7.getNode("OTRIG.DISABLE.B").write(0)
-            fc7.dispatch()
-            print( 'Begin-of-cycle right output trigger enabled.')
+            tx.write("OTRIG.DISABLE.B", 0)
+            tx.note('Begin-of-cycle right output trigger enabled.')
         elif arg=='off':
-            fc7.getNode("OTRIG.DISABLE.B").write(1)
-            fc7.dispatch()
-            print( 'Begin-of-cycle right output trigger disabled.')
+            tx.write("OTRIG.DISABLE.B", 1)
+            tx.note('Begin-of-cycle right output trigger disabled.')
 
     # input LEMO trigger select
     elif opt in ("-b"):
         if arg=='left':
-            fc7.getNode("TRX.LEMO.SEL").write(0)
-            fc7.dispatch()
+            tx.write("TRX.LEMO.SEL", 0)
         if arg=='right':
-            fc7.getNode("TRX.LEMO.SEL").write(1)
-            fc7.dispatch()
-        print( 'Input LEMO trigger select set.')
+            tx.write("TRX.LEMO.SEL", 1)
+        tx.note('Input LEMO trigger select set.')
 
     # end-of-run asynchronous readout wait count
     elif opt in ("-y"):
-        fc7.getNode("EOR.ASYNC.WAIT").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print( 'End-of-run asynchronous readout wait count set.')
+        tx.write("EOR.ASYNC.WAIT", ctypes.c_uint32(int(arg)).value)
+        tx.note('End-of-run asynchronous readout wait count set.')
 
     # send BOC even when in overflow mode
     elif opt in ("-v"):
         if arg=='on':
-            fc7.getNode("SEND.OFW.BOC").write(1)
-            fc7.dispatch()
-            print( 'send BOC in overflow state enabled.')
+            tx.write("SEND.OFW.BOC", 1)
+            tx.note('send BOC in overflow state enabled.')
         elif arg=='off':
-            fc7.getNode("SEND.OFW.BOC").write(0)
-            fc7.dispatch()
-            print( 'send BOC in overflow state enabled.')
+            tx.write("SEND.OFW.BOC", 0)
+            tx.note('send BOC in overflow state enabled.')
 
     # reprogram Kintex-7 FPGA
     elif opt in ("-z"):
-        fc7.getNode("SYSTEM.FPGA_REPROG").write(1)
-        fc7.dispatch()
-        print( 'Kintex-7 FPGA reprogramming request issued.')
+        tx.write("SYSTEM.FPGA_REPROG", 1)
+        tx.note('Kintex-7 FPGA reprogramming request issued.')
+
+# send whatever is still queued
+tx.flush()
@@ -1,8 +1,10 @@
 # FC7 general configuration script
 # Usage: python config_general.py [crate] [slot] [options]
 
-import uhal, sys, getopt, ctypes, time
-uhal.disableLogging()
+import fc7_client, fc7_fanout, fc7_transaction, sys, getopt, ctypes, time
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT()
 
 # help menu
 def HELP_MENU():
@@ -42,9 +44,10 @@ except getopt.GetoptError:
     HELP_MENU()
     sys.exit(2)
 
-uri = "ipbusudp-2.0://192.168."+sys.argv[1]+"."+sys.argv[2]+":50001"
-address_table = "file://$GM2DAQ_DIR/address_tables/FC7_CCC.xml"
-fc7 = uhal.getDevice("hw_id", uri, address_table)
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2])
+
+# all options of this command line go out together
+tx = fc7_transaction.Transaction(fc7)
 
 for opt, arg in opts:
     # help menu
@@ -55,148 +58,119 @@ for opt, arg in opts:
     # reset
     elif opt in ("-r"):
         if arg=='hard':
-            fc7.getNode("SYSTEM.HARD.RESET").write(1)
-            fc7.dispatch()
+            tx.write("SYSTEM.HARD.RESET", 1)
+            tx.flush()
             time.sleep(2)
             print ('System hard reset issued.')
         elif arg=='soft':
-            fc7.getNode("SYSTEM.SOFT.RESET").write(1)
-            fc7.dispatch()
-            fc7.getNode("SYSTEM.SOFT.RESET").write(0)
-            fc7.dispatch()
+            tx.pulse("SYSTEM.SOFT.RESET")
+            tx.flush()
             time.sleep(2)
             print ('System soft reset issued.')
 
     # run mode
     elif opt in ("-m"):
         if arg=='start':
-            fc7.getNode("SYSTEM.RUN_ENABLE").write(1)
-            fc7.dispatch()
-            print ('Run has started.')
+            tx.write("SYSTEM.RUN_ENABLE", 1)
+            tx.note('Run has started.')
         elif arg=='stop':
-            fc7.getNode("SYSTEM.RUN_ABORT").write(0)
-            fc7.dispatch()
-            fc7.getNode("SYSTEM.RUN_ENABLE").write(0)
-            fc7.dispatch()
-            print ('Run has stopped.')
+            tx.write("SYSTEM.RUN_ABORT", 0)
+            tx.write("SYSTEM.RUN_ENABLE", 0)
+            tx.note('Run has stopped.')
         elif arg=='pause':
-            fc7.getNode("SYSTEM.RUN_PAUSE").write(1)
-            fc7.dispatch()
-            print ('Run has paused.')
+            tx.write("SYSTEM.RUN_PAUSE", 1)
+            tx.note('Run has paused.')
         elif arg=='resume':
-            fc7.getNode("SYSTEM.RUN_PAUSE").write(0)
-            fc7.dispatch()
-            print ('Run has resumed.')
+            tx.write("SYSTEM.RUN_PAUSE", 0)
+            tx.note('Run has resumed.')
         elif arg=='abort':
-            fc7.getNode("SYSTEM.RUN_ABORT").write(1)
-            fc7.dispatch()
-            print ('Run has aborted.')
+            tx.write("SYSTEM.RUN_ABORT", 1)
+            tx.note('Run has aborted.')
 
     # TTC trigger sequencer count
     elif opt in ("-c"):
-        fc7.getNode("SEQ.COUNT").write(ctypes.c_uint32(int(arg)-1).value)
-        fc7.dispatch()
-        print ('TTC trigger sequencer count set.')
+        tx.write("SEQ.COUNT", ctypes.c_uint32(int(arg)-1).value)
+        tx.note('TTC trigger sequencer count set.')
 
     # overflow warning threshold, in super-cycles
     elif opt in ("-w"):
-        fc7.getNode("OFW.THRES").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('Overflow warning threshold set.')
+        tx.write("OFW.THRES", ctypes.c_uint32(int(arg)).value)
+        tx.note('Overflow warning threshold set.')
 
     # super-cycle start threshold
     elif opt in ("-s"):
-        fc7.getNode("CYCLE.THRES").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('Super-cycle start threshold set.')
+        tx.write("CYCLE.THRES", ctypes.c_uint32(int(arg)).value)
+        tx.note('Super-cycle start threshold set.')
 
     # TTS lock threshold
     elif opt in ("-t"):
-        fc7.getNode("TTS.LOCK.THRES").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('TTS lock threshold set.')
+        tx.write("TTS.LOCK.THRES", ctypes.c_uint32(int(arg)).value)
+        tx.note('TTS lock threshold set.')
 
     # TTS lock mismatch allowed
     elif opt in ("-u"):
-        fc7.getNode("TTS.LOCK.MISMATCH").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('TTS lock mismatch allowed set.')
+        tx.write("TTS.LOCK.MISMATCH", ctypes.c_uint32(int(arg)).value)
+        tx.note('TTS lock mismatch allowed set.')
 
     # requested L12 SFP slots to enable
     elif opt in ("-a"):
-        fc7.getNode("SFP.REQUEST.L12").write(ctypes.c_uint32(int(arg,2)).value)
-        fc7.dispatch()
-        print ('Enabled top FMC SFP slots have been requested.')
+        tx.write("SFP.REQUEST.L12", ctypes.c_uint32(int(arg,2)).value)
+        tx.note('Enabled top FMC SFP slots have been requested.')
 
     # requested L08 SFP slots to enable
     elif opt in ("-b"):
-        fc7.getNode("SFP.REQUEST.L08").write(ctypes.c_uint32(int(arg,2)).value)
-        fc7.dispatch()
-        print ('Enabled bottom FMC SFP slots have been requested.')
+        tx.write("SFP.REQUEST.L08", ctypes.c_uint32(int(arg,2)).value)
+        tx.note('Enabled bottom FMC SFP slots have been requested.')
 
     # enable requested SFP slots
     elif opt in ("-e"):
         if arg=='L08':
-            fc7.getNode("SFP.ENABLE.L08").write(1)
-            fc7.dispatch()
-            fc7.getNode("SFP.ENABLE.L08").write(0)
-            fc7.dispatch()
+            tx.pulse("SFP.ENABLE.L08")
+            tx.flush()
             time.sleep(1)
-            fc7.getNode("TTS.RX.RESET.L08").write(1)
-            fc7.dispatch()
-            fc7.getNode("TTS.RX.RESET.L08").write(0)
-            fc7.dispatch()
+            tx.pulse("TTS.RX.RESET.L08")
+            ports = tx.read("SFP.REQUEST.L08")
+            tx.flush()
             time.sleep(1)
-            ports = fc7.getNode("SFP.REQUEST.L08").read()
-            fc7.dispatch()
             enabled = bin(int(ports)).count("1")
             time.sleep(2*enabled)
-            regs = fc7.getNode("STATUS").readBlock(29)
-            fc7.dispatch()
+            regs = tx.readBlock("STATUS", 29)
+            tx.flush()
             val = '{0:032b}'.format(int(regs.value()[28]))[16:24]
             print ('Enabled L08 SFP slots : '+val+'.')
         if arg=='L12':
-            fc7.getNode("SFP.ENABLE.L12").write(1)
-            fc7.dispatch()
-            fc7.getNode("SFP.ENABLE.L12").write(0)
-            fc7.dispatch()
+            tx.pulse("SFP.ENABLE.L12")
+            tx.flush()
             time.sleep(1)
-            fc7.getNode("TTS.RX.RESET.L12").write(1)
-            fc7.dispatch()
-            fc7.getNode("TTS.RX.RESET.L12").write(0)
-            fc7.dispatch()
+            tx.pulse("TTS.RX.RESET.L12")
+            ports = tx.read("SFP.REQUEST.L12")
+            tx.flush()
             time.sleep(1)
-            ports = fc7.getNode("SFP.REQUEST.L12").read()
-            fc7.dispatch()
             enabled = bin(int(ports)).count("1")
             time.sleep(2*enabled)
-            regs = fc7.getNode("STATUS").readBlock(29)
-            fc7.dispatch()
+            regs = tx.readBlock("STATUS", 29)
+            tx.flush()
             val = '{0:032b}'.format(int(regs.value()[28]))[24:32]
             print ('Enabled L12 SFP slots : '+val+'.')
 
     # TTC single-bit error threshold
     elif opt in ("-x"):
-        fc7.getNode("TTC.SBIT.THRES").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('TTC single-bit error threshold set.')
+        tx.write("TTC.SBIT.THRES", ctypes.c_uint32(int(arg)).value)
+        tx.note('TTC single-bit error threshold set.')
         
     # TTC multi-bit error threshold
     elif opt in ("-y"):
-        fc7.getNode("TTC.MBIT.THRES").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('TTC multi-bit error threshold set.')
+        tx.write("TTC.MBIT.THRES", ctypes.c_uint32(int(arg)).value)
+        tx.note('TTC multi-bit error threshold set.')
 
     # WFD5 asynchronous storage mode
     elif opt in ("-d"):
         if arg=='on':
-            fc7.getNode("ASYNC.STORAGE.EN").write(1)
-            fc7.dispatch()
-            print ('WFD5 asynchronous storage mode will be used.')
+            tx.write("ASYNC.STORAGE.EN", 1)
+            tx.note('WFD5 asynchronous storage mode will be used.')
         elif arg=='off':
-            fc7.getNode("ASYNC.STORAGE.EN").write(0)
-            fc7.dispatch()
-            print ('WFD5 asynchronous storage mode will not be used.')
+            tx.write("ASYNC.STORAGE.EN", 0)
+            tx.note('WFD5 asynchronous storage mode will not be used.')
     
     # post-trigger number reset delay
     elif opt in ("-f"):
@@ -206,9 +180,8 @@ for opt, arg in opts:
             print ('  DELAY:',arg)
             sys.exit(2)
         
-        fc7.getNode("POST.RST.TN.DELAY").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('Post-trigger number reset delay set.')
+        tx.write("POST.RST.TN.DELAY", ctypes.c_uint32(int(arg)).value)
+        tx.note('Post-trigger number reset delay set.')
 
     # post-timestamp reset delay
     elif opt in ("-g"):
@@ -218,9 +191,8 @@ for opt, arg in opts:
             print ('  DELAY:',arg)
             sys.exit(2)
         
-        fc7.getNode("POST.RST.TS.DELAY").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('Post-timestamp reset delay set.')
+        tx.write("POST.RST.TS.DELAY", ctypes.c_uint32(int(arg)).value)
+        tx.note('Post-timestamp reset delay set.')
 
     # analog TTC trigger output width
     elif opt in ("-i"):
@@ -230,9 +202,8 @@ for opt, arg in opts:
             print ('  WIDTH:',arg)
             sys.exit(2)
 
-        fc7.getNode("TTC.TRIG.WIDTH").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('Analog TTC trigger output width set.')
+        tx.write("TTC.TRIG.WIDTH", ctypes.c_uint32(int(arg)).value)
+        tx.note('Analog TTC trigger output width set.')
 
     # analog TTC trigger output delay
     elif opt in ("-j"):
@@ -242,9 +213,8 @@ for opt, arg in opts:
             print ('  WIDTH:',arg)
             sys.exit(2)
 
-        fc7.getNode("TTC.TRIG.DELAY").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('Analog TTC trigger output delay set.')
+        tx.write("TTC.TRIG.DELAY", ctypes.c_uint32(int(arg)).value)
+        tx.note('Analog TTC trigger output delay set.')
 
     # laser prescale factor (channel 9 appears instead of channel 8 every FACTOR cycles)
     elif opt in ("-p"):
@@ -254,9 +224,8 @@ for opt, arg in opts:
             print ('  FACTOR:',arg)
             sys.exit(2)
 
-        fc7.getNode("LASER.PRESCALE").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('Laser prescale factor set to '+arg)
+        tx.write("LASER.PRESCALE", ctypes.c_uint32(int(arg)).value)
+        tx.note('Laser prescale factor set to '+arg)
 
     # toggle between 8 fills and 16 fills per supercycle
     elif opt in ("-q"):
@@ -266,6 +235,8 @@ for opt, arg in opts:
             print ('  VALUE:',arg)
             sys.exit(2)
 
-        fc7.getNode("CYCLE_SIZE_TOGGLE").write(ctypes.c_uint32(int(arg)).value)
-        fc7.dispatch()
-        print ('8/16 Toggle value set to ',arg)
+        tx.write("CYCLE_SIZE_TOGGLE", ctypes.c_uint32(int(arg)).value)
+        tx.note('8/16 Toggle value set to '+arg)
+
+# send whatever is still queued
+tx.flush()
@@ -1,8 +1,10 @@
 # trigger FC7 internal triggering configuration script
 # Usage: python config_general.py [crate] [slot] [options]
 
-import uhal, sys, getopt, ctypes, time
-uhal.disableLogging()
+import fc7_client, fc7_fanout, fc7_transaction, sys, getopt, ctypes, time
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT()
 
 # help menu
 def HELP_MENU():
@@ -35,9 +37,10 @@ except getopt.GetoptError:
     HELP_MENU()
     sys.exit(2)
 
-uri = "ipbusudp-2.0://192.168."+sys.argv[1]+"."+sys.argv[2]+":50001"
-address_table = "file://address_tables/address_table.xml"
-fc7 = uhal.getDevice("hw_id", uri, address_table)
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2], "file://address_tables/address_table.xml")
+
+# all options of this command line go out together
+tx = fc7_transaction.Transaction(fc7)
 
 for opt, arg in opts:
     # help menu
@@ -47,87 +50,73 @@ for opt, arg in opts:
 
     # reset
     elif opt in ("-r"):
-            fc7.getNode("RESET.T9.CORR").write(1)
-            fc7.dispatch()
-            fc7.getNode("RESET.T9.CORR").write(0)
-            fc7.dispatch()
+            tx.pulse("RESET.T9.CORR")
+            tx.flush()
             time.sleep(2)
             print 'T9x to A6 clock skew correction reset to zero.'
 
     # run mode
     elif opt in ("-e"):
         if arg=='on':
-            fc7.getNode("ENABLE.ITRIG").write(1)
-            fc7.dispatch()
-            print 'Fallback to internal triggering has been enabled.'
+            tx.write("ENABLE.ITRIG", 1)
+            tx.note('Fallback to internal triggering has been enabled.')
         elif arg=='off':
-            fc7.getNode("ENABLE.ITRIG").write(0)
-            fc7.dispatch()
-            print 'Fallback to internal triggering has been disabled.'
+            tx.write("ENABLE.ITRIG", 0)
+            tx.note('Fallback to internal triggering has been disabled.')
 
     elif opt in ("-f"):
         if arg=='on':
-            fc7.getNode("FORCE.ITRIG").write(1)
-            fc7.dispatch()
-            print 'Internal triggering override enabled. (WARNING: Real accelerator signals ignored!)'
+            tx.write("FORCE.ITRIG", 1)
+            tx.note('Internal triggering override enabled. (WARNING: Real accelerator signals ignored!)')
         elif arg=='off':
-            fc7.getNode("FORCE.ITRIG").write(0)
-            fc7.dispatch()
-            print 'Internal triggering override disabled.'
+            tx.write("FORCE.ITRIG", 0)
+            tx.note('Internal triggering override disabled.')
 
     elif opt in ("-i"):
         if arg=='on':
-            fc7.getNode("INTERNAL.BOC").write(1)
-            fc7.dispatch()
-            print 'Begin-of-supercycle signal from internal triggering enabled. (WARNING: Encoder boc ignored!)'
+            tx.write("INTERNAL.BOC", 1)
+            tx.note('Begin-of-supercycle signal from internal triggering enabled. (WARNING: Encoder boc ignored!)')
         elif arg=='off':
-            fc7.getNode("INTERNAL.BOC").write(0)
-            fc7.dispatch()
-            print 'Begin-of-supercycle signal from internal triggering disabled.'
+            tx.write("INTERNAL.BOC", 0)
+            tx.note('Begin-of-supercycle signal from internal triggering disabled.')
 
     elif opt in ("-a"):
         if arg=='on':
-            fc7.getNode("ENABLE.T9.ADJUST").write(1)
-            fc7.dispatch()
-            print 'T9x to A6 running clock skew correction enabled'
+            tx.write("ENABLE.T9.ADJUST", 1)
+            tx.note('T9x to A6 running clock skew correction enabled')
         elif arg=='off':
-            fc7.getNode("ENABLE.T9.ADJUST").write(0)
-            fc7.dispatch()
-            print 'T9x to A6 running clock skew correction disabled.'
+            tx.write("ENABLE.T9.ADJUST", 0)
+            tx.note('T9x to A6 running clock skew correction disabled.')
 
     # THe delay from the T93 or T94 signal to the first A6: Exact in internal triggering, value corrected to with accel signals
     elif opt in ("-d"):
-        fc7.getNode("IDEAL.T9.A6.GAP").write(ctypes.c_uint32(int(arg,0)).value)
-        fc7.dispatch()
-        print 'T9x to A6 ideal delay set.'
+        tx.write("IDEAL.T9.A6.GAP", ctypes.c_uint32(int(arg,0)).value)
+        tx.note('T9x to A6 ideal delay set.')
 
     # Maximum allowed measured T9x to A6 delay to be used in running skew correction
     elif opt in ("-m"):
-        fc7.getNode("MAX.T9.A6.GAP").write(ctypes.c_uint32(int(arg,0)).value)
-        fc7.dispatch()
-        print 'Maximum allowed T9x to A6 delay set.'
+        tx.write("MAX.T9.A6.GAP", ctypes.c_uint32(int(arg,0)).value)
+        tx.note('Maximum allowed T9x to A6 delay set.')
 
     # 8-fill cycle period
     elif opt in ("-p"):
-        fc7.getNode("EIGHT.FILL.PERIOD").write(ctypes.c_uint32(int(arg,0)).value)
-        fc7.dispatch()
-        print 'Internal trigger: period between fills in the 8-fill cycle set.'
+        tx.write("EIGHT.FILL.PERIOD", ctypes.c_uint32(int(arg,0)).value)
+        tx.note('Internal trigger: period between fills in the 8-fill cycle set.')
 
     # time between last A6 of first cycle and T94 of second cycle
     elif opt in ("-g"):
-        fc7.getNode("CYCLE.GAP").write(ctypes.c_uint32(int(arg,0)).value)
-        fc7.dispatch()
-        print 'Internal trigger: time between last A6 of first cycle and T94 of second cycle is set.'
+        tx.write("CYCLE.GAP", ctypes.c_uint32(int(arg,0)).value)
+        tx.note('Internal trigger: time between last A6 of first cycle and T94 of second cycle is set.')
 
     # SUPERCYCLE.PERIOD
     elif opt in ("-s"):
-        fc7.getNode("SUPERCYCLE.PERIOD").write(ctypes.c_uint32(int(arg,0)).value)
-        fc7.dispatch()
-        print 'Internal trigger: supercycle period set.'
+        tx.write("SUPERCYCLE.PERIOD", ctypes.c_uint32(int(arg,0)).value)
+        tx.note('Internal trigger: supercycle period set.')
 
     # A6 missing threshold for internal trigger fallback
     elif opt in ("-t"):
-        fc7.getNode("ITRIG.THRESHOLD").write(ctypes.c_uint32(int(arg,0)).value)
-        fc7.dispatch()
-        print 'Length of time with no A6 triggers to fallback to internal triggering set.'
+        tx.write("ITRIG.THRESHOLD", ctypes.c_uint32(int(arg,0)).value)
+        tx.note('Length of time with no A6 triggers to fallback to internal triggering set.')
 
+# send whatever is still queued
+tx.flush()
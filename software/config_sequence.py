@@ -1,8 +1,10 @@
 # Encoder FC7 sequencer configuration script
 # Usage: python config_sequence.py [crate] [slot] [sequence] [trigger] [options]
 
-import uhal, sys, getopt, ctypes
-uhal.disableLogging()
+import fc7_client, fc7_fanout, sys, getopt, ctypes
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT()
 
 # help menu
 def HELP_MENU():
@@ -26,9 +28,7 @@ except getopt.GetoptError:
     HELP_MENU()
     sys.exit(2)
 
-uri = "ipbusudp-2.0://192.168."+sys.argv[1]+"."+sys.argv[2]+":50001"
-address_table = "file://address_tables/address_table.xml"
-fc7 = uhal.getDevice("hw_id", uri, address_table)
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2], "file://address_tables/address_table.xml")
 
 for opt, arg in opts:
     # help menu
@@ -1,8 +1,10 @@
 # Trigger FC7 pulsing based on
 # Usage: python config_triggers.py [crate] [slot] [channel] [sequence] [pulse] [options]
 
-import uhal, sys, getopt, ctypes
-uhal.disableLogging()
+import fc7_client, fc7_fanout, sys, getopt, ctypes
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT()
 
 # help menu
 def HELP_MENU():
@@ -19,10 +21,8 @@ if len(sys.argv)<4:
     HELP_MENU()
     sys.exit(2)
 
-# common fc7 uhal setup
-uri = "ipbusudp-2.0://192.168."+sys.argv[1]+"."+sys.argv[2]+":50001"
-address_table = "file://address_tables/address_table.xml"
-fc7 = uhal.getDevice("hw_id", uri, address_table)
+# common fc7 setup
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2], "file://address_tables/address_table.xml")
 
 # version 2 of command: set a delay for one channel/sequence
 if len(sys.argv) == 6:
@@ -1,8 +1,10 @@
 # Trigger FC7 pulse train configuration script
 # Usage: python config_triggers.py [crate] [slot] [channel] [sequence] [pulse] [options]
 
-import uhal, sys, getopt, ctypes
-uhal.disableLogging()
+import fc7_client, fc7_fanout, trigger_codec, sys, getopt, ctypes
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT()
 
 # help menu
 def HELP_MENU():
@@ -25,10 +27,9 @@ except getopt.GetoptError:
     HELP_MENU()
     sys.exit(2)
 
-uri = "ipbusudp-2.0://192.168."+sys.argv[1]+"."+sys.argv[2]+":50001"
-address_table = "file://address_tables/address_table.xml"
-fc7 = uhal.getDevice("hw_id", uri, address_table)
-
+# check every option before writing anything
+delay = None
+width = None
 for opt, arg in opts:
     # help menu
     if opt == '-h':
@@ -37,22 +38,36 @@ for opt, arg in opts:
 
     # trigger pulse delay
     elif opt in ("-d"):
-        loop0 =  int(arg,0)        & 0x3F
-        loop1 = (int(arg,0) >>  6) & 0x3F
-        loop2 = (int(arg,0) >> 12) & 0x3F
-        loop3 = (int(arg,0) >> 18) & 0x3F
-        fc7.getNode("DELAY.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP0.PULSE"+sys.argv[5]).write(loop0)
-        fc7.getNode("DELAY.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP1.PULSE"+sys.argv[5]).write(loop1)
-        fc7.getNode("DELAY.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP2.PULSE"+sys.argv[5]).write(loop2)
-        fc7.getNode("DELAY.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP3.PULSE"+sys.argv[5]).write(loop3)
-        fc7.dispatch()
+        try:
+            delay = [int(loop) for loop in trigger_codec.ENCODE_DELAY(int(arg,0))]
+        except ValueError as e:
+            print 'Bad delay value: '+str(e)+'!'
+            sys.exit(2)
 
     # trigger pulse width
     elif opt in ("-w"):
-        loop0 =  int(arg,0)       & 0xF
-        loop1 = (int(arg,0) >> 4) & 0xF
+        try:
+            width = [int(loop) for loop in trigger_codec.ENCODE_WIDTH(int(arg,0))]
+        except ValueError as e:
+            print 'Bad width value: '+str(e)+'!'
+            sys.exit(2)
         enable = 0 if int(arg,0) == 0 else 1
-        fc7.getNode("WIDTH.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP0.PULSE"+sys.argv[5]).write(loop0)
-        fc7.getNode("WIDTH.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP1.PULSE"+sys.argv[5]).write(loop1)
-        fc7.getNode("WIDTH.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".ENABLE.PULSE"+sys.argv[5]).write(enable)
-        fc7.dispatch()
+
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2], "file://address_tables/address_table.xml")
+
+# trigger pulse delay
+if delay is not None:
+    loop0, loop1, loop2, loop3 = delay
+    fc7.getNode("DELAY.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP0.PULSE"+sys.argv[5]).write(loop0)
+    fc7.getNode("DELAY.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP1.PULSE"+sys.argv[5]).write(loop1)
+    fc7.getNode("DELAY.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP2.PULSE"+sys.argv[5]).write(loop2)
+    fc7.getNode("DELAY.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP3.PULSE"+sys.argv[5]).write(loop3)
+    fc7.dispatch()
+
+# trigger pulse width
+if width is not None:
+    loop0, loop1 = width
+    fc7.getNode("WIDTH.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP0.PULSE"+sys.argv[5]).write(loop0)
+    fc7.getNode("WIDTH.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".LOOP1.PULSE"+sys.argv[5]).write(loop1)
+    fc7.getNode("WIDTH.CHAN"+sys.argv[3]+".SEQ"+sys.argv[4]+".ENABLE.PULSE"+sys.argv[5]).write(enable)
+    fc7.dispatch()
@@ -0,0 +1,161 @@
+# FC7 control register table
+#
+# The control registers read_controls.py prints, in order, with the node each
+# is read from and how it is displayed (a format spec; binary and hex values
+# are printed after a "b"). READ fetches any of them from a board in one
+# dispatch: the words they live in are read as blocks of consecutive
+# addresses, and each register is cut out of its word with the mask from the
+# address table:
+#
+#   values = control_registers.READ(fc7)
+#   print(values["SEQ_COUNT"])
+#
+# Registers the address table does not have are read with getNode() in the
+# same dispatch.
+
+from collections import namedtuple, OrderedDict
+import fc7_address_table
+
+Control = namedtuple("Control", "label node display")
+
+CONTROLS = [Control(*control) for control in [
+    ("SYSTEM.HARD.RESET",   "SYSTEM.HARD_RESET",   "d"),
+    ("SYSTEM.SOFT.RESET",   "SYSTEM.SOFT_RESET",   "d"),
+    ("SYSTEM.RUN.ENABLE",   "SYSTEM.RUN_ENABLE",   "d"),
+    ("SYSTEM.RUN.PAUSE",    "SYSTEM.RUN_PAUSE",    "d"),
+    ("SYSTEM.RUN.ABORT",    "SYSTEM.RUN_ABORT",    "d"),
+    ("SYSTEM.FPGA.REPROG",  "SYSTEM.FPGA_REPROG",  "d"),
+    ("SEND.OFW.BOC",        "SEND_OFW_BOC",        "d"),
+    ("TTS.MASK.L08",        "TTS_MASK_L08",        "d"),
+    ("TTS.MASK.L12",        "TTS_MASK_L12",        "d"),
+    ("TTC.TRIG.WIDTH",      "TTC_TRIG_WIDTH",      "d"),
+    ("SEQ.COUNT",           "SEQ_COUNT",           "d"),
+    ("OFW.THRES",           "OFW_THRES",           "d"),
+    ("CYCLE.THRES",         "CYCLE_THRES",         "d"),
+    ("TTS.LOCK.THRES",      "TTS_LOCK_THRES",      "d"),
+    ("TTS.LOCK.MISMATCH",   "TTS_LOCK_MISMATCH",   "d"),
+    ("TTS.RX.TAP.MANUAL",   "TTS_RX.TAP_MANUAL",   "d"),
+    ("TTS.RX.TAP.STROBE",   "TTS_RX.TAP_STROBE",   "d"),
+    ("TTS.RX.TAP.DELAY",    "TTS_RX.TAP_DELAY",    "d"),
+    ("TTS.RX.REALIGN",      "TTS_RX.REALIGN",      "d"),
+    ("TTS.RX.RESET.L12",    "TTS_RX.RESET_L12",    "d"),
+    ("TTS.RX.RESET.L08",    "TTS_RX.RESET_L08",    "d"),
+    ("I2C.CHANNEL",         "I2C.CHANNEL",         "08b"),
+    ("I2C.EEPROM.MAP",      "I2C.EEPROM_MAP",      "d"),
+    ("I2C.EEPROM.ADR",      "I2C.EEPROM_ADR",      "d"),
+    ("I2C.EEPROM.NUM",      "I2C.EEPROM_NUM",      "d"),
+    ("I2C.READ.L12",        "I2C.READ_L12",        "d"),
+    ("I2C.READ.L08",        "I2C.READ_L08",        "d"),
+    ("I2C.RESET.L12",       "I2C.RESET_L12",       "d"),
+    ("I2C.RESET.L08",       "I2C.RESET_L08",       "d"),
+    ("SFP.REQUEST.L12",     "SFP.REQUEST_L12",     "08b"),
+    ("SFP.REQUEST.L08",     "SFP.REQUEST_L08",     "08b"),
+    ("SFP.ENABLE.L12",      "SFP.ENABLE_L12",      "d"),
+    ("SFP.ENABLE.L08",      "SFP.ENABLE_L08",      "d"),
+    ("FMC.ID.REQUEST.L12",  "FMC_ID.REQUEST_L12",  "02x"),
+    ("FMC.ID.REQUEST.L08",  "FMC_ID.REQUEST_L08",  "02x"),
+    ("FMC.ID.WRITE",        "FMC_ID.WRITE",        "d"),
+    ("TTC.DELAY0.L12",      "TTC.DELAY0_L12",      "d"),
+    ("TTC.DELAY1.L12",      "TTC.DELAY1_L12",      "d"),
+    ("TTC.DELAY2.L12",      "TTC.DELAY2_L12",      "d"),
+    ("TTC.DELAY3.L12",      "TTC.DELAY3_L12",      "d"),
+    ("TTC.DELAY4.L12",      "TTC.DELAY4_L12",      "d"),
+    ("TTC.DELAY5.L12",      "TTC.DELAY5_L12",      "d"),
+    ("TTC.DELAY6.L12",      "TTC.DELAY6_L12",      "d"),
+    ("TTC.DELAY7.L12",      "TTC.DELAY7_L12",      "d"),
+    ("TTC.DELAY0.L08",      "TTC.DELAY0_L08",      "d"),
+    ("TTC.DELAY1.L08",      "TTC.DELAY1_L08",      "d"),
+    ("TTC.DELAY2.L08",      "TTC.DELAY2_L08",      "d"),
+    ("TTC.DELAY3.L08",      "TTC.DELAY3_L08",      "d"),
+    ("TTC.DELAY4.L08",      "TTC.DELAY4_L08",      "d"),
+    ("TTC.DELAY5.L08",      "TTC.DELAY5_L08",      "d"),
+    ("TTC.DELAY6.L08",      "TTC.DELAY6_L08",      "d"),
+    ("TTC.DELAY7.L08",      "TTC.DELAY7_L08",      "d"),
+    ("TTC.SBIT.THRES",      "TTC_SBIT_THRES",      "d"),
+    ("TTC.MBIT.THRES",      "TTC_MBIT_THRES",      "d"),
+    ("OTRIG.WIDTH.A",       "OTRIG_WIDTH_A",       "d"),
+    ("OTRIG.WIDTH.B",       "OTRIG_WIDTH_B",       "d"),
+    ("TTC.DECODER.RST",     "TTC_DECODER_RST",     "d"),
+    ("ASYNC.STORAGE.EN",    "ASYNC_STORAGE_EN",    "d"),
+    ("EOR.ASYNC.WAIT",      "EOR_ASYNC_WAIT",      "d"),
+    ("OTRIG.DISABLE.A",     "OTRIG_DISABLE_A",     "032b"),
+    ("OTRIG.DISABLE.B",     "OTRIG_DISABLE_B",     "032b"),
+    ("TRX.LEMO.SEL",        "TRX_LEMO_SEL",        "d"),
+    ("POST.RST.TN.DELAY",   "POST_RST_TN_DELAY",   "d"),
+    ("POST.RST.TS.DELAY",   "POST_RST_TS_DELAY",   "d"),
+    ("OTRIG.DELAY.A",       "OTRIG_DELAY_A",       "d"),
+    ("OTRIG.DELAY.B",       "OTRIG_DELAY_B",       "d"),
+    ("TTC.TRIG.DELAY",      "TTC_TRIG_DELAY",      "d"),
+    ("IDEAL.T9.A6.GAP",     "IDEAL_T9_A6_GAP",     "d"),
+    ("EIGHT.FILL.PERIOD",   "EIGHT_FILL_PERIOD",   "d"),
+    ("CYCLE.GAP",           "CYCLE_GAP",           "d"),
+    ("SUPERCYCLE.PERIOD",   "SUPERCYCLE_PERIOD",   "d"),
+    ("ITRIG.THRESHOLD",     "ITRIG_THRESHOLD",     "d"),
+    ("ENABLE.ITRIG",        "ENABLE_ITRIG",        "d"),
+    ("FORCE.ITRIG",         "FORCE_ITRIG",         "d"),
+    ("ENABLE.T9.ADJUST",    "ENABLE_T9_ADJUST",    "d"),
+    ("RESET.T9.CORR",       "RESET_T9_CORR",       "d"),
+    ("MAX.T9.A6.GAP",       "MAX_T9_A6_GAP",       "d"),
+    ("CYCLE.SIZE.TOGGLE",   "CYCLE_SIZE_TOGGLE",   "d"),
+    ("LASER.PRESCALE",      "LASER_PRESCALE",      "d"),
+    ("LASER.TRIG.ALWAYS",   "LASER_TRIG_ALWAYS",   "d"),
+    ("QUAD_T9_DELAY",       "QUAD_T9_DELAY",       "d"),
+    ("QUAD_T9_WIDTH",       "QUAD_T9_WIDTH",       "d"),
+    ("QUAD_T9_ENABLE",      "QUAD_T9_ENABLE",      "d"),
+    ("QUAD_A6_ENABLE",      "QUAD_A6_ENABLE",      "d"),
+    ("TTC_FEOVFLW_ENABLE",  "TTC.FEOVFLW_ENABLE",  "d"),
+    ("ASYNC_START_DELAY",   "ASYNC_START_DELAY",   "d"),
+    ("NO_BEAM_STRUCTURE",   "NO_BEAM_STRUCTURE",   "d"),
+    ("IGNORE_T9_TRIGS",     "IGNORE_T9_TRIGS",     "d"),
+    ("DEBUG1",              "DEBUG1",              "d"),
+    ("DEBUG2",              "DEBUG2",              "d"),
+    ("DEBUG3",              "DEBUG3",              "d"),
+    ("DEBUG4",              "DEBUG4",              "d"),
+]]
+
+
+# sorted distinct addresses split into runs of consecutive ones, as
+# (first address, count)
+def RUNS(addresses):
+    runs = []
+    for address in sorted(set(addresses)):
+        if runs and runs[-1][0]+runs[-1][1]==address:
+            runs[-1][1] += 1
+        else:
+            runs.append([address, 1])
+    return [(first, count) for first, count in runs]
+
+
+# values of the given control nodes (all of CONTROLS by default), by node
+# name, in one dispatch
+def READ(fc7, nodes=None, table=None):
+    if nodes is None:
+        nodes = [control.node for control in CONTROLS]
+    if table is None:
+        table = fc7_address_table.DEVICE_TABLE(fc7)
+    found = OrderedDict((name, table.node(name)) for name in nodes if name in table)
+
+    client = fc7.getClient()
+    blocks = [(first, client.readBlock(first, count)) for first, count in RUNS(node.address for node in found.values())]
+    singles = [(name, fc7.getNode(name).read()) for name in nodes if name not in found]
+    fc7.dispatch()
+
+    words = {}
+    for first, result in blocks:
+        for n, value in enumerate(result.value()):
+            words[first+n] = int(value)
+    values = OrderedDict()
+    for name in nodes:
+        if name in found:
+            node = found[name]
+            values[name] = (words[node.address] & node.mask) >> fc7_address_table.SHIFT(node.mask)
+    for name, result in singles:
+        values[name] = int(result.value())
+    return OrderedDict((name, values[name]) for name in nodes)
+
+
+# a value as read_controls.py prints it after the label
+def FORMAT(control, value):
+    if control.display=="d":
+        return '   '+str(value)
+    return ' b '+format(value, control.display)
@@ -0,0 +1,187 @@
+# FC7 status dashboard
+# Usage: python dashboard_status.py [crate numbers] [slot numbers] [options]
+#
+# Shows the key status signals of every board in one terminal grid, one row
+# per board, refreshed once or twice a second. Each board is read by its own
+# thread over a connection kept open for the whole session, so a slow or dead
+# board does not hold up the others, and all boards are decoded together
+# (status_fields.py). Cells whose value changed are highlighted for a few
+# seconds; boards that stop answering are shown in red.
+#
+# Keys: q quits, up/down and page up/down scroll.
+
+import fc7_fanout, status_fields, status_poll, sys, getopt, threading, time, curses
+import numpy as np
+
+# help menu
+def HELP_MENU():
+    print('usage: python dashboard_status.py [crate numbers] [slot numbers] [options]')
+    print('')
+    print('options:')
+    print('  -h         : show this help menu and exit')
+    print('  -r RATE    : refreshes per second (default 1)')
+    print('  -H SECONDS : how long changed cells stay highlighted (default 5)')
+
+# check number of arguments
+if len(sys.argv)<3:
+    HELP_MENU()
+    sys.exit(2)
+
+# parse argument options
+try:
+    opts, args = getopt.getopt(sys.argv[3:],"hr:H:")
+except getopt.GetoptError:
+    HELP_MENU()
+    sys.exit(2)
+
+rate = 1.0
+highlight = 5.0
+for opt, arg in opts:
+    if opt in ("-h"):
+        HELP_MENU()
+        sys.exit()
+    elif opt in ("-r"):
+        rate = float(arg)
+    elif opt in ("-H"):
+        highlight = float(arg)
+
+FIELD = status_fields.FIELD
+
+def TEXT(values, name):
+    return status_fields.FORMAT(FIELD[name], values[name])
+
+def RUN_STATE(values):
+    if values["run_aborted"]:
+        return "aborted"
+    return "running" if values["run_in_progress"] else "idle"
+
+# grid columns: header, width and the cell text from the decoded values of a board
+COLUMNS = [
+    ("rev",      8, lambda v: TEXT(v, "major_rev")+'.'+TEXT(v, "minor_rev")+'.'+TEXT(v, "patch_rev")),
+    ("temp",     6, lambda v: '%.1f' % status_fields.VALUE(FIELD["measured_temp"], v["measured_temp"])),
+    ("ttc",      3, lambda v: TEXT(v, "ttc_clk_lock")),
+    ("ext",      3, lambda v: TEXT(v, "ext_clk_lock")),
+    ("rdy",      3, lambda v: TEXT(v, "ttc_ready")),
+    ("l12 tts",  8, lambda v: TEXT(v, "l12_tts_lock")),
+    ("l8 tts",   8, lambda v: TEXT(v, "l8_tts_lock")),
+    ("tts",      4, lambda v: TEXT(v, "local_tts_state")),
+    ("l12 sfp",  8, lambda v: TEXT(v, "sfp_l12_enabled_ports")),
+    ("l8 sfp",   8, lambda v: TEXT(v, "sfp_l8_enabled_ports")),
+    ("run",      7, RUN_STATE),
+    ("trig_num", 9, lambda v: TEXT(v, "trig_num")),
+    ("sbit err", 10, lambda v: TEXT(v, "ttc_sbit_error_cnt")),
+    ("mbit err", 10, lambda v: TEXT(v, "ttc_mbit_error_cnt")),
+    ("aborted",  10, lambda v: TEXT(v, "aborted_cycles")),
+]
+SIGNALS = ["major_rev", "minor_rev", "patch_rev", "measured_temp", "ttc_clk_lock", "ext_clk_lock", "ttc_ready",
+           "l12_tts_lock", "l8_tts_lock", "local_tts_state", "sfp_l12_enabled_ports", "sfp_l8_enabled_ports",
+           "run_in_progress", "run_aborted", "trig_num", "ttc_sbit_error_cnt", "ttc_mbit_error_cnt", "aborted_cycles"]
+BOARD_WIDTH = 14
+
+
+# latest STATUS words of every board, written by the pollers
+class Latest(object):
+    def __init__(self, boards):
+        self.lock = threading.Lock()
+        self.words = np.zeros((len(boards), status_fields.STATUS_WORDS), dtype=np.uint64)
+        self.stamps = np.zeros(len(boards))
+        self.errors = [None]*len(boards)
+
+
+# read one board at the refresh rate until the program ends, over one connection
+def POLL(latest, b, crate, slot, period):
+    for stamp, words, error in status_poll.POLL_BOARD(crate, slot, period):
+        with latest.lock:
+            if error is None:
+                latest.words[b] = words
+                latest.stamps[b] = stamp
+            latest.errors[b] = error
+
+
+def DASHBOARD(screen, boards, latest, period):
+    curses.curs_set(0)
+    curses.use_default_colors()
+    curses.init_pair(1, curses.COLOR_RED, -1)
+    curses.init_pair(2, curses.COLOR_BLACK, curses.COLOR_WHITE)
+    screen.timeout(int(1000*period))
+
+    header = 'board'.ljust(BOARD_WIDTH)+''.join(title.rjust(width+1) for title, width, cell in COLUMNS)
+    shown = {}
+    changed = {}
+    top = 0
+    while True:
+        with latest.lock:
+            words = latest.words.copy()
+            stamps = latest.stamps.copy()
+            errors = list(latest.errors)
+        now = time.time()
+        values = status_fields.DECODE(words, SIGNALS)
+
+        height, width = screen.getmaxyx()
+        rows = max(1, height-2)
+        top = max(0, min(top, len(boards)-rows))
+        screen.erase()
+        title = 'FC7 status, '+str(len(boards))+' board(s), '+time.strftime('%H:%M:%S')+'   q: quit'
+        screen.addnstr(0, 0, title, width-1)
+        screen.addnstr(1, 0, header, width-1, curses.color_pair(2))
+
+        for b, (crate, slot) in enumerate(boards):
+            stale = errors[b] is not None or (stamps[b] and now-stamps[b] > 3*period)
+            if stamps[b]:
+                board = dict((name, values[name][b]) for name in SIGNALS)
+                cells = [cell(board) for title, width, cell in COLUMNS]
+                # note when a cell changes, the first values are not changes
+                for c, text in enumerate(cells):
+                    if (b, c) in shown and shown[(b, c)]!=text:
+                        changed[(b, c)] = now
+                    shown[(b, c)] = text
+            else:
+                cells = ['-']*len(COLUMNS)
+
+            y = 2+b-top
+            if y < 2 or y >= height:
+                continue
+            label = (crate+'/'+slot).ljust(BOARD_WIDTH)
+            if errors[b]:
+                label = (crate+'/'+slot+' no reply').ljust(BOARD_WIDTH)
+            elif not stamps[b]:
+                label = (crate+'/'+slot+' waiting').ljust(BOARD_WIDTH)
+            elif stale:
+                label = (crate+'/'+slot+' stale').ljust(BOARD_WIDTH)
+            screen.addnstr(y, 0, label, width-1, curses.color_pair(1) if stale else 0)
+            x = BOARD_WIDTH
+            for c, (title, cell_width, cell) in enumerate(COLUMNS):
+                if x+cell_width+1 >= width:
+                    break
+                attribute = curses.color_pair(1) if stale else 0
+                if now-changed.get((b, c), 0) < highlight:
+                    attribute |= curses.A_REVERSE
+                screen.addstr(y, x, ' '+cells[c].rjust(cell_width), attribute)
+                x += cell_width+1
+        screen.refresh()
+
+        key = screen.getch()
+        if key in (ord('q'), ord('Q')):
+            return
+        elif key==curses.KEY_UP:
+            top -= 1
+        elif key==curses.KEY_DOWN:
+            top += 1
+        elif key==curses.KEY_PPAGE:
+            top -= rows
+        elif key==curses.KEY_NPAGE:
+            top += rows
+
+
+boards = [(crate, slot) for crate in fc7_fanout.PARSE_ARG(sys.argv[1]) for slot in fc7_fanout.PARSE_ARG(sys.argv[2])]
+latest = Latest(boards)
+period = 1.0/rate
+for b, (crate, slot) in enumerate(boards):
+    poller = threading.Thread(target=POLL, args=(latest, b, crate, slot, period))
+    poller.daemon = True
+    poller.start()
+
+try:
+    curses.wrapper(DASHBOARD, boards, latest, period)
+except KeyboardInterrupt:
+    pass
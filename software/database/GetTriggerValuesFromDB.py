@@ -2,6 +2,9 @@ import argparse
 import psycopg2 
 import sys
 import csv
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import trigger_table
 
 parser = argparse.ArgumentParser(description='Get trigger values from DB and put in a csv')
 parser.add_argument('--type', type=str, required=True, dest='trig_type', action='store',
@@ -59,10 +62,7 @@ for row in rows:
         file = open(fname, "w")
         file.write(title+'\n')
     i = i + 1    
-    if (trig_type == 'a6analog'):
-        xx='%d,%d,%d,%d,%d,%d' % (row[1],row[2],row[3],row[4],row[5],row[6])
-        file.write(xx.strip()+'\n')
-    elif (trig_type == 't9analog'):
+    if (trig_type == 't9analog'):
         xx='%d,%d,%d,%d,%d' % (row[1],row[2],row[3],row[4],row[5])
         file.write(xx.strip()+'\n')
     elif (trig_type == 'ttc'):
@@ -72,6 +72,11 @@ for row in rows:
         xx='%d,%d,%d,%d' % (row[1],row[2],25*row[3],row[4])
         file.write(xx.strip()+'\n')
 
+# analog A6 rows: id, channel, sequence, pulse_index, delay, width, enabled, time
+if (trig_type == 'a6analog'):
+    for setting in trigger_table.FROM_ROWS([row[1:7] for row in rows]).rows():
+        file.write('%d,%d,%d,%d,%d,%d\n' % setting)
+
 file.close()        
 cur.close()
 conn.close()
@@ -1,4 +1,6 @@
-import csv, json, sys,argparse
+import csv, json, sys,argparse, os
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import trigger_table
 
 parser = argparse.ArgumentParser(description='Reads a A6 analog json file and writes out a csv for a given channel')
 parser.add_argument('--json', type=str, default='none', required=True, dest='json_filename', action='store',help='json filename')
@@ -27,24 +29,19 @@ if (trig_type == 'analog_t9'):
     header = "Channel, sequence, delay, enabled"
 print header
 outputFile.write(header+'\n')
-for sequence in range(16):
-    seq = sequence
-    if (trig_type == 'analog_a6'):
-        key_delay = "Sequence%d-Trigger-Delay" % (seq)
-        key_width = "Sequence%d-Trigger-Width" % (seq)
-        delay_data = data[key_delay]
-        width_data = data[key_width]
-        for pulse in range(4):
-            xdata = "%d,%d,%d,%d,%d,%d" % (channel,seq+1,pulse+1,delay_data[pulse], width_data[pulse],1)
-            print xdata
-            outputFile.write(xdata+'\n')
-    if (trig_type == 'analog_t9'):
+if (trig_type == 'analog_a6'):
+    for row in trigger_table.READ_JSON(json_filename, channel).rows():
+        xdata = "%d,%d,%d,%d,%d,%d" % row
+        print xdata
+        outputFile.write(xdata+'\n')
+if (trig_type == 'analog_t9'):
+    for sequence in range(16):
+        seq = sequence
         key_delay = "Sequence%d-T9-trigger-Delay" % (seq)
         delay_data = data[key_delay]
         xdata = "%d,%d,%d,%d" % (channel,seq+1,delay_data, 1)
         print xdata
         outputFile.write(xdata+'\n')
-
             
 outputFile.close()
         
@@ -3,6 +3,9 @@ import psycopg2
 import sys
 import csv
 import datetime
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import trigger_table
 
 parser = argparse.ArgumentParser(description='Reads a trigger file (csv) and puts into DB')
 parser.add_argument('--type', type=str, required=True, dest='trig_type', action='store',
@@ -94,40 +97,35 @@ cur.execute(sql)
 conn.commit()
     
 
-with open(filename, 'rb') as csvfile:
-    reader = csv.reader(csvfile, delimiter=',') # this has a header
-    next(reader)
-    for row in reader:
-        values= ', '.join(row)
-        if (trig_type == 'analog_a6'):
-            channel    = int(row[0])
-            sequence = int(row[1])
-            pulse       = int(row[2])
-            delay       = int(row[3])
-            width       = int(row[4])
-            enabled      = int(row[5])
-                
-            sql = "insert into gm2trigger_analog_a6_2019 (id,channel,sequence,pulse_index,delay,width,enabled,time) values (%d,%d,%d,%d,%d,%d,%d,'%s')" % (id,channel,sequence,pulse,delay,width,enabled,timestamp)
-            cur.execute(sql)
-            conn.commit()
-            
-        elif (trig_type == 'analog_t9'):
-            channel    = int(row[0])
-            sequence = int(row[1])
-            delay       = int(row[2])
-            enabled      = int(row[3])
-            sql = "insert into gm2trigger_analog_t9_2019 (id,channel,sequence,delay,enabled,global_width,time) values (%d,%d,%d,%d,%d,%d,'%s')" % (id,channel,sequence,delay,enabled,global_width,timestamp)
-            cur.execute(sql)
-            conn.commit()
-        elif (trig_type == 'ttc'):
-            print( row )
-            sequence   = int(row[0])
-            pulse_index           = int(row[1])
-            gap            = int(row[2]) # in ticks
-            Ttype         = int(row[3])
-            sql = "insert into gm2trigger_ttc_2019 (id,sequence,pulse_index,gap,type,time) values (%d,%d,%d,%d,%d,'%s')" % (id,sequence,pulse_index,gap,Ttype,timestamp)
-            cur.execute(sql)
-            conn.commit()
+if (trig_type == 'analog_a6'):
+    # all settings in one statement and one commit
+    settings = trigger_table.READ_CSV(filename).rows()
+    sql = "insert into gm2trigger_analog_a6_2019 (id,channel,sequence,pulse_index,delay,width,enabled,time) values (%s,%s,%s,%s,%s,%s,%s,%s)"
+    cur.executemany(sql, [(id,)+setting+(timestamp,) for setting in settings])
+    conn.commit()
+else:
+    with open(filename, 'rb') as csvfile:
+        reader = csv.reader(csvfile, delimiter=',') # this has a header
+        next(reader)
+        for row in reader:
+            values= ', '.join(row)
+            if (trig_type == 'analog_t9'):
+                channel    = int(row[0])
+                sequence = int(row[1])
+                delay       = int(row[2])
+                enabled      = int(row[3])
+                sql = "insert into gm2trigger_analog_t9_2019 (id,channel,sequence,delay,enabled,global_width,time) values (%d,%d,%d,%d,%d,%d,'%s')" % (id,channel,sequence,delay,enabled,global_width,timestamp)
+                cur.execute(sql)
+                conn.commit()
+            elif (trig_type == 'ttc'):
+                print( row )
+                sequence   = int(row[0])
+                pulse_index           = int(row[1])
+                gap            = int(row[2]) # in ticks
+                Ttype         = int(row[3])
+                sql = "insert into gm2trigger_ttc_2019 (id,sequence,pulse_index,gap,type,time) values (%d,%d,%d,%d,%d,'%s')" % (id,sequence,pulse_index,gap,Ttype,timestamp)
+                cur.execute(sql)
+                conn.commit()
 
 print( "Values from file = %s have been inserted into table = %s in the DB: they have been assiged the unique id value = %d" % (filename,table,id) )
 
@@ -1,8 +1,12 @@
 # Trigger FC7 pulse train read script
 # Usage: python read_triggers.py [crate] [slot] [csv file]
 
-import uhal, sys, csv
-uhal.disableLogging()
+import sys, os, csv
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import fc7_client, fc7_fanout, ttc_sequencer
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT(outputs=[3])
 
 # help menu
 def HELP_MENU():
@@ -14,35 +18,18 @@ if len(sys.argv)<4:
     sys.exit(2)
 
 # parse argument options
-uri = "ipbusudp-2.0://192.168."+sys.argv[1]+"."+sys.argv[2]+":50001"
-address_table = "file://address_tables/address_table.xml"
-fc7 = uhal.getDevice("hw_id", uri, address_table)
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2], "file://address_tables/address_table.xml")
 
 # .csv file format:
 # [trigger], [gap], [type]
 
+# read registers, one block read per sequence
+table = ttc_sequencer.READ_BOARD(fc7)
+
 with open(sys.argv[3], 'wb') as outfile:
-    # read in settings
     writer = csv.writer(outfile)
-    t = []
-    #settings = map(tuple, reader)
-
-    global_count = fc7.getNode("SEQ.COUNT").read()
-    fc7.dispatch()
-
-    # read registers
-    for sequence in range(0, int(global_count.value()) + 1):
-        seq_count = fc7.getNode("SEQ"+str(sequence)+".COUNT").read()
-        fc7.dispatch()
-
-        for trigger in range(0, int(seq_count.value()) + 1):
-            tr_gap = fc7.getNode("SEQ"+str(sequence)+".PRE.TRIG.GAP"+str(trigger)).read() 
-            tr_type = fc7.getNode("SEQ"+str(sequence)+".TRIG.TYPE"+str(trigger)).read() 
-            fc7.dispatch()
-            t.append((sequence + 1, int(tr_gap.value()), int(tr_type.value())))
-
     writer.writerow(["Trigger", "Gap", "Type"])
-    writer.writerows(t)
+    writer.writerows([(sequence + 1, gap, kind) for sequence, trigger, gap, kind in table.rows()])
 
 print 'TTC settings read successfully!'
 
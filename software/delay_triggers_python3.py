@@ -1,4 +1,5 @@
-import sys, csv
+import trigger_table, sys
+import numpy as np
 
 # help menu
 def HELP_MENU():
@@ -35,47 +36,21 @@ csv_f = sys.argv[4]
 # .csv file format:
 # [channel], [sequence], [pulse], [delay], [width], [enable]
 
-trigger_out = []
-
-with open(csv_f, 'r') as infile:
-    # read in settings
-    reader = csv.reader(infile)
-    
-    next(reader)
-    for setting in reader:
-
-        if ( setting[0] in channels and 
-             setting[1] in seqs and 
-             int(setting[2]) == 1 and # delay muon fills 
-             int(setting[3]) != 0 # only non-zero delays
-            ):
-
-            setting[3] = str(int(setting[3]) + delay)
-            #print(setting)
-
-
-        #analog fanout counts from $a6 event
-        #ttc fanout counts from the previous trigger
-        #for laser also delay out-of-fill laser triggers here,
-        #not to change the ttc configuration
-        #if ( setting[0] in channels and int(setting[0]) == 15 and
-        #     setting[1] in seqs and
-        #     int(setting[2]) == 2 and # delay laser fills 
-        #     int(setting[3]) != 0  # only non-zero delays
-        #    ):
-
-        #   setting[3] = str(int(setting[3]) + delay)
-        #    #print(setting)
-
-
-        trigger_out.append(setting)
-
-
-with open(csv_f, 'w') as outfile:
-    writer = csv.writer(outfile)
-
-    writer.writerow(["Channel", "Sequence", "Pulse", "Delay", "Width", "Enable"])
-    writer.writerows(trigger_out)
+table = trigger_table.READ_CSV(csv_f)
 
+# delay muon fills (pulse 1), only non-zero delays
+selected = np.zeros(table.shape, dtype=bool)
+selected[np.ix_([int(c)-1 for c in channels if 1 <= int(c) <= table.shape[0]],
+                [int(s)-1 for s in seqs if 1 <= int(s) <= table.shape[1]], [0])] = True
+table.delay[selected & table.present & (table.delay != 0)] += delay
 
+#analog fanout counts from $a6 event
+#ttc fanout counts from the previous trigger
+#for laser also delay out-of-fill laser triggers here,
+#not to change the ttc configuration
+#laser = np.zeros(table.shape, dtype=bool)
+#if '15' in channels:
+#    laser[14, [int(s)-1 for s in seqs], 1] = True # delay laser fills
+#table.delay[laser & table.present & (table.delay != 0)] += delay
 
+trigger_table.WRITE_CSV(table, csv_f)
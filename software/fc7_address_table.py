@@ -0,0 +1,219 @@
+# FC7 address table reader and index compiler
+# Usage: python fc7_address_table.py [address tables]
+#
+# Flattens a uhal address table (following module="file://..." includes) into
+# a dictionary of node path -> Node, with absolute addresses. Paths are the
+# ones uhal uses with getNode(), e.g. "SYSTEM.RUN_ENABLE" or
+# "DELAY.CHAN0.SEQ0.LOOP0_PULSE0".
+#
+# LOAD() keeps the flattened table as a compiled index under $FC7_CACHE_DIR
+# (default ~/.cache/fc7), so the XML is only parsed again when one of the files
+# it was built from changes (checked by mtime and size, then content hash).
+# Running this file compiles the given tables, or the in-repo one, up front.
+
+import os, sys, collections, hashlib, marshal
+import xml.etree.ElementTree as ElementTree
+
+# in-repo address table, served by the emulator
+REPO_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "address_tables", "address_table.xml")
+
+# address, mask, mode (single, incremental, non-incremental), size, permission, leaf
+Node = collections.namedtuple("Node", "address mask mode size permission leaf")
+
+
+# file path of an address table given as a uhal "file://" URI or a plain path
+def TABLE_FILE(address_table):
+    if address_table.startswith("file://"):
+        address_table = address_table[len("file://"):]
+    return os.path.abspath(os.path.expandvars(address_table))
+
+
+def _int(text, default):
+    if text is None:
+        return default
+    return int(text, 0)
+
+
+# position of the lowest set bit of a mask: the shift of the field it selects
+def SHIFT(mask):
+    mask = int(mask)
+    return (mask & -mask).bit_length()-1 if mask else 0
+
+
+def _walk(element, directory, prefix, base, nodes, files):
+    module = element.get("module")
+    if module is not None:
+        path = os.path.join(directory, module[len("file://"):] if module.startswith("file://") else module)
+        files.append(path)
+        included = ElementTree.parse(path).getroot()
+        children = list(included)
+        directory = os.path.dirname(path)
+    else:
+        children = list(element)
+
+    address = base + _int(element.get("address"), 0)
+    if prefix:
+        mode = element.get("mode", "single")
+        if mode=="block":
+            mode = "incremental"
+        size = _int(element.get("size"), 1)
+        nodes[prefix] = Node(address, _int(element.get("mask"), 0xFFFFFFFF), mode, size,
+                             element.get("permission", "rw"), len(children)==0)
+
+    for child in children:
+        if child.tag!="node":
+            continue
+        path = child.get("id") if not prefix else prefix+"."+child.get("id")
+        _walk(child, directory, path, address, nodes, files)
+
+
+# parse an address table, returning (nodes, list of files read)
+def PARSE(address_table):
+    path = TABLE_FILE(address_table)
+    nodes = collections.OrderedDict()
+    files = [path]
+    _walk(ElementTree.parse(path).getroot(), os.path.dirname(path), "", 0, nodes, files)
+    return nodes, files
+
+
+# every word address covered by the leaf nodes of a table
+def ADDRESSES(nodes):
+    addresses = set()
+    for node in nodes.values():
+        if not node.leaf:
+            continue
+        if node.mode=="incremental":
+            addresses.update(range(node.address, node.address+node.size))
+        else:
+            addresses.add(node.address)
+    return addresses
+
+
+# compiled index location and format
+CACHE_DIR = os.path.expanduser(os.environ.get("FC7_CACHE_DIR", "~/.cache/fc7"))
+INDEX_VERSION = 1
+
+
+# lookup key that ignores case and "." versus "_", so that FC7_CCC.xml style
+# names (SEQ.COUNT) can resolve in address_table.xml (SEQ_COUNT) and vice
+# versa when a loose match is asked for
+def NORMALIZE(path):
+    return path.upper().replace(".", "_")
+
+
+# flattened table with name resolution; nodes are kept as plain tuples and
+# only turned into Node when looked up
+class AddressTable(object):
+    def __init__(self, nodes):
+        self._nodes = nodes
+        self._normalized = None
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, path):
+        return self.resolve(path) is not None
+
+    def paths(self):
+        return list(self._nodes.keys())
+
+    def values(self):
+        return [Node(*node) for node in self._nodes.values()]
+
+    # table path of a node name, or None when there is no such node. Names
+    # match exactly; with loose set, case and "." versus "_" are ignored too,
+    # which may land on a register the caller did not mean, so only callers
+    # that know both tables describe the same board should ask for it
+    def resolve(self, path, loose=False):
+        if path in self._nodes:
+            return path
+        if not loose:
+            return None
+        if self._normalized is None:
+            self._normalized = {}
+            for name in self._nodes:
+                key = NORMALIZE(name)
+                # names that normalize alike are ambiguous and not resolved
+                self._normalized[key] = None if key in self._normalized else name
+        return self._normalized.get(NORMALIZE(path))
+
+    def node(self, path, loose=False):
+        name = self.resolve(path, loose)
+        if name is None:
+            raise KeyError("no node "+path+" in the address table")
+        return Node(*self._nodes[name])
+
+
+def _digest(path):
+    with open(path, "rb") as table:
+        return hashlib.sha1(table.read()).hexdigest()
+
+
+def _index_file(path):
+    key = hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, key+"-py%d%d.idx" % sys.version_info[:2])
+
+
+def _write_index(index_file, files, nodes):
+    try:
+        if not os.path.isdir(CACHE_DIR):
+            os.makedirs(CACHE_DIR)
+        temporary = index_file+".%d" % os.getpid()
+        with open(temporary, "wb") as index:
+            index.write(marshal.dumps((INDEX_VERSION, files, nodes)))
+        os.rename(temporary, index_file)
+    except (IOError, OSError):
+        pass
+
+
+# parse a table and store its compiled index
+def COMPILE(address_table):
+    path = TABLE_FILE(address_table)
+    nodes, files = PARSE(path)
+    nodes = dict((name, tuple(node)) for name, node in nodes.items())
+    files = [(f, os.path.getmtime(f), os.path.getsize(f), _digest(f)) for f in sorted(set(files))]
+    _write_index(_index_file(path), files, nodes)
+    return AddressTable(nodes)
+
+
+# flattened table from its compiled index, recompiling when it is stale
+def LOAD(address_table):
+    path = TABLE_FILE(address_table)
+    index_file = _index_file(path)
+    try:
+        with open(index_file, "rb") as index:
+            version, files, nodes = marshal.loads(index.read())
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+        return COMPILE(path)
+    if version!=INDEX_VERSION:
+        return COMPILE(path)
+
+    touched = False
+    for n, (f, mtime, size, digest) in enumerate(files):
+        try:
+            if os.path.getmtime(f)==mtime and os.path.getsize(f)==size:
+                continue
+            if _digest(f)!=digest:
+                return COMPILE(path)
+        except (IOError, OSError):
+            return COMPILE(path)
+        # touched but unchanged: keep the index, note the new mtime
+        files[n] = (f, os.path.getmtime(f), os.path.getsize(f), digest)
+        touched = True
+    if touched:
+        _write_index(index_file, files, nodes)
+    return AddressTable(nodes)
+
+
+# table of a device: the one it was opened with (fc7_client.getDevice sets it
+# on every kind of device); any other table could give wrong addresses
+def DEVICE_TABLE(fc7):
+    table = getattr(fc7, "table", None)
+    if table is None:
+        raise ValueError("the address table of the device is not known, open it with fc7_client.getDevice")
+    return table
+
+
+if __name__ == '__main__':
+    for table in sys.argv[1:] or [REPO_TABLE]:
+        print(TABLE_FILE(table)+': '+str(len(COMPILE(table)))+' nodes -> '+_index_file(TABLE_FILE(table)))
@@ -0,0 +1,315 @@
+# FC7 asyncio IPbus client
+# Usage: python fc7_async.py [crate numbers] [slot numbers] [node]
+#
+# Talks IPbus 2.0 over UDP directly, without uhal, so that several packets can
+# be outstanding at once: dispatch() in uhal waits a full round trip before the
+# next packet is built, which is what makes loops like read_triggers.py slow.
+#
+#   board = fc7_async.getBoard(1, 5, "file://address_tables/address_table.xml")
+#   await board.connect()
+#   count, gaps = await asyncio.gather(board.read("SEQ_COUNT"),
+#                                      board.readBlock("SEQ0.PRE_TRIG.GAP0", 16))
+#   board.close()
+#
+# Operations issued in the same event loop iteration are packed into as few
+# packets as the MTU allows, and up to the board's number of response buffers
+# (or the window given) packets are in flight. Lost packets are recovered with
+# resend requests, as uhal does. Python 3 only.
+
+import sys, asyncio, struct
+import fc7_client, fc7_address_table, fc7_fanout
+
+# packet types
+CONTROL = 0x0
+STATUS  = 0x1
+RESEND  = 0x2
+
+# transaction types
+READ          = 0x0
+WRITE         = 0x1
+READ_NONINC   = 0x2
+WRITE_NONINC  = 0x3
+RMW_BITS      = 0x4
+RMW_SUM       = 0x5
+
+MASK32 = 0xFFFFFFFF
+
+# most words a single transaction can carry
+MAX_WORDS = 255
+
+
+def PACKET_HEADER(packet_id, packet_type):
+    return 0x200000F0 | (packet_id << 8) | packet_type
+
+def TRANSACTION_HEADER(transaction_id, words, type_id):
+    return 0x2000000F | (transaction_id << 16) | (words << 8) | (type_id << 4)
+
+
+# failed transaction or unreachable board
+class IPbusError(Exception):
+    pass
+
+
+# one IPbus transaction waiting for its place in a packet
+class _Transaction(object):
+    def __init__(self, type_id, address, words, body, reply_words, future):
+        self.type_id = type_id
+        self.address = address
+        self.words = words
+        self.body = body
+        self.reply_words = reply_words
+        self.future = future
+
+    def request_size(self):
+        return 2+len(self.body)
+
+    def reply_size(self):
+        return 1+self.reply_words
+
+
+class _Protocol(asyncio.DatagramProtocol):
+    def __init__(self, board):
+        self.board = board
+
+    def datagram_received(self, data, addr):
+        self.board._received(data)
+
+    def error_received(self, exc):
+        pass
+
+
+# a board reached over IPbus 2.0 UDP
+class AsyncBoard(object):
+    def __init__(self, host, port, address_table=fc7_address_table.REPO_TABLE, window=None,
+                 timeout=1.0, retries=5):
+        self.host = host
+        self.port = int(port)
+        self.nodes = fc7_address_table.PARSE(address_table)[0]
+        self.window = window
+        self.timeout = timeout
+        self.retries = retries
+        self.mtu = 1500
+        self.packets = 0
+        self.resends = 0
+        self._transport = None
+        self._queue = []
+        self._flush_scheduled = False
+        self._in_flight = {}
+        self._status = None
+        self._next_id = 1
+        self._slots = None
+
+    async def connect(self):
+        loop = asyncio.get_event_loop()
+        self._transport, protocol = await loop.create_datagram_endpoint(lambda: _Protocol(self),
+                                                                        remote_addr=(self.host, self.port))
+
+        # the status packet tells the MTU, buffers and next expected packet ID
+        for attempt in range(self.retries):
+            self._status = loop.create_future()
+            self._transport.sendto(struct.pack('>16I', PACKET_HEADER(0, STATUS), *([0]*15)))
+            try:
+                words = await asyncio.wait_for(self._status, self.timeout)
+                break
+            except asyncio.TimeoutError:
+                continue
+        else:
+            self.close()
+            raise IPbusError('no status reply from '+self.host+':'+str(self.port))
+
+        self.mtu = words[1]
+        buffers = words[2]
+        self._next_id = (words[3] >> 8) & 0xFFFF or 1
+        window = buffers if self.window is None else min(self.window, buffers)
+        self._slots = asyncio.Semaphore(max(1, window))
+        return self
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    # node lookup
+    def node(self, path):
+        try:
+            return self.nodes[path]
+        except KeyError:
+            raise IPbusError('unknown node '+path)
+
+    # node accesses, masks applied as uhal does
+    async def read(self, path):
+        node = self.node(path)
+        value = (await self.readAddress(node.address, 1, node.mode=="non-incremental"))[0]
+        if node.mask==MASK32:
+            return value
+        return (value & node.mask) >> fc7_address_table.SHIFT(node.mask)
+
+    async def write(self, path, value):
+        node = self.node(path)
+        if node.mask==MASK32:
+            await self.writeAddress(node.address, [value], node.mode=="non-incremental")
+        else:
+            await self.rmwBits(node.address, ~node.mask & MASK32, (int(value) << fc7_address_table.SHIFT(node.mask)) & node.mask)
+
+    async def readBlock(self, path, size):
+        node = self.node(path)
+        return await self.readAddress(node.address, size, node.mode=="non-incremental")
+
+    async def writeBlock(self, path, values):
+        node = self.node(path)
+        await self.writeAddress(node.address, values, node.mode=="non-incremental")
+
+    # raw accesses, split into transactions of at most MAX_WORDS words
+    async def readAddress(self, address, size, noninc=False):
+        type_id = READ_NONINC if noninc else READ
+        parts = []
+        for start in range(0, int(size), MAX_WORDS):
+            words = min(MAX_WORDS, int(size)-start)
+            base = address if noninc else address+start
+            parts.append(self._submit(type_id, base, words, [base], words))
+        values = []
+        for part in await asyncio.gather(*parts):
+            values.extend(part)
+        return values
+
+    async def writeAddress(self, address, values, noninc=False):
+        type_id = WRITE_NONINC if noninc else WRITE
+        values = [int(v) & MASK32 for v in values]
+        parts = []
+        for start in range(0, len(values), MAX_WORDS):
+            chunk = values[start:start+MAX_WORDS]
+            base = address if noninc else address+start
+            parts.append(self._submit(type_id, base, len(chunk), [base]+chunk, 0))
+        await asyncio.gather(*parts)
+
+    async def rmwBits(self, address, and_term, or_term):
+        return (await self._submit(RMW_BITS, address, 1, [address, and_term & MASK32, or_term & MASK32], 1))[0]
+
+    async def rmwSum(self, address, addend):
+        return (await self._submit(RMW_SUM, address, 1, [address, int(addend) & MASK32], 1))[0]
+
+    # queue a transaction; everything queued in this loop iteration is sent together
+    def _submit(self, type_id, address, words, body, reply_words):
+        if self._transport is None:
+            raise IPbusError('board '+self.host+':'+str(self.port)+' is not connected')
+        future = asyncio.get_event_loop().create_future()
+        self._queue.append(_Transaction(type_id, address, words, body, reply_words, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_event_loop().call_soon(self._flush)
+        return future
+
+    # pack queued transactions into packets that fit the MTU, request and reply
+    def _flush(self):
+        self._flush_scheduled = False
+        limit = self.mtu//4 - 1
+        packet, request, reply = [], 1, 1
+        for transaction in self._queue:
+            if packet and (request+transaction.request_size()>limit or reply+transaction.reply_size()>limit):
+                asyncio.ensure_future(self._send(packet))
+                packet, request, reply = [], 1, 1
+            packet.append(transaction)
+            request += transaction.request_size()
+            reply += transaction.reply_size()
+        if packet:
+            asyncio.ensure_future(self._send(packet))
+        self._queue = []
+
+    async def _send(self, transactions):
+        await self._slots.acquire()
+        try:
+            packet_id = self._next_id
+            self._next_id = self._next_id+1 if self._next_id<0xFFFF else 1
+            words = [PACKET_HEADER(packet_id, CONTROL)]
+            for n, transaction in enumerate(transactions):
+                words.append(TRANSACTION_HEADER(n, transaction.words, transaction.type_id))
+                words.extend(transaction.body)
+            payload = struct.pack('>%dI' % len(words), *words)
+
+            reply = asyncio.get_event_loop().create_future()
+            self._in_flight[packet_id] = reply
+            self._transport.sendto(payload)
+            self.packets += 1
+            for attempt in range(self.retries+1):
+                try:
+                    data = await asyncio.wait_for(asyncio.shield(reply), self.timeout)
+                    break
+                except asyncio.TimeoutError:
+                    # ask for the reply again; every other attempt also repeats
+                    # the request in case that is what got lost
+                    self.resends += 1
+                    self._transport.sendto(struct.pack('>I', PACKET_HEADER(packet_id, RESEND)))
+                    if attempt % 2:
+                        self._transport.sendto(payload)
+            else:
+                self._in_flight.pop(packet_id, None)
+                error = IPbusError('no reply to packet '+str(packet_id)+' from '+self.host+':'+str(self.port))
+                for transaction in transactions:
+                    if not transaction.future.done():
+                        transaction.future.set_exception(error)
+                return
+        finally:
+            self._slots.release()
+
+        self._decode(data, transactions)
+
+    def _received(self, data):
+        if len(data) < 4:
+            return
+        header = struct.unpack('>I', data[:4])[0]
+        packet_type = header & 0xF
+        if packet_type==STATUS and self._status is not None and not self._status.done():
+            self._status.set_result(struct.unpack('>%dI' % (len(data)//4), data))
+        elif packet_type==CONTROL:
+            reply = self._in_flight.pop((header >> 8) & 0xFFFF, None)
+            if reply is not None and not reply.done():
+                reply.set_result(data)
+
+    # hand each transaction its reply words or an error
+    def _decode(self, data, transactions):
+        words = struct.unpack('>%dI' % (len(data)//4), data)
+        i = 1
+        for transaction in transactions:
+            if i >= len(words):
+                transaction.future.set_exception(IPbusError('missing reply for transaction at 0x%08x' % transaction.address))
+                continue
+            header = words[i]
+            info = header & 0xF
+            size = (header >> 8) & 0xFF
+            data_words = size if transaction.type_id in (READ, READ_NONINC) else transaction.reply_words
+            if info!=0:
+                transaction.future.set_exception(IPbusError('bus error (info code %d) at 0x%08x' % (info, transaction.address)))
+                i += 1 + (size if transaction.type_id in (READ, READ_NONINC) else 0)
+                continue
+            transaction.future.set_result(list(words[i+1:i+1+data_words]))
+            i += 1 + data_words
+
+
+# board in a given crate and slot, at the address fc7_client would use
+def getBoard(crate, slot, address_table=fc7_address_table.REPO_TABLE, window=None):
+    host, port = fc7_client.DEVICE_URI(crate, slot).split("://")[1].split(":")
+    return AsyncBoard(host, port, address_table, window)
+
+
+# read one node from every board at once
+async def SWEEP(crates, slots, path):
+    async def one(crate, slot):
+        board = getBoard(crate, slot)
+        try:
+            await board.connect()
+            return crate, slot, await board.read(path)
+        except IPbusError as e:
+            return crate, slot, e
+        finally:
+            board.close()
+    return await asyncio.gather(*[one(crate, slot) for crate in crates for slot in slots])
+
+
+if __name__ == '__main__':
+    # check number of arguments
+    if len(sys.argv)!=4:
+        print('usage: python fc7_async.py [crate numbers] [slot numbers] [node]')
+        sys.exit(2)
+
+    for crate, slot, value in asyncio.run(SWEEP(fc7_fanout.PARSE_ARG(sys.argv[1]), fc7_fanout.PARSE_ARG(sys.argv[2]), sys.argv[3])):
+        print('crate '+crate+' slot '+slot+': '+str(value))
@@ -0,0 +1,203 @@
+# FC7 script benchmark
+# Usage: python fc7_benchmark.py [options]
+#
+# Runs the everyday scripts against an in-process emulated board
+# (fc7_emulator.py) and records, per command, the wall time, the number of
+# dispatch() round trips (counted by fc7_client through FC7_STATS) and the
+# IPbus packets and bytes exchanged with the board. Results are written as CSV;
+# given a baseline CSV, commands that fail where they used to succeed, or whose
+# round trips or packets went up, are reported and the exit status is 1.
+#
+# The scripts open the board through uhal, so uhal must be set up as for real
+# hardware. They are given the in-repo address table the emulator serves
+# (FC7_ADDRESS_TABLE), with loose name matching (FC7_LOOSE_NAMES) for the
+# scripts written for FC7_CCC.xml names.
+
+import sys, os, getopt, csv, json, subprocess, tempfile, time
+import fc7_emulator, fc7_address_table, trigger_addresses
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+CRATE = '1'
+SLOT = '5'
+
+# name, interpreter, script and arguments; {crate}, {slot} and {tmp} are filled
+# in, and the interpreter is looked up in INTERPRETERS (-2 and -3)
+CASES = [
+    ('read_status',        'python3', ['read_status.py', '{crate}', '{slot}']),
+    ('read_controls',      'python3', ['read_controls.py', '{crate}', '{slot}']),
+    ('read_triggers_csv',  'python3', ['read_triggers_csv_python3.py', '{crate}', '{slot}', '{tmp}/triggers_out.csv']),
+    ('read_triggers_dump', 'python3', ['read_triggers_csv_python3.py', '{crate}', '{slot}', '{tmp}/triggers_all.csv', '-a']),
+    ('store_triggers',     'python3', ['store_triggers_python3.py', '{crate}', '{slot}', '{tmp}/triggers_in.csv']),
+    ('read_ttc_csv',       'python2', ['database/read_ttc_csv.py', '{crate}', '{slot}', '{tmp}/ttc_out.csv']),
+    ('config_general',     'python3', ['config_general.py', '{crate}', '{slot}', '-c', '3', '-w', '10', '-s', '5',
+                                       '-t', '100', '-u', '2', '-x', '10', '-y', '10', '-i', '10', '-j', '20']),
+]
+
+INTERPRETERS = {'python2': 'python2', 'python3': 'python3'}
+
+FIELDS = ['command', 'status', 'wall_s', 'dispatches', 'nodes', 'packets', 'bytes_sent', 'bytes_received', 'transactions']
+
+# columns compared against a baseline; more of any of them is a regression
+REGRESSION_FIELDS = ['dispatches', 'packets']
+
+# help menu
+def HELP_MENU():
+    print('usage: python fc7_benchmark.py [options]')
+    print('')
+    print('options:')
+    print('  -h          : show this help menu and exit')
+    print('  -o FILE     : write the results to a csv file (default: print them)')
+    print('  -b FILE     : compare against a baseline csv file')
+    print('  -c COMMANDS : comma-separated commands to run (default: all)')
+    print('  -n COUNT    : repetitions per command, the fastest is kept (default 1)')
+    print('  -l LATENCY  : emulated reply latency per packet, in ms (default 0)')
+    print('  -p PORT     : emulator base UDP port (default 60000)')
+    print('  -2 PYTHON   : python 2 interpreter for the python 2 scripts (default python2)')
+    print('  -3 PYTHON   : python 3 interpreter for the python 3 scripts (default python3)')
+
+
+# full set of trigger settings for store_triggers: every channel of the
+# emulated table, sequence and pulse
+def WRITE_TRIGGER_CSV(path, channels):
+    with open(path, 'w') as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(['Channel', 'Sequence', 'Pulse', 'Delay', 'Width', 'Enable'])
+        for channel in range(1, channels+1):
+            for sequence in range(1, 17):
+                for pulse in range(1, 5):
+                    writer.writerow([channel, sequence, pulse, 1000*pulse+channel, 8, 1])
+
+
+# run one command against the emulator, returning a result row; the error
+# output of a failing command is printed to stderr and kept in tmp
+def RUN(emulator, name, interpreter, argv, tmp, port):
+    stats_file = os.path.join(tmp, name+'.stats')
+    if os.path.exists(stats_file):
+        os.remove(stats_file)
+    error_file = os.path.join(tmp, name+'.err')
+    env = dict(os.environ)
+    env['FC7_EMULATOR_PORT'] = str(port)
+    env['FC7_DAEMON'] = '0'
+    env['FC7_STATS'] = stats_file
+    env['FC7_ADDRESS_TABLE'] = 'file://'+fc7_address_table.REPO_TABLE
+    env['FC7_LOOSE_NAMES'] = '1'
+    # table indexes go with the run, not into the user's cache
+    env['FC7_CACHE_DIR'] = os.path.join(tmp, 'cache')
+
+    args = [a.format(crate=CRATE, slot=SLOT, tmp=tmp) for a in argv]
+    emulator.reset_stats()
+    start = time.time()
+    with open(os.devnull, 'w') as devnull, open(error_file, 'w') as errors:
+        try:
+            code = subprocess.call([INTERPRETERS[interpreter]]+args, cwd=HERE, env=env, stdout=devnull, stderr=errors)
+        except OSError as e:
+            errors.write(INTERPRETERS[interpreter]+': '+str(e)+'\n')
+            code = 127
+    wall = time.time() - start
+    if code!=0:
+        with open(error_file) as errors:
+            sys.stderr.write(name+' failed (exit '+str(code)+'):\n'+errors.read())
+
+    row = {'command': name, 'status': 'ok' if code==0 else 'exit '+str(code), 'wall_s': '%.4f' % wall,
+           'dispatches': 0, 'nodes': 0}
+    if os.path.exists(stats_file):
+        with open(stats_file) as infile:
+            for line in infile:
+                counts = json.loads(line)
+                row['dispatches'] += counts['dispatches']
+                row['nodes'] += counts['nodes']
+    stats = emulator.stats()
+    row['packets'] = stats['packets_in']
+    row['bytes_sent'] = stats['bytes_in']
+    row['bytes_received'] = stats['bytes_out']
+    row['transactions'] = stats['transactions']
+    return row
+
+
+# commands that started failing, or whose counts went up, compared with a
+# baseline
+def COMPARE(rows, baseline_file):
+    with open(baseline_file) as infile:
+        baseline = dict((row['command'], row) for row in csv.DictReader(infile))
+    regressions = []
+    for row in rows:
+        old = baseline.get(row['command'])
+        if old is None or old['status']!='ok':
+            continue
+        if row['status']!='ok':
+            regressions.append((row['command'], 'status', old['status'], row['status']))
+            continue
+        for field in REGRESSION_FIELDS:
+            if int(row[field]) > int(old[field]):
+                regressions.append((row['command'], field, int(old[field]), int(row[field])))
+    return regressions
+
+
+if __name__ == '__main__':
+    # parse argument options
+    try:
+        opts, args = getopt.getopt(sys.argv[1:],"ho:b:c:n:l:p:2:3:")
+    except getopt.GetoptError:
+        HELP_MENU()
+        sys.exit(2)
+
+    output = None
+    baseline = None
+    commands = None
+    repeat = 1
+    latency = 0.0
+    port = 60000
+    for opt, arg in opts:
+        if opt in ("-h"):
+            HELP_MENU()
+            sys.exit()
+        elif opt in ("-o"):
+            output = arg
+        elif opt in ("-b"):
+            baseline = arg
+        elif opt in ("-c"):
+            commands = arg.split(',')
+        elif opt in ("-n"):
+            repeat = max(1, int(arg))
+        elif opt in ("-l"):
+            latency = float(arg)/1000.
+        elif opt in ("-p"):
+            port = int(arg)
+        elif opt in ("-2"):
+            INTERPRETERS['python2'] = arg
+        elif opt in ("-3"):
+            INTERPRETERS['python3'] = arg
+
+    cases = [case for case in CASES if commands is None or case[0] in commands]
+
+    # scripts that name nodes missing from the in-repo table still get answers
+    emulator = fc7_emulator.Emulator([CRATE], [SLOT], port, latency=latency, permissive=True)
+    emulator.start()
+    tmp = tempfile.mkdtemp(prefix='fc7_benchmark_')
+    channels = trigger_addresses.TABLE_CHANNELS(fc7_address_table.LOAD(fc7_address_table.REPO_TABLE))
+    WRITE_TRIGGER_CSV(os.path.join(tmp, 'triggers_in.csv'), channels)
+    rows = []
+    try:
+        for name, interpreter, argv in cases:
+            runs = [RUN(emulator, name, interpreter, argv, tmp, port) for n in range(repeat)]
+            rows.append(min(runs, key=lambda row: float(row['wall_s'])))
+    finally:
+        emulator.stop()
+
+    if output is None:
+        writer = csv.DictWriter(sys.stdout, FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        with open(output, 'w') as outfile:
+            writer = csv.DictWriter(outfile, FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    if baseline is not None:
+        regressions = COMPARE(rows, baseline)
+        for command, field, old, new in regressions:
+            print(command+': '+field+' went from '+str(old)+' to '+str(new))
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,338 @@
+# FC7 device access shared by the software/ scripts
+#
+# getDevice() hands back an object with the usual uhal interface (getNode(),
+# read(), write(), readBlock(), writeBlock(), dispatch()). When the connection
+# daemon (fc7_daemon.py) is running, node accesses are forwarded to it over a
+# local socket and the daemon's already open device is used; otherwise the
+# device is opened directly through uhal, as the scripts used to do.
+
+import os, sys, json, socket, atexit
+import fc7_address_table
+
+# default address table used by the scripts, FC7_ADDRESS_TABLE overrides it
+# (e.g. the in-repo address_table.xml against the emulator)
+FC7_CCC_TABLE = os.environ.get("FC7_ADDRESS_TABLE", "file://$GM2DAQ_DIR/address_tables/FC7_CCC.xml")
+
+# FC7_LOOSE_NAMES=1 resolves node names ignoring case and "." versus "_"
+# (fc7_address_table.AddressTable.resolve), to run scripts written for one
+# table's naming with the other; off by default, names must match exactly
+LOOSE_NAMES = os.environ.get("FC7_LOOSE_NAMES", "0") != "0"
+
+# one-node table uhal is opened with when node names are resolved from the
+# compiled index instead (see IndexedDevice)
+RAW_TABLE = "file://"+os.path.join(os.path.dirname(os.path.abspath(__file__)), "address_tables", "raw_table.xml")
+
+# local socket the daemon listens on
+DAEMON_SOCKET = os.environ.get("FC7_DAEMON_SOCKET", "/tmp/fc7_daemon.sock")
+
+# file that dispatch counts are appended to at exit (used by fc7_benchmark.py)
+STATS_FILE = os.environ.get("FC7_STATS")
+
+
+# base port of the local emulator (fc7_emulator.py); when set, every board is
+# reached on localhost instead of the crate network
+EMULATOR_PORT = os.environ.get("FC7_EMULATOR_PORT")
+
+
+# localhost port of an emulated board, e.g. crate 1 slot 5 -> base+105
+def EMULATED_PORT(crate, slot, base):
+    return int(base)+100*int(crate)+int(slot)
+
+
+# IPbus URI of the board in a given crate and slot
+def DEVICE_URI(crate, slot):
+    if EMULATOR_PORT:
+        return "ipbusudp-2.0://127.0.0.1:"+str(EMULATED_PORT(crate, slot, EMULATOR_PORT))
+    return "ipbusudp-2.0://192.168."+str(crate)+"."+str(slot)+":50001"
+
+
+# address table URI with environment variables expanded and relative paths
+# made absolute, so that it means the same thing inside the daemon
+def TABLE_PATH(address_table):
+    if not address_table.startswith("file://"):
+        return address_table
+    return "file://"+os.path.abspath(os.path.expandvars(address_table[len("file://"):]))
+
+
+# open a board, preferring the connection daemon when it is available
+def getDevice(crate, slot, address_table=FC7_CCC_TABLE):
+    # a missing table is an error, not a reason to use another one
+    if address_table.startswith("file://") and not os.path.exists(fc7_address_table.TABLE_FILE(address_table)):
+        raise IOError("address table "+fc7_address_table.TABLE_FILE(address_table)+" does not exist")
+
+    device = None
+    if os.environ.get("FC7_DAEMON", "1") != "0":
+        try:
+            device = DaemonDevice(crate, slot, address_table)
+        except socket.error:
+            pass
+
+    if device is None:
+        import uhal
+        uhal.disableLogging()
+        if os.environ.get("FC7_INDEX", "1") != "0":
+            table = fc7_address_table.LOAD(address_table)
+            device = IndexedDevice(uhal.getDevice("hw_id", DEVICE_URI(crate, slot), RAW_TABLE), table, LOOSE_NAMES)
+        else:
+            device = TableDevice(uhal.getDevice("hw_id", DEVICE_URI(crate, slot), address_table), address_table)
+
+    if STATS_FILE:
+        device = CountingDevice(device)
+    return device
+
+
+# device wrapper counting getNode() and dispatch() calls; the totals are
+# appended to STATS_FILE as one JSON line when the script exits
+class CountingDevice(object):
+    def __init__(self, device):
+        self._device = device
+        self.nodes = 0
+        self.dispatches = 0
+        atexit.register(self._report)
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def getNode(self, path):
+        self.nodes += 1
+        return self._device.getNode(path)
+
+    def dispatch(self):
+        self.dispatches += 1
+        return self._device.dispatch()
+
+    def _report(self):
+        with open(STATS_FILE, "a") as stats:
+            stats.write(json.dumps({"script": os.path.basename(sys.argv[0]), "nodes": self.nodes,
+                                    "dispatches": self.dispatches})+"\n")
+
+
+# node handle reading and writing through the raw uhal client
+class IndexedNode(object):
+    def __init__(self, client, path, node):
+        self._client = client
+        self._path = path
+        self._node = node
+
+    def getPath(self):
+        return self._path
+
+    def getAddress(self):
+        return self._node.address
+
+    def getMask(self):
+        return self._node.mask
+
+    def _mode(self):
+        import uhal
+        if self._node.mode=="non-incremental":
+            return uhal.BlockReadWriteMode.NON_INCREMENTAL
+        return uhal.BlockReadWriteMode.INCREMENTAL
+
+    def read(self):
+        if self._node.mask==0xFFFFFFFF:
+            return self._client.read(self._node.address)
+        return self._client.read(self._node.address, self._node.mask)
+
+    def readBlock(self, size):
+        return self._client.readBlock(self._node.address, int(size), self._mode())
+
+    def write(self, value):
+        if self._node.mask==0xFFFFFFFF:
+            return self._client.write(self._node.address, int(value))
+        return self._client.write(self._node.address, int(value), self._node.mask)
+
+    def writeBlock(self, values):
+        return self._client.writeBlock(self._node.address, [int(v) for v in values], self._mode())
+
+
+# uhal device opened with RAW_TABLE, node names looked up in a compiled
+# fc7_address_table index so that the full XML is not parsed at startup
+class IndexedDevice(object):
+    def __init__(self, device, table, loose=False):
+        self._device = device
+        self._client = device.getClient()
+        self.table = table
+        self.loose = loose
+
+    def id(self):
+        return self._device.id()
+
+    def uri(self):
+        return self._device.uri()
+
+    def getClient(self):
+        return self._client
+
+    def getNode(self, path):
+        return IndexedNode(self._client, path, self.table.node(path, self.loose))
+
+    def dispatch(self):
+        return self._client.dispatch()
+
+
+# uhal device opened with the full address table, which is also loaded as
+# .table when asked for (for fc7_address_table.DEVICE_TABLE)
+class TableDevice(object):
+    def __init__(self, device, address_table):
+        self._device = device
+        self.address_table = address_table
+        self._table = None
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = fc7_address_table.LOAD(self.address_table)
+        return self._table
+
+
+# stand-in for uhal's ValWord/ValVector, filled in on dispatch()
+class DaemonValue(object):
+    def __init__(self):
+        self._value = None
+
+    def value(self):
+        return self._value
+
+    def valid(self):
+        return self._value is not None
+
+    def __int__(self):
+        return int(self._value)
+
+    def __index__(self):
+        return int(self._value)
+
+    def __getitem__(self, i):
+        return self._value[i]
+
+    def __len__(self):
+        return len(self._value)
+
+    def __iter__(self):
+        return iter(self._value)
+
+    def __str__(self):
+        return str(self._value)
+
+
+# node handle queueing operations on its daemon device
+class DaemonNode(object):
+    def __init__(self, device, path):
+        self._device = device
+        self._path = path
+
+    def getPath(self):
+        return self._path
+
+    def read(self):
+        return self._device._queue(["read", self._path])
+
+    def readBlock(self, size):
+        return self._device._queue(["readBlock", self._path, int(size)])
+
+    def write(self, value):
+        return self._device._queue(["write", self._path, int(value)])
+
+    def writeBlock(self, values):
+        return self._device._queue(["writeBlock", self._path, [int(v) for v in values]])
+
+
+# raw address access through the daemon, queued with the device's node
+# operations and sent by the same dispatch()
+class DaemonClient(object):
+    def __init__(self, device):
+        self._device = device
+
+    def read(self, address, mask=0xFFFFFFFF):
+        return self._device._queue(["rawRead", int(address), int(mask)])
+
+    # a uhal block mode as the daemon takes it, by its address table name
+    def _mode(self, mode):
+        if mode is None:
+            return "incremental"
+        import uhal
+        if mode==uhal.BlockReadWriteMode.NON_INCREMENTAL:
+            return "non-incremental"
+        return "incremental"
+
+    def readBlock(self, address, size, mode=None):
+        return self._device._queue(["rawReadBlock", int(address), int(size), self._mode(mode)])
+
+    def write(self, address, value, mask=0xFFFFFFFF):
+        return self._device._queue(["rawWrite", int(address), int(value), int(mask)])
+
+    def writeBlock(self, address, values, mode=None):
+        return self._device._queue(["rawWriteBlock", int(address), [int(v) for v in values], self._mode(mode)])
+
+    def dispatch(self):
+        return self._device.dispatch()
+
+
+# board proxy talking to the connection daemon
+class DaemonDevice(object):
+    def __init__(self, crate, slot, address_table=FC7_CCC_TABLE):
+        self.crate = str(crate)
+        self.slot = str(slot)
+        self.address_table = TABLE_PATH(address_table)
+        self._table = None
+        self._ops = []
+        self._results = []
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.connect(DAEMON_SOCKET)
+        except socket.error:
+            self._sock.close()
+            raise
+        self._stream = self._sock.makefile('rb')
+
+    def id(self):
+        return "crate"+self.crate+"_slot"+self.slot
+
+    def uri(self):
+        return DEVICE_URI(self.crate, self.slot)
+
+    def getNode(self, path):
+        return DaemonNode(self, path)
+
+    def getClient(self):
+        return DaemonClient(self)
+
+    # the address table, loaded when asked for (fc7_address_table.DEVICE_TABLE)
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = fc7_address_table.LOAD(self.address_table)
+        return self._table
+
+    def _queue(self, op):
+        result = DaemonValue()
+        self._ops.append(op)
+        self._results.append(result)
+        return result
+
+    # send all queued operations as one request and fill in the results
+    def dispatch(self):
+        if not self._ops:
+            return
+        ops, results = self._ops, self._results
+        self._ops, self._results = [], []
+
+        request = {"crate": self.crate, "slot": self.slot, "table": self.address_table, "ops": ops}
+        self._sock.sendall((json.dumps(request)+"\n").encode("utf-8"))
+        line = self._stream.readline()
+        if not line:
+            raise RuntimeError("FC7 daemon closed the connection")
+        reply = json.loads(line.decode("utf-8"))
+        if "error" in reply:
+            raise RuntimeError("FC7 daemon: "+reply["error"])
+
+        for result, value in zip(results, reply["values"]):
+            result._value = value
+
+    def close(self):
+        self._stream.close()
+        self._sock.close()
@@ -0,0 +1,175 @@
+# FC7 connection daemon
+# Usage: python fc7_daemon.py [crate numbers] [slot numbers] [options]
+#
+# Keeps one open uhal device per board so that the scripts, which go through
+# fc7_client.getDevice(), do not have to rebuild the URI and re-parse the
+# address table on every invocation. Requests are single JSON lines sent over
+# a local socket:
+#   {"crate": "1", "slot": "5", "table": "file://...", "ops": [["read", "SEQ_COUNT"], ...]}
+# and are answered with {"values": [...]} or {"error": "..."}. Raw address
+# operations (["rawRead", address, mask], ["rawWrite", address, value, mask],
+# ["rawReadBlock", address, size, mode], ["rawWriteBlock", address, values,
+# mode], mode "incremental" or "non-incremental") go through the device's uhal
+# client.
+
+import sys, os, getopt, json, threading, socketserver
+import uhal
+import fc7_client, fc7_fanout
+uhal.disableLogging()
+
+# help menu
+def HELP_MENU():
+    print('usage: python fc7_daemon.py [crate numbers] [slot numbers] [options]')
+    print('')
+    print('options:')
+    print('  -h       : show this help menu and exit')
+    print('  -s PATH  : local socket path (default '+fc7_client.DAEMON_SOCKET+')')
+    print('  -t TABLE : address table to preload the boards with')
+
+# open devices, one per (crate, slot, address table), each with its own lock
+class DevicePool(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._devices = {}
+
+    def get(self, crate, slot, table):
+        # tables are keyed as the clients send them, expanded and absolute
+        table = fc7_client.TABLE_PATH(table)
+        key = (str(crate), str(slot), table)
+        with self._lock:
+            if key not in self._devices:
+                uri = fc7_client.DEVICE_URI(crate, slot)
+                self._devices[key] = (uhal.getDevice("hw_id", uri, table), threading.Lock())
+            return self._devices[key]
+
+
+# queue every operation of a request and dispatch them together
+def EXECUTE(fc7, ops):
+    results = []
+    for op in ops:
+        if op[0].startswith('raw'):
+            results.append(QUEUE_RAW(fc7.getClient(), op))
+            continue
+        node = fc7.getNode(op[1])
+        if op[0]=='read':
+            results.append(node.read())
+        elif op[0]=='readBlock':
+            results.append(node.readBlock(op[2]))
+        elif op[0]=='write':
+            node.write(op[2])
+            results.append(None)
+        elif op[0]=='writeBlock':
+            node.writeBlock(op[2])
+            results.append(None)
+        else:
+            raise ValueError('unknown operation '+str(op[0]))
+    fc7.dispatch()
+
+    values = []
+    for op, result in zip(ops, results):
+        if op[0] in ('read', 'rawRead'):
+            values.append(int(result.value()))
+        elif op[0] in ('readBlock', 'rawReadBlock'):
+            values.append([int(v) for v in result.value()])
+        else:
+            values.append(None)
+    return values
+
+
+# uhal block mode of a raw block operation, incremental if not given
+def BLOCK_MODE(op, n):
+    mode = op[n] if len(op) > n else "incremental"
+    if mode=="incremental":
+        return uhal.BlockReadWriteMode.INCREMENTAL
+    elif mode=="non-incremental":
+        return uhal.BlockReadWriteMode.NON_INCREMENTAL
+    raise ValueError('unknown block mode '+str(mode))
+
+
+# raw address operations, [op, address, ...], for fc7_client.DaemonClient
+def QUEUE_RAW(client, op):
+    if op[0]=='rawRead':
+        if op[2]==0xFFFFFFFF:
+            return client.read(op[1])
+        return client.read(op[1], op[2])
+    elif op[0]=='rawReadBlock':
+        return client.readBlock(op[1], op[2], BLOCK_MODE(op, 3))
+    elif op[0]=='rawWrite':
+        if op[3]==0xFFFFFFFF:
+            client.write(op[1], op[2])
+        else:
+            client.write(op[1], op[2], op[3])
+    elif op[0]=='rawWriteBlock':
+        client.writeBlock(op[1], op[2], BLOCK_MODE(op, 3))
+    else:
+        raise ValueError('unknown operation '+str(op[0]))
+    return None
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line.decode('utf-8'))
+                table = request.get('table', fc7_client.FC7_CCC_TABLE)
+                fc7, lock = self.server.pool.get(request['crate'], request['slot'], table)
+                with lock:
+                    reply = {'values': EXECUTE(fc7, request['ops'])}
+            except Exception as e:
+                reply = {'error': str(e)}
+            self.wfile.write((json.dumps(reply)+'\n').encode('utf-8'))
+            self.wfile.flush()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+if __name__ == '__main__':
+    # check number of arguments
+    if len(sys.argv)<3:
+        HELP_MENU()
+        sys.exit(2)
+
+    # parse argument options
+    try:
+        opts, args = getopt.getopt(sys.argv[3:],"hs:t:")
+    except getopt.GetoptError:
+        HELP_MENU()
+        sys.exit(2)
+
+    socket_path = fc7_client.DAEMON_SOCKET
+    table = fc7_client.FC7_CCC_TABLE
+    for opt, arg in opts:
+        if opt in ("-h"):
+            HELP_MENU()
+            sys.exit()
+        elif opt in ("-s"):
+            socket_path = arg
+        elif opt in ("-t"):
+            table = arg
+
+    # open the configured boards up front, others are opened on first use
+    pool = DevicePool()
+    for crate in fc7_fanout.PARSE_ARG(sys.argv[1]):
+        for slot in fc7_fanout.PARSE_ARG(sys.argv[2]):
+            pool.get(crate, slot, table)
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    # only the user running the daemon may connect: the socket drives hardware
+    umask = os.umask(0o177)
+    try:
+        server = DaemonServer(socket_path, RequestHandler)
+    finally:
+        os.umask(umask)
+    os.chmod(socket_path, 0o600)
+    server.pool = pool
+    print('FC7 daemon listening on '+socket_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(socket_path)
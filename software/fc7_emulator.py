@@ -0,0 +1,339 @@
+# FC7 IPbus 2.0 emulator
+# Usage: python fc7_emulator.py [crate numbers] [slot numbers] [options]
+#
+# Serves the FC7 register space described by address_tables/address_table.xml
+# (and the sequencer, delay, width and T9 delay tables it includes) over UDP,
+# one simulated board per crate/slot on localhost. Point the scripts at it with
+#   export FC7_EMULATOR_PORT=60000
+# and crate c, slot s is then reached on port 60000+100*c+s.
+#
+# Supported: read, write, non-incrementing read/write, RMW bits and RMW sum
+# transactions, status and resend packets and the packet ID sequencing that
+# uhal relies on. Registers are plain 32-bit words initialised to zero; masks
+# and permissions are left to the client, as on the board.
+
+import sys, getopt, socket, struct, threading, time
+import fc7_client, fc7_address_table, fc7_fanout
+
+# help menu
+def HELP_MENU():
+    print('usage: python fc7_emulator.py [crate numbers] [slot numbers] [options]')
+    print('')
+    print('options:')
+    print('  -h         : show this help menu and exit')
+    print('  -p PORT    : base UDP port (default 60000)')
+    print('  -t TABLE   : address table to build the register map from')
+    print('  -l LATENCY : reply latency per packet, in ms (default 0)')
+    print('  -a         : accept any address instead of returning bus errors')
+
+# packet types
+CONTROL = 0x0
+STATUS  = 0x1
+RESEND  = 0x2
+
+# transaction types
+READ          = 0x0
+WRITE         = 0x1
+READ_NONINC   = 0x2
+WRITE_NONINC  = 0x3
+RMW_BITS      = 0x4
+RMW_SUM       = 0x5
+
+# transaction info codes
+SUCCESS     = 0x0
+BAD_HEADER  = 0x1
+READ_ERROR  = 0x4
+WRITE_ERROR = 0x5
+REQUEST     = 0xF
+
+MASK32 = 0xFFFFFFFF
+
+
+def PACKET_HEADER(packet_id, packet_type):
+    return 0x200000F0 | (packet_id << 8) | packet_type
+
+def TRANSACTION_HEADER(transaction_id, words, type_id, info):
+    return 0x20000000 | (transaction_id << 16) | (words << 8) | (type_id << 4) | info
+
+
+# one simulated board: register memory, packet ID bookkeeping and counters
+class Board(object):
+    def __init__(self, crate, slot, addresses, permissive=False, mtu=1500, buffers=16):
+        self.crate = str(crate)
+        self.slot = str(slot)
+        self.memory = dict((address, 0) for address in addresses)
+        self.permissive = permissive
+        self.mtu = mtu
+        self.buffers = buffers
+        self.expected = 1
+        self.replies = {}
+        self.received = [0, 0, 0, 0]
+        self.sent = [0, 0, 0, 0]
+        self.lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {'packets_in': 0, 'packets_out': 0, 'bytes_in': 0, 'bytes_out': 0,
+                      'control': 0, 'status': 0, 'resend': 0, 'dropped': 0, 'transactions': 0}
+
+    def _mapped(self, address):
+        if address in self.memory:
+            return True
+        if self.permissive:
+            self.memory[address] = 0
+            return True
+        return False
+
+    # peek and poke, for tests and for seeding values
+    def read(self, address):
+        return self.memory.get(address, 0)
+
+    def write(self, address, value):
+        self.memory[address] = value & MASK32
+
+    # answer one UDP payload, returning the reply payload or None to stay silent
+    def handle(self, payload):
+        with self.lock:
+            self.stats['packets_in'] += 1
+            self.stats['bytes_in'] += len(payload)
+            reply = self._handle(payload)
+            if reply is None:
+                self.stats['dropped'] += 1
+            else:
+                self.stats['packets_out'] += 1
+                self.stats['bytes_out'] += len(reply)
+            return reply
+
+    def _handle(self, payload):
+        if len(payload) < 4 or len(payload) % 4:
+            return None
+        # the byte-order qualifier tells which way round the words are
+        for order in ('>', '<'):
+            header = struct.unpack(order+'I', payload[:4])[0]
+            if header >> 28 == 2 and header & 0xF0 == 0xF0:
+                break
+        else:
+            return None
+        words = list(struct.unpack(order+'%dI' % (len(payload)//4), payload))
+        packet_id = (header >> 8) & 0xFFFF
+        packet_type = header & 0xF
+
+        if packet_type==STATUS:
+            self.stats['status'] += 1
+            reply = [PACKET_HEADER(0, STATUS), self.mtu, self.buffers, PACKET_HEADER(self.expected, CONTROL),
+                     0, 0, 0, 0] + self.received + self.sent
+            return struct.pack(order+'16I', *reply)
+
+        if packet_type==RESEND:
+            self.stats['resend'] += 1
+            return self.replies.get(packet_id)
+
+        if packet_type!=CONTROL:
+            return None
+        self.stats['control'] += 1
+
+        # packet ID 0 bypasses the reliability mechanism; otherwise only the
+        # expected ID is executed and a repeated one gets its stored reply
+        if packet_id!=0:
+            if packet_id!=self.expected:
+                return self.replies.get(packet_id)
+            self.expected = self.expected+1 if self.expected<0xFFFF else 1
+
+        body = self._execute(words[1:])
+        reply = struct.pack(order+'%dI' % (1+len(body)), header, *body)
+
+        if packet_id!=0:
+            self.replies[packet_id] = reply
+            self.replies.pop((packet_id-self.buffers-1) % 0xFFFF + 1, None)
+            self.received = self.received[1:] + [header]
+            self.sent = self.sent[1:] + [header]
+        return reply
+
+    # run the transactions of a control packet, returning the reply words
+    def _execute(self, words):
+        out = []
+        i = 0
+        while i < len(words):
+            header = words[i]
+            transaction_id = (header >> 16) & 0xFFF
+            size = (header >> 8) & 0xFF
+            type_id = (header >> 4) & 0xF
+            if header >> 28 != 2 or header & 0xF != REQUEST:
+                out.append(TRANSACTION_HEADER(transaction_id, 0, type_id, BAD_HEADER))
+                break
+            self.stats['transactions'] += 1
+
+            if type_id in (READ, READ_NONINC):
+                if i+1 >= len(words):
+                    break
+                base = words[i+1]
+                addresses = [base if type_id==READ_NONINC else base+n for n in range(size)]
+                data = []
+                for address in addresses:
+                    if not self._mapped(address):
+                        break
+                    data.append(self.memory[address])
+                info = SUCCESS if len(data)==size else READ_ERROR
+                out.append(TRANSACTION_HEADER(transaction_id, len(data), type_id, info))
+                out.extend(data)
+                i += 2
+            elif type_id in (WRITE, WRITE_NONINC):
+                if i+2+size > len(words):
+                    break
+                base = words[i+1]
+                done = 0
+                for n, value in enumerate(words[i+2:i+2+size]):
+                    address = base if type_id==WRITE_NONINC else base+n
+                    if not self._mapped(address):
+                        break
+                    self.memory[address] = value
+                    done += 1
+                info = SUCCESS if done==size else WRITE_ERROR
+                out.append(TRANSACTION_HEADER(transaction_id, done, type_id, info))
+                i += 2+size
+            elif type_id==RMW_BITS:
+                if i+4 > len(words):
+                    break
+                address, and_term, or_term = words[i+1:i+4]
+                if not self._mapped(address):
+                    out.append(TRANSACTION_HEADER(transaction_id, 0, type_id, READ_ERROR))
+                    break
+                old = self.memory[address]
+                self.memory[address] = ((old & and_term) | or_term) & MASK32
+                info = SUCCESS
+                out.extend([TRANSACTION_HEADER(transaction_id, 1, type_id, info), old])
+                i += 4
+            elif type_id==RMW_SUM:
+                if i+3 > len(words):
+                    break
+                address, addend = words[i+1:i+3]
+                if not self._mapped(address):
+                    out.append(TRANSACTION_HEADER(transaction_id, 0, type_id, READ_ERROR))
+                    break
+                old = self.memory[address]
+                self.memory[address] = (old + addend) & MASK32
+                info = SUCCESS
+                out.extend([TRANSACTION_HEADER(transaction_id, 1, type_id, info), old])
+                i += 3
+            else:
+                out.append(TRANSACTION_HEADER(transaction_id, 0, type_id, BAD_HEADER))
+                break
+
+            # the board stops at the first failed transaction
+            if info!=SUCCESS:
+                break
+        return out
+
+
+# a set of boards, each served from its own UDP socket and thread
+class Emulator(object):
+    def __init__(self, crates, slots, base_port=60000, address_table=fc7_address_table.REPO_TABLE,
+                 latency=0.0, permissive=False):
+        nodes = fc7_address_table.PARSE(address_table)[0]
+        addresses = fc7_address_table.ADDRESSES(nodes)
+        self.base_port = int(base_port)
+        self.latency = latency
+        self.boards = {}
+        for crate in crates:
+            for slot in slots:
+                self.boards[(str(crate), str(slot))] = Board(crate, slot, addresses, permissive)
+        self._sockets = []
+        self._threads = []
+        self._running = False
+
+    def board(self, crate, slot):
+        return self.boards[(str(crate), str(slot))]
+
+    def port(self, crate, slot):
+        return fc7_client.EMULATED_PORT(crate, slot, self.base_port)
+
+    # totals of the per-board counters
+    def stats(self):
+        total = {}
+        for board in self.boards.values():
+            for key, value in board.stats.items():
+                total[key] = total.get(key, 0) + value
+        return total
+
+    def reset_stats(self):
+        for board in self.boards.values():
+            board.reset_stats()
+
+    def _serve(self, sock, board):
+        while self._running:
+            try:
+                payload, peer = sock.recvfrom(65536)
+            except socket.timeout:
+                continue
+            except socket.error:
+                break
+            reply = board.handle(payload)
+            if reply is not None:
+                if self.latency:
+                    time.sleep(self.latency)
+                sock.sendto(reply, peer)
+
+    def start(self):
+        self._running = True
+        for (crate, slot), board in sorted(self.boards.items()):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind(('127.0.0.1', self.port(crate, slot)))
+            sock.settimeout(0.2)
+            thread = threading.Thread(target=self._serve, args=(sock, board))
+            thread.daemon = True
+            thread.start()
+            self._sockets.append(sock)
+            self._threads.append(thread)
+
+    def stop(self):
+        self._running = False
+        for thread in self._threads:
+            thread.join()
+        for sock in self._sockets:
+            sock.close()
+        self._sockets = []
+        self._threads = []
+
+
+if __name__ == '__main__':
+    # check number of arguments
+    if len(sys.argv)<3:
+        HELP_MENU()
+        sys.exit(2)
+
+    # parse argument options
+    try:
+        opts, args = getopt.getopt(sys.argv[3:],"hp:t:l:a")
+    except getopt.GetoptError:
+        HELP_MENU()
+        sys.exit(2)
+
+    base_port = 60000
+    table = fc7_address_table.REPO_TABLE
+    latency = 0.0
+    permissive = False
+    for opt, arg in opts:
+        if opt in ("-h"):
+            HELP_MENU()
+            sys.exit()
+        elif opt in ("-p"):
+            base_port = int(arg)
+        elif opt in ("-t"):
+            table = arg
+        elif opt in ("-l"):
+            latency = float(arg)/1000.
+        elif opt in ("-a"):
+            permissive = True
+
+    emulator = Emulator(fc7_fanout.PARSE_ARG(sys.argv[1]), fc7_fanout.PARSE_ARG(sys.argv[2]), base_port, table, latency, permissive)
+    emulator.start()
+    for crate, slot in sorted(emulator.boards):
+        print('crate '+crate+' slot '+slot+': ipbusudp-2.0://127.0.0.1:'+str(emulator.port(crate, slot)))
+    print('export FC7_EMULATOR_PORT='+str(base_port)+' to use the emulated boards')
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.stop()
@@ -0,0 +1,121 @@
+# FC7 multi-board fan-out
+#
+# Lets a single-board script take crate and slot lists ("1-12,14", as in
+# read_addresses.py) by running itself once per board, several boards at a
+# time, and printing one report at the end. Scripts call
+#
+#   fc7_fanout.FANOUT()
+#
+# right after their imports; with a single crate and slot it returns and the
+# script carries on as before. "{crate}" and "{slot}" in the remaining
+# arguments are replaced per board, e.g. for output files:
+#
+#   python read_triggers_csv_python3.py 1 1-12 triggers_{crate}_{slot}.csv
+#
+# Scripts that write a file name its argument position, FANOUT(outputs=[3]),
+# and the run is refused when that file would be the same for every board.
+#
+# The number of boards handled at once defaults to 12 and can be changed with
+# FC7_WORKERS. A board that has not finished after FC7_TIMEOUT seconds
+# (default 120, 0 for no limit) is stopped and reported as failed.
+
+import os, sys, time, subprocess, threading
+from multiprocessing.pool import ThreadPool
+
+# colors
+GRAY  = "\033[47;30m"
+RED   = "\033[0;31m"
+RESET = "\033[m\017"
+
+WORKERS = int(os.environ.get("FC7_WORKERS", "12"))
+TIMEOUT = float(os.environ.get("FC7_TIMEOUT", "120"))
+
+
+# parse argument numbers
+def PARSE_ARG(arg):
+    parsed = []
+    csplit = arg.split(',')
+    for c in csplit:
+        dsplit = c.split('-')
+        if len(dsplit)==1:
+            parsed.append(dsplit[0])
+        else:
+            for d in range(int(dsplit[0]),int(dsplit[1])+1):
+                parsed.append(str(d))
+    return parsed
+
+
+# run the calling script for one board, returning (crate, slot, status,
+# output, seconds); the status is 'ok', 'exit N' or 'timed out'
+def RUN(script, crate, slot, args, timeout=TIMEOUT):
+    args = [a.replace('{crate}', crate).replace('{slot}', slot) for a in args]
+    start = time.time()
+    process = subprocess.Popen([sys.executable, script, crate, slot]+args,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    # a board that hangs is killed rather than holding up the others
+    expired = []
+    def EXPIRE():
+        if process.poll() is None:
+            expired.append(True)
+            process.kill()
+    timer = None
+    if timeout > 0:
+        timer = threading.Timer(timeout, EXPIRE)
+        timer.start()
+    try:
+        output = process.communicate()[0]
+    finally:
+        if timer is not None:
+            timer.cancel()
+    if expired:
+        status = 'timed out'
+    else:
+        status = 'ok' if process.returncode==0 else 'exit '+str(process.returncode)
+    return crate, slot, status, output.decode('utf-8', 'replace'), time.time()-start
+
+
+# re-run the calling script once per board when given crate/slot lists;
+# outputs are the argument positions of files the script writes
+def FANOUT(argv=None, outputs=()):
+    if argv is None:
+        argv = sys.argv
+    if len(argv)<3:
+        return
+    crates = PARSE_ARG(argv[1])
+    slots = PARSE_ARG(argv[2])
+    if len(crates)==1 and len(slots)==1:
+        return
+
+    # every board would write the same file
+    for position in outputs:
+        if position >= len(argv):
+            continue
+        missing = [field for field, values in (('{crate}', crates), ('{slot}', slots))
+                   if len(values)>1 and field not in argv[position]]
+        if missing:
+            print(RED+'output file '+argv[position]+' would be written by several boards, put '+' and '.join(missing)+
+                  ' in its name'+RESET)
+            sys.exit(2)
+
+    script = os.path.abspath(argv[0])
+    boards = [(crate, slot) for crate in crates for slot in slots]
+    pool = ThreadPool(max(1, min(WORKERS, len(boards))))
+    try:
+        results = pool.map(lambda board: RUN(script, board[0], board[1], argv[3:]), boards)
+    finally:
+        pool.close()
+
+    # per-board output, in crate/slot order
+    failed = []
+    for crate, slot, status, output, seconds in results:
+        print(GRAY+'crate '+crate+' slot '+slot+' ('+status+', '+'%.2f' % seconds+' s)'+RESET)
+        sys.stdout.write(output)
+        if status!='ok':
+            failed.append((crate, slot, status))
+
+    # summary
+    print('')
+    print(str(len(boards))+' boards: '+str(len(boards)-len(failed))+' ok, '+str(len(failed))+' failed')
+    for crate, slot, status in failed:
+        print(RED+'  crate '+crate+' slot '+slot+': '+status+RESET)
+    sys.exit(1 if failed else 0)
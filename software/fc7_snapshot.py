@@ -0,0 +1,123 @@
+# FC7 configuration snapshots
+#
+# A snapshot holds every word of a board that has a writable register in the
+# address table (controls, TTC delays, SFP requests, sequencer, analog and T9
+# triggers, internal trigger settings) as two arrays, addresses and words,
+# saved in a compressed .npz file with a format version and where it came
+# from. Restoring writes the words back as block writes of consecutive
+# addresses and reads them again to verify:
+#
+#   snapshot = fc7_snapshot.TAKE(fc7)
+#   fc7_snapshot.SAVE("crate1_slot5.npz", snapshot)
+#   errors = fc7_snapshot.RESTORE(fc7, fc7_snapshot.LOAD("crate1_slot5.npz"))
+#
+# The SYSTEM word (resets, run control, FPGA reprogramming) is left out, and
+# strobe bits, which start an action when set, are restored as 0.
+
+import time
+import numpy as np
+import fc7_address_table, trigger_addresses
+
+VERSION = 1
+
+# nodes, or node groups, whose words are not saved
+EXCLUDED = ["SYSTEM", "FLASH"]
+
+# strobe bits (fc7_transaction pulse() targets and one-shot requests)
+STROBES = ["SEND_OFW_BOC", "TTS_RX.TAP_STROBE", "TTS_RX.REALIGN", "TTS_RX.RESET_L12", "TTS_RX.RESET_L08",
+           "I2C.READ_L12", "I2C.READ_L08", "I2C.RESET_L12", "I2C.RESET_L08", "SFP.ENABLE_L12", "SFP.ENABLE_L08",
+           "FMC_ID.WRITE", "TTC_DECODER_RST", "RESET_T9_CORR"]
+
+
+class Snapshot(object):
+    def __init__(self, addresses, words, masks, strobes, info=None):
+        self.addresses = np.asarray(addresses, dtype=np.uint32)
+        self.words = np.asarray(words, dtype=np.uint32)
+        self.masks = np.asarray(masks, dtype=np.uint32)
+        self.strobes = np.asarray(strobes, dtype=np.uint32)
+        self.info = dict(info or {})
+
+    def __len__(self):
+        return self.addresses.size
+
+    # the words as they are written back: strobe bits cleared
+    def image(self):
+        return self.words & ~self.strobes
+
+
+def _excluded(name):
+    return any(name==group or name.startswith(group+".") for group in EXCLUDED)
+
+
+# sorted addresses of the words with writable registers in a table, the
+# writable bits of each and its strobe bits
+def LAYOUT(table):
+    masks = {}
+    for name in table.paths():
+        node = table.node(name)
+        if not node.leaf or "w" not in node.permission or _excluded(name):
+            continue
+        addresses = range(node.address, node.address+node.size) if node.mode=="incremental" else [node.address]
+        for address in addresses:
+            masks[address] = masks.get(address, 0) | node.mask
+    addresses = np.array(sorted(masks), dtype=np.uint32)
+    strobes = dict((address, 0) for address in masks)
+    for name in STROBES:
+        node = table.node(name) if name in table else None
+        if node is not None and node.address in strobes:
+            strobes[node.address] |= node.mask
+    return (addresses, np.array([masks[a] for a in addresses.tolist()], dtype=np.uint32),
+            np.array([strobes[a] for a in addresses.tolist()], dtype=np.uint32))
+
+
+# read a snapshot of a board in one dispatch
+def TAKE(fc7, table=None, info=None):
+    if table is None:
+        table = fc7_address_table.DEVICE_TABLE(fc7)
+    addresses, masks, strobes = LAYOUT(table)
+    words = trigger_addresses.READ_WORDS(fc7, addresses)
+    info = dict(info or {})
+    info.setdefault("time", time.time())
+    return Snapshot(addresses, words, masks, strobes, info)
+
+
+def SAVE(path, snapshot):
+    info = dict((key, np.array(value)) for key, value in snapshot.info.items())
+    np.savez_compressed(path, version=np.array(VERSION), addresses=snapshot.addresses, words=snapshot.words,
+                        masks=snapshot.masks, strobes=snapshot.strobes, **info)
+
+def LOAD(path):
+    with np.load(path) as data:
+        if "version" not in data or int(data["version"])!=VERSION:
+            raise ValueError(path+" is not a version "+str(VERSION)+" FC7 snapshot")
+        arrays = ("version", "addresses", "words", "masks", "strobes")
+        info = dict((key, data[key].item()) for key in data.files if key not in arrays)
+        return Snapshot(data["addresses"], data["words"], data["masks"], data["strobes"], info)
+
+
+# write a snapshot to a board and read it back; returns the (address,
+# expected, read) of the words whose writable bits differ, empty if all is
+# well. Snapshots taken with another address table layout are refused unless
+# force is set, since the addresses would not mean the same registers; a
+# board with a run in progress is always refused (RuntimeError)
+def RESTORE(fc7, snapshot, table=None, force=False, verify=True):
+    if table is None:
+        table = fc7_address_table.DEVICE_TABLE(fc7)
+    addresses, masks, strobes = LAYOUT(table)
+    if not force and (not np.array_equal(addresses, snapshot.addresses) or not np.array_equal(masks, snapshot.masks)):
+        raise ValueError("snapshot register layout differs from the address table")
+
+    running = fc7.getNode("SYSTEM.RUN_ENABLE").read()
+    fc7.dispatch()
+    if int(running.value()):
+        raise RuntimeError("a run is in progress, stop it before restoring")
+
+    image = snapshot.image()
+    trigger_addresses.WRITE_WORDS(fc7, snapshot.addresses, image)
+    fc7.dispatch()
+    if not verify:
+        return []
+    check = snapshot.masks & ~snapshot.strobes
+    words = trigger_addresses.READ_WORDS(fc7, snapshot.addresses)
+    bad = np.flatnonzero((words & check)!=(image & check))
+    return [(int(snapshot.addresses[n]), int(image[n]), int(words[n])) for n in bad]
@@ -0,0 +1,83 @@
+# FC7 batched transactions
+#
+# Queues node writes, strobes and readbacks for one command line and sends
+# them with as few dispatch() calls as possible, so that uhal can pack them
+# into as few IPbus packets as possible. A strobe is the exception: its bit is
+# set and cleared in separate dispatches, as the scripts always did, so the
+# firmware sees it high. Messages registered with note() are printed once the
+# operations they describe have actually reached the board.
+#
+#   tx = fc7_transaction.Transaction(fc7)
+#   tx.write("OFW.THRES", 10)
+#   tx.pulse("SFP.ENABLE.L08")
+#   ports = tx.read("SFP.REQUEST.L08")
+#   tx.flush()
+#   print(int(ports))
+
+
+class Transaction(object):
+    def __init__(self, fc7):
+        self.fc7 = fc7
+        self.ops = []
+        self.results = []
+        self.dispatches = 0
+        self._flushed = 0
+        self._notes = []
+
+    # queue a single word write
+    def write(self, node, value):
+        self.fc7.getNode(node).write(int(value))
+        self.ops.append(('write', node, int(value)))
+        self.results.append(None)
+
+    # queue a block write
+    def writeBlock(self, node, values):
+        values = [int(v) for v in values]
+        self.fc7.getNode(node).writeBlock(values)
+        self.ops.append(('writeBlock', node, values))
+        self.results.append(None)
+
+    # strobe a bit: send everything queued so far with the bit set, then queue
+    # the clear, which goes with whatever is sent next
+    def pulse(self, node):
+        self.write(node, 1)
+        self.flush()
+        self.write(node, 0)
+
+    # queue a readback, its value is available after flush()
+    def read(self, node):
+        result = self.fc7.getNode(node).read()
+        self.ops.append(('read', node, None))
+        self.results.append(result)
+        return result
+
+    # queue a block readback, its values are available after flush()
+    def readBlock(self, node, size):
+        result = self.fc7.getNode(node).readBlock(int(size))
+        self.ops.append(('readBlock', node, int(size)))
+        self.results.append(result)
+        return result
+
+    # message to print once the queued operations have been sent
+    def note(self, message):
+        self._notes.append(message)
+
+    # send everything queued so far in one go
+    def flush(self):
+        if len(self.ops) > self._flushed:
+            self.fc7.dispatch()
+            self.dispatches += 1
+        self._flushed = len(self.ops)
+        for message in self._notes:
+            print(message)
+        self._notes = []
+
+    # values of the readbacks, in the order they were queued
+    def values(self):
+        values = []
+        for op, result in zip(self.ops, self.results):
+            if op[0]=='read':
+                values.append(int(result.value()))
+            elif op[0]=='readBlock':
+                values.append([int(v) for v in result.value()])
+        return values
@@ -0,0 +1,99 @@
+# FC7 status history query script
+# Usage: python query_status.py [ring file] [options]
+#
+# Prints the snapshots of a ring file written by record_status.py that fall in
+# a time range, as csv rows of the time, crate, slot and the requested status
+# signals (status_fields.py). Only the snapshots in the range are read from
+# the file. Without -f, prints how many snapshots each board has in the range.
+
+import status_fields, status_ring, sys, getopt, csv, time
+import numpy as np
+
+# help menu
+def HELP_MENU():
+    print('usage: python query_status.py [ring file] [options]')
+    print('')
+    print('options:')
+    print('  -h        : show this help menu and exit')
+    print('  -f FIELDS : comma-separated signals to print (see read_status.py expert)')
+    print('  -b TIME   : first snapshot time (default: oldest)')
+    print('  -e TIME   : end of the range, not included (default: newest)')
+    print('  -c CRATE  : only this crate')
+    print('  -s SLOT   : only this slot')
+    print('')
+    print('TIME is "YYYY-mm-dd HH:MM:SS" in local time, unix seconds, or a negative number of')
+    print('seconds before now')
+
+# seconds since the epoch from an option value
+def PARSE_TIME(text):
+    try:
+        stamp = float(text)
+    except ValueError:
+        return time.mktime(time.strptime(text, '%Y-%m-%d %H:%M:%S'))
+    if stamp < 0:
+        stamp += time.time()
+    return stamp
+
+# check number of arguments
+if len(sys.argv)<2:
+    HELP_MENU()
+    sys.exit(2)
+
+# parse argument options
+try:
+    opts, args = getopt.getopt(sys.argv[2:],"hf:b:e:c:s:")
+except getopt.GetoptError:
+    HELP_MENU()
+    sys.exit(2)
+
+fields = None
+begin = None
+end = None
+crate = None
+slot = None
+try:
+    for opt, arg in opts:
+        if opt in ("-h"):
+            HELP_MENU()
+            sys.exit()
+        elif opt in ("-f"):
+            fields = arg.split(',')
+            unknown = [name for name in fields if name not in status_fields.FIELD]
+            if unknown:
+                print('Unknown status signal(s): '+', '.join(unknown))
+                sys.exit(2)
+        elif opt in ("-b"):
+            begin = PARSE_TIME(arg)
+        elif opt in ("-e"):
+            end = PARSE_TIME(arg)
+        elif opt in ("-c"):
+            crate = int(arg)
+        elif opt in ("-s"):
+            slot = int(arg)
+except ValueError as e:
+    print('Bad option value: '+str(e))
+    sys.exit(2)
+
+records = status_ring.StatusRing(sys.argv[1]).select(begin, end)
+if crate is not None:
+    records = records[records["crate"]==crate]
+if slot is not None:
+    records = records[records["slot"]==slot]
+
+# per-board summary
+if fields is None:
+    boards, counts = np.unique(records[["crate", "slot"]], return_counts=True)
+    for board, number in zip(boards, counts):
+        stamps = records["time"][(records["crate"]==board["crate"]) & (records["slot"]==board["slot"])]
+        print('crate '+str(board["crate"])+' slot '+str(board["slot"])+': '+str(number)+' snapshot(s) from '+
+              time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stamps[0]))+' to '+
+              time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stamps[-1])))
+    sys.exit()
+
+# only the words the requested signals use are decoded
+values = status_fields.DECODE(records["words"], fields)
+writer = csv.writer(sys.stdout)
+writer.writerow(["time", "crate", "slot"]+fields)
+for n, record in enumerate(records):
+    writer.writerow(['%.3f' % record["time"], int(record["crate"]), int(record["slot"])]+
+                    [status_fields.FORMAT(status_fields.FIELD[name], values[name][n]) for name in fields])
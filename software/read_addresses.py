@@ -2,24 +2,12 @@
 # Usage: python read_addresses.py [crate numbers] [slot numbers]
 
 import sys, time, subprocess, shlex
+import fc7_fanout
 
 if len(sys.argv)!=2 and len(sys.argv)!=3:
     print ("usage: "+sys.argv[0]+" [crate numbers] [slot numbers]")
     sys.exit(2)
 
-# parse argument numbers
-def PARSE_ARG(arg):
-    parsed = []
-    csplit = arg.split(',')
-    for c in csplit:
-        dsplit = c.split('-')
-        if len(dsplit)==1:
-            parsed.append(dsplit[0])
-        else:
-            for d in xrange(int(dsplit[0]),int(dsplit[1])+1):
-                parsed.append(str(d))
-    return parsed
-
 def doIPMI(ipmi_base, cmd_base, cmd):
     IPMI_INCANTATION = "%s raw 0x%02x 0x%02x" % (ipmi_base, cmd_base, cmd)
     args = shlex.split(IPMI_INCANTATION)
@@ -58,11 +46,11 @@ print ('')
 print (GRAY+"Crate   Slot   S/N   IP Address        MAC Address      "+RESET)
 
 # parse argument numbers
-crates = PARSE_ARG(sys.argv[1])
+crates = fc7_fanout.PARSE_ARG(sys.argv[1])
 if len(sys.argv) == 3:
-    slots = PARSE_ARG(sys.argv[2])
+    slots = fc7_fanout.PARSE_ARG(sys.argv[2])
 else:
-    slots = PARSE_ARG("1-12")
+    slots = fc7_fanout.PARSE_ARG("1-12")
 
 # read addresses
 for crate in crates:
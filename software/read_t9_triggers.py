@@ -1,17 +1,17 @@
 # Trigger FC7 channel status script
 # Usage: python read_triggers.py [crate] [slot] [channel]
 
-import uhal, sys
-uhal.disableLogging()
+import fc7_client, fc7_fanout, sys
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT()
 
 # check number of arguments
 if len(sys.argv)!=3:
     print 'usage: python read_t9_triggers.py [crate] [slot]'
     sys.exit(2)
 
-uri = "ipbusudp-2.0://192.168."+sys.argv[1]+"."+sys.argv[2]+":50001"
-address_table = "file://address_tables/address_table.xml"
-fc7 = uhal.getDevice("hw_id", uri, address_table)
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2], "file://address_tables/address_table.xml")
 
 # parse arguments
 crate = sys.argv[1]
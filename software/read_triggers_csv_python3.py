@@ -1,12 +1,18 @@
 # Trigger FC7 pulse train read script
-# Usage: python read_triggers.py [crate] [slot] [csv file]
+# Usage: python read_triggers.py [crate] [slot] [csv file] [options]
 
-import uhal, sys, csv
-uhal.disableLogging()
+import fc7_client, fc7_fanout, trigger_table, sys, getopt
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT(outputs=[3])
 
 # help menu
 def HELP_MENU():
-    print('usage: python read_triggers.py [crate] [slot] [csv file]')
+    print('usage: python read_triggers.py [crate] [slot] [csv file] [options]')
+    print('')
+    print('options:')
+    print('  -h : show this help menu and exit')
+    print('  -a : dump all channels instead of kickers 1-3')
 
 # check number of arguments
 if len(sys.argv)<4:
@@ -14,41 +20,28 @@ if len(sys.argv)<4:
     sys.exit(2)
 
 # parse argument options
-uri = "ipbusudp-2.0://192.168."+sys.argv[1]+"."+sys.argv[2]+":50001"
-#address_table = "file://address_tables/address_table.xml"
-address_table = "file://$GM2DAQ_DIR/address_tables/FC7_CCC.xml"
-fc7 = uhal.getDevice("hw_id", uri, address_table)
+try:
+    opts, args = getopt.getopt(sys.argv[4:],"ha")
+except getopt.GetoptError:
+    HELP_MENU()
+    sys.exit(2)
+
+channels = 3  #kicker 1--3
+for opt, arg in opts:
+    if opt in ("-h"):
+        HELP_MENU()
+        sys.exit()
+    elif opt in ("-a"):
+        channels = None
+
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2])
 
 # .csv file format:
-# [channel], [sequence], [pulse], [delay], [width]
-
-with open(sys.argv[3], 'w') as outfile:
-    # read in settings
-    writer = csv.writer(outfile)
-    t = []
-    #settings = map(tuple, reader)
-
-    # read registers
-    for channel in range(0, 3):  #kicker 1--3
-        for sequence in range(0, 16):
-            for pulse in range(0, 4):
-                DELAY0 = fc7.getNode("DELAY.CHAN"+str(int(channel))+".SEQ"+str(int(sequence))+".LOOP0_PULSE"+str(int(pulse))).read()
-                DELAY1 = fc7.getNode("DELAY.CHAN"+str(int(channel))+".SEQ"+str(int(sequence))+".LOOP1_PULSE"+str(int(pulse))).read()
-                DELAY2 = fc7.getNode("DELAY.CHAN"+str(int(channel))+".SEQ"+str(int(sequence))+".LOOP2_PULSE"+str(int(pulse))).read()
-                DELAY3 = fc7.getNode("DELAY.CHAN"+str(int(channel))+".SEQ"+str(int(sequence))+".LOOP3_PULSE"+str(int(pulse))).read()
-                fc7.dispatch()
-                WIDTH0 = fc7.getNode("WIDTH.CHAN"+str(int(channel))+".SEQ"+str(int(sequence))+".LOOP0_PULSE"+str(int(pulse))).read()
-                WIDTH1 = fc7.getNode("WIDTH.CHAN"+str(int(channel))+".SEQ"+str(int(sequence))+".LOOP1_PULSE"+str(int(pulse))).read()
-                ENABLE = fc7.getNode("WIDTH.CHAN"+str(int(channel))+".SEQ"+str(int(sequence))+".ENABLE_PULSE"+str(int(pulse))).read()
-                fc7.dispatch()
-
-                delay = (int(DELAY3.value()) << 18) + (int(DELAY2.value()) << 12) + (int(DELAY1.value()) << 6) + int(DELAY0.value())
-                width = (int(WIDTH1.value()) <<  4) +  int(WIDTH0.value())
-
-                t.append((channel + 1, sequence + 1, pulse + 1, delay, width, int(ENABLE.value())))
-
-    writer.writerow(["Channel", "Sequence", "Pulse", "Delay", "Width", "Enable"])
-    writer.writerows(t)
+# [channel], [sequence], [pulse], [delay], [width], [enable]
+
+# read registers, one block read per contiguous register range
+table = trigger_table.READ_BOARD(fc7, channels)
+trigger_table.WRITE_CSV(table, sys.argv[3])
 
 print('Trigger settings read successfully!')
 
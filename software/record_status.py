@@ -0,0 +1,83 @@
+# FC7 status recorder script
+# Usage: python record_status.py [crate numbers] [slot numbers] [ring file] [options]
+#
+# Reads the STATUS block of every board at a fixed rate over one connection per
+# board and appends the raw words, with the time, to a ring file
+# (status_ring.py) that keeps the latest snapshots. Read it back with
+# query_status.py. Runs until interrupted or for -n reads.
+
+import fc7_client, fc7_fanout, status_poll, status_ring, sys, getopt, time
+
+# colors
+GRAY  = "\033[47;30m"
+RED   = "\033[0;31m"
+RESET = "\033[m\017"
+
+# help menu
+def HELP_MENU():
+    print('usage: python record_status.py [crate numbers] [slot numbers] [ring file] [options]')
+    print('')
+    print('options:')
+    print('  -h       : show this help menu and exit')
+    print('  -r RATE  : reads per second (default 1)')
+    print('  -s SIZE  : snapshots the ring file holds, when it is created (default 200000,')
+    print('             852 bytes each)')
+    print('  -n COUNT : stop after COUNT reads (default: run until interrupted)')
+
+# check number of arguments
+if len(sys.argv)<4:
+    HELP_MENU()
+    sys.exit(2)
+
+# parse argument options
+try:
+    opts, args = getopt.getopt(sys.argv[4:],"hr:s:n:")
+except getopt.GetoptError:
+    HELP_MENU()
+    sys.exit(2)
+
+rate = 1.0
+size = 200000
+count = None
+for opt, arg in opts:
+    if opt in ("-h"):
+        HELP_MENU()
+        sys.exit()
+    elif opt in ("-r"):
+        rate = float(arg)
+    elif opt in ("-s"):
+        size = int(arg)
+    elif opt in ("-n"):
+        count = int(arg)
+
+try:
+    ring = status_ring.StatusRing(sys.argv[3], size, writable=True)
+except ValueError:
+    # an existing file keeps its own size
+    ring = status_ring.StatusRing(sys.argv[3], writable=True)
+
+boards = [(crate, slot, fc7_client.getDevice(crate, slot))
+          for crate in fc7_fanout.PARSE_ARG(sys.argv[1]) for slot in fc7_fanout.PARSE_ARG(sys.argv[2])]
+
+print(GRAY+'Recording '+str(len(boards))+' board(s) at '+str(rate)+' Hz into '+sys.argv[3]+
+      ' ('+str(ring.capacity)+' snapshots), Ctrl-C to stop'+RESET)
+sys.stdout.flush()
+
+flushed = time.time()
+try:
+    for snapshots in status_poll.POLL([fc7 for crate, slot, fc7 in boards], 1.0/rate, count):
+        for (crate, slot, fc7), (stamp, words, error) in zip(boards, snapshots):
+            if error is not None:
+                print(RED+'crate '+crate+' slot '+slot+': read failed: '+error+RESET)
+                continue
+            ring.append(stamp, crate, slot, words)
+
+        # the mapping is shared, so readers see new snapshots at once; flushing
+        # only matters if the machine goes down
+        if time.time()-flushed > 10:
+            ring.flush()
+            flushed = time.time()
+except KeyboardInterrupt:
+    pass
+finally:
+    ring.flush()
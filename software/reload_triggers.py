@@ -0,0 +1,126 @@
+# Trigger FC7 stop/load/start script
+# Usage: python reload_triggers.py [crate] [slot] [csv file] [options]
+#
+# Does what loadTrigger.sh did with three scripts and two "sleep 1": stops the
+# run, uploads the trigger settings and starts the run again, all from one
+# process. SYSTEM.RUN_ENABLE is read back instead of sleeping (RUN_STATE is
+# hard-wired to 0 on the trigger FC7, -s also waits for it on boards that
+# report it), the settings are read, checked and (with -d) compared with the
+# board before the run is stopped, and the time the run was down is reported.
+
+import fc7_client, fc7_fanout, trigger_addresses, trigger_table, sys, getopt, time
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT()
+
+# help menu
+def HELP_MENU():
+    print('usage: python reload_triggers.py [crate] [slot] [csv file] [options]')
+    print('')
+    print('options:')
+    print('  -h         : show this help menu and exit')
+    print('  -d read    : write only registers that change, reading the board first')
+    print('  -t TIMEOUT : seconds to wait for the run to stop or start (default 5)')
+    print('  -p PERIOD  : polling period, in ms (default 1)')
+    print('  -s         : also wait for RUN_STATE to follow (not on the trigger FC7, where it is always 0)')
+
+# check number of arguments
+if len(sys.argv)<4:
+    HELP_MENU()
+    sys.exit(2)
+
+# parse argument options
+try:
+    opts, args = getopt.getopt(sys.argv[4:],"hd:t:p:s")
+except getopt.GetoptError:
+    HELP_MENU()
+    sys.exit(2)
+
+delta = False
+timeout = 5.0
+period = 0.001
+run_state = False
+for opt, arg in opts:
+    if opt in ("-h"):
+        HELP_MENU()
+        sys.exit()
+    elif opt in ("-d"):
+        if arg!="read":
+            HELP_MENU()
+            sys.exit(2)
+        delta = True
+    elif opt in ("-t"):
+        timeout = float(arg)
+    elif opt in ("-p"):
+        period = float(arg)/1000.
+    elif opt in ("-s"):
+        run_state = True
+
+# wait for the board to report the run enable, and with -s RUN_STATE, at a
+# value, returning the seconds it took or None
+def WAIT_RUN(fc7, state, start):
+    nodes = ["SYSTEM.RUN_ENABLE"]
+    if run_state:
+        nodes.append("RUN_STATE")
+    while True:
+        values = [fc7.getNode(node).read() for node in nodes]
+        fc7.dispatch()
+        if all(int(value.value())==state for value in values):
+            return time.time()-start
+        if time.time()-start > timeout:
+            return None
+        time.sleep(period)
+
+# .csv file format:
+# [channel], [sequence], [pulse], [delay], [width], [enable]
+
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2])
+
+# work out the register writes while the run is still going
+addresses = trigger_addresses.ADDRESSES(fc7)
+table, errors = trigger_table.READ_CHECKED(sys.argv[3], addresses.channels)
+for error in errors:
+    print('File format error: '+error+'!')
+if errors:
+    sys.exit(2)
+image = trigger_table.BOARD_IMAGE(table, addresses, check=False)
+writes = image
+if delta:
+    writes = trigger_addresses.DELTA(fc7, image)
+
+# stop the run
+start = time.time()
+fc7.getNode("SYSTEM.RUN_ABORT").write(0)
+fc7.getNode("SYSTEM.RUN_ENABLE").write(0)
+fc7.dispatch()
+stopped = WAIT_RUN(fc7, 0, start)
+if stopped is None:
+    print('Run did not stop within '+str(timeout)+' s, trigger settings not loaded!')
+    sys.exit(1)
+
+# load the trigger settings, starting the run again whatever happens
+failure = None
+try:
+    trigger_addresses.WRITE_WORDS(fc7, *writes)
+    fc7.dispatch()
+except Exception as e:
+    failure = str(e)
+finally:
+    loaded = time.time()-start
+    fc7.getNode("SYSTEM.RUN_ENABLE").write(1)
+    fc7.dispatch()
+    started = WAIT_RUN(fc7, 1, start)
+if failure is not None:
+    print('Trigger settings not loaded: '+failure+'!')
+    if started is None:
+        print('Run did not start within '+str(timeout)+' s either!')
+    else:
+        print('Run started again after %.1f ms.' % (1000*started))
+    sys.exit(1)
+if started is None:
+    print('Trigger settings loaded, but the run did not start within '+str(timeout)+' s!')
+    sys.exit(1)
+
+print('Run stopped after %.1f ms, %d trigger registers written after %.1f ms, run started after %.1f ms.'
+      % (1000*stopped, len(writes[0]), 1000*loaded, 1000*started))
+print('Trigger settings reloaded, downtime %.1f ms.' % (1000*started))
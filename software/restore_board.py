@@ -0,0 +1,75 @@
+# FC7 configuration restore script
+# Usage: python restore_board.py [crate] [slot] [file] [options]
+#
+# Writes a snapshot saved by snapshot_board.py back to a board, which may be a
+# different one (a replacement) or the same one after a hard reset, with block
+# writes in one dispatch, then reads it back to verify. The SYSTEM word is not
+# touched and strobe bits are written as 0 (fc7_snapshot.py). A board with a
+# run in progress is left alone.
+
+import fc7_client, fc7_snapshot, sys, getopt, time
+
+# colors
+RED   = "\033[0;31m"
+RESET = "\033[m\017"
+
+# help menu
+def HELP_MENU():
+    print('usage: python restore_board.py [crate] [slot] [file] [options]')
+    print('')
+    print('options:')
+    print('  -h : show this help menu and exit')
+    print('  -f : restore even if the snapshot was taken with a different address table layout')
+    print('  -n : do not read back to verify')
+
+# check number of arguments
+if len(sys.argv)<4:
+    HELP_MENU()
+    sys.exit(2)
+
+# parse argument options
+try:
+    opts, args = getopt.getopt(sys.argv[4:],"hfn")
+except getopt.GetoptError:
+    HELP_MENU()
+    sys.exit(2)
+
+force = False
+verify = True
+for opt, arg in opts:
+    if opt in ("-h"):
+        HELP_MENU()
+        sys.exit()
+    elif opt in ("-f"):
+        force = True
+    elif opt in ("-n"):
+        verify = False
+
+try:
+    snapshot = fc7_snapshot.LOAD(sys.argv[3])
+except (IOError, ValueError) as e:
+    print('Snapshot error: '+str(e))
+    sys.exit(2)
+
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2])
+
+start = time.time()
+try:
+    errors = fc7_snapshot.RESTORE(fc7, snapshot, force=force, verify=verify)
+except ValueError as e:
+    print('Restore error: '+str(e)+' (-f to restore anyway)')
+    sys.exit(2)
+except Exception as e:
+    print('Restore error: '+str(e))
+    sys.exit(1)
+
+source = ''
+if 'crate' in snapshot.info:
+    source = ' (crate '+str(snapshot.info['crate'])+' slot '+str(snapshot.info['slot'])+', '+ \
+             time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(snapshot.info['time']))+')'
+print('Restored '+str(len(snapshot))+' words from '+sys.argv[3]+source+' to crate '+sys.argv[1]+' slot '+sys.argv[2]+
+      ' in %.2f s' % (time.time()-start))
+for address, expected, read in errors:
+    print(RED+'Verify error: 0x%08x wrote 0x%08x read 0x%08x' % (address, expected, read)+RESET)
+if errors:
+    sys.exit(1)
@@ -0,0 +1,20 @@
+# FC7 configuration snapshot script
+# Usage: python snapshot_board.py [crate] [slot] [file]
+#
+# Saves every writable register of a board (see fc7_snapshot.py) to a
+# compressed .npz file, read in one dispatch. restore_board.py writes it back.
+
+import fc7_client, fc7_snapshot, sys, time
+
+# check number of arguments
+if len(sys.argv)!=4:
+    print('usage: python snapshot_board.py [crate] [slot] [file]')
+    sys.exit(2)
+
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2])
+
+start = time.time()
+snapshot = fc7_snapshot.TAKE(fc7, info={"crate": sys.argv[1], "slot": sys.argv[2], "uri": fc7.uri()})
+fc7_snapshot.SAVE(sys.argv[3], snapshot)
+print('Saved '+str(len(snapshot))+' words from crate '+sys.argv[1]+' slot '+sys.argv[2]+' to '+sys.argv[3]+
+      ' in %.2f s' % (time.time()-start))
@@ -0,0 +1,418 @@
+# FC7 status alarm rules
+# Usage: python status_alarms.py [crate numbers] [slot numbers] [rules file] [options]
+#
+# Rules are checked on every new STATUS snapshot of a set of boards. A rules
+# file holds one rule per line ('#' starts a comment):
+#
+#   alarm_temp set                        any bit of the signal is 1
+#   ttc_ready clear                       every bit of the signal is 0
+#   l12_tts_lock changed                  differs from the snapshot N reads back
+#   measured_temp > 80                    compared in the displayed unit (C, V)
+#   ttc_sbit_error_cnt rate > 10/min      increase per s, min or h
+#   sfp_en_alarm_l12_* set                a pattern: any matching signal
+#   ttc_clk_lock clear for 5              a debounce of its own, in snapshots
+#   ttc_sbit_error_cnt rate > 1/s over 10 a rate window of its own, in snapshots
+#
+# N being the rule's debounce, so that a single change holds for as many reads
+# as it takes to raise the alarm. Rates are taken over a window of stored
+# snapshots, the debounce unless the rule has "over N", rather than between
+# the last two, so that one slow read does not make or break an alarm. Until a
+# board has that many, both go back to its first snapshot. "-t" checks the
+# engine on made-up snapshots.
+#
+# Comparisons are >, >=, <, <=, == and !=. An AlarmEngine compiles the rules
+# once into arrays of word indices, bit masks and thresholds, so a snapshot of
+# every board is checked with a handful of array operations whatever the
+# number of rules. A rule raises an alarm after holding for the debounce
+# number of snapshots in a row, and clears after failing as many times:
+#
+#   engine = status_alarms.AlarmEngine(status_alarms.READ_RULES("fc7.rules"), len(boards))
+#   for board, rule, raised in engine.update(words, stamps):
+#       ...
+
+import sys, getopt, fnmatch, json, operator, time
+from collections import namedtuple, OrderedDict
+import numpy as np
+import status_fields
+
+# colors
+GRAY  = "\033[47;30m"
+BLUE  = "\033[0;34m"
+RED   = "\033[0;31m"
+RESET = "\033[m\017"
+
+Rule = namedtuple("Rule", "text fields test op threshold per hold window")
+
+OPERATORS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le,
+             "==": operator.eq, "!=": operator.ne}
+PER = {"s": 1.0, "min": 60.0, "h": 3600.0}
+
+
+def _number(text):
+    try:
+        return float(int(text, 0))
+    except ValueError:
+        return float(text)
+
+
+# a rule from its text; hold is the debounce used when the rule has no "for N"
+def PARSE_RULE(text, hold=1):
+    words = text.split()
+    if len(words) > 2 and words[-2]=="for":
+        try:
+            hold = int(words[-1])
+        except ValueError:
+            raise ValueError('debounce "'+words[-1]+'" is not a number')
+        words = words[:-2]
+    window = None
+    if len(words) > 2 and words[-2]=="over":
+        try:
+            window = int(words[-1])
+        except ValueError:
+            raise ValueError('rate window "'+words[-1]+'" is not a number')
+        words = words[:-2]
+    if len(words) < 2:
+        raise ValueError('expected a signal and a condition')
+
+    fields = [field.name for field in status_fields.FIELDS if fnmatch.fnmatchcase(field.name, words[0])]
+    if not fields:
+        raise ValueError('no status signal matches "'+words[0]+'"')
+
+    op, threshold, per = None, None, None
+    if words[1:] in (["set"], ["clear"], ["changed"]):
+        test = words[1]
+    elif words[1]=="rate" and len(words)==4 and words[2] in OPERATORS:
+        test, op = "rate", words[2]
+        value, unit = (words[3].split("/", 1)+["s"])[:2]
+        if unit not in PER:
+            raise ValueError('unknown rate unit "'+unit+'" (s, min, h)')
+        threshold, per = value, PER[unit]
+    elif words[1] in OPERATORS and len(words)==3:
+        test, op, threshold = "compare", words[1], words[2]
+    else:
+        raise ValueError('unknown condition "'+' '.join(words[1:])+'"')
+    if window is not None and test!="rate":
+        raise ValueError('"over" is for rates only')
+
+    if threshold is not None:
+        try:
+            threshold = _number(threshold)
+        except ValueError:
+            raise ValueError('threshold "'+threshold+'" is not a number')
+    if test in ("clear", "compare", "rate"):
+        wide = [name for name in fields if status_fields.WIDTH(status_fields.FIELD[name]) > 64]
+        if wide:
+            raise ValueError('signal(s) too wide to compare: '+', '.join(wide))
+    if hold < 1:
+        raise ValueError('debounce must be at least 1')
+    if test=="rate" and window is None:
+        window = hold
+    if window is not None and window < 1:
+        raise ValueError('rate window must be at least 1')
+    return Rule(text, fields, test, op, threshold, per, hold, window)
+
+
+# rules of a file, one per line; errors name the line
+def READ_RULES(path, hold=1):
+    rules = []
+    with open(path, 'r') as infile:
+        for n, line in enumerate(infile):
+            text = line.split('#', 1)[0].strip()
+            if not text:
+                continue
+            try:
+                rules.append(PARSE_RULE(text, hold))
+            except ValueError as e:
+                raise ValueError(path+' line '+str(n+1)+': '+str(e))
+    return rules
+
+
+# Rules compiled into terms, each the test of one signal, of three kinds: bit
+# terms test (word & mask) of the snapshot ("set") or of its change
+# ("changed") for each part of a signal; value terms compare a decoded signal,
+# its raw number ("clear") or its rate over a window with a threshold. Rules
+# testing the same signal the same way share terms, and a rule holds when any
+# of its terms does, which for all rules at once is a product with the
+# rule/term incidence matrix.
+class AlarmEngine(object):
+    def __init__(self, rules, boards):
+        self.rules = list(rules)
+        self.boards = boards
+
+        # unique terms of each kind, with the rules using them
+        kinds = {"set": OrderedDict(), "changed": OrderedDict(), "value": OrderedDict()}
+        for r, rule in enumerate(self.rules):
+            for name in rule.fields:
+                field = status_fields.FIELD[name]
+                if rule.test=="set":
+                    keys = [("set", (name, word, ((1 << width)-1) << lsb)) for word, lsb, width in field.parts]
+                elif rule.test=="changed":
+                    keys = [("changed", (name, word, ((1 << width)-1) << lsb, rule.hold))
+                            for word, lsb, width in field.parts]
+                elif rule.test=="clear":
+                    keys = [("value", (name, "raw", "==", 0.0, 1.0, 0))]
+                else:
+                    keys = [("value", (name, rule.test, rule.op, rule.threshold, rule.per, rule.window or 0))]
+                for kind, key in keys:
+                    kinds[kind].setdefault(key, set()).add(r)
+        bits = {"set": list(kinds["set"]), "changed": list(kinds["changed"])}
+        values = list(kinds["value"])
+
+        self._set_word = np.array([t[1] for t in bits["set"]], dtype=np.intp)
+        self._set_mask = np.array([t[2] for t in bits["set"]], dtype=np.uint64)
+        self._changed_word = np.array([t[1] for t in bits["changed"]], dtype=np.intp)
+        self._changed_mask = np.array([t[2] for t in bits["changed"]], dtype=np.uint64)
+        self._changed_lag = np.array([t[3] for t in bits["changed"]], dtype=np.int64)
+
+        # signals decoded for value terms, with their display scale and offset
+        self._names = sorted(set(t[0] for t in values))
+        column = dict((name, c) for c, name in enumerate(self._names))
+        fields = [status_fields.FIELD[name] for name in self._names]
+        self._scale = np.array([field.scale if field.display=="float" else 1.0 for field in fields])
+        self._offset = np.array([field.offset if field.display in ("float", "dec") else 0.0 for field in fields])
+        # each signal is the sum of its parts shifted into place
+        parts = []
+        for c, field in enumerate(fields):
+            shift = status_fields.WIDTH(field)
+            for word, lsb, width in field.parts:
+                shift -= width
+                parts.append((word, lsb, (1 << width)-1, 2.0**shift, c))
+        self._part_word = np.array([t[0] for t in parts], dtype=np.intp)
+        self._part_lsb = np.array([t[1] for t in parts], dtype=np.uint64)
+        self._part_mask = np.array([t[2] for t in parts], dtype=np.uint64)
+        self._part_shift = np.array([t[3] for t in parts], dtype=np.float64)
+        self._assemble = np.zeros((len(parts), len(fields)))
+        self._assemble[np.arange(len(parts)), [t[4] for t in parts]] = 1
+        self._column = np.array([column[t[0]] for t in values], dtype=np.intp)
+        self._raw = np.array([t[1]=="raw" for t in values], dtype=bool)
+        self._rate = np.array([t[1]=="rate" for t in values], dtype=bool)
+        self._threshold = np.array([t[3] for t in values], dtype=np.float64)
+        self._per = np.array([t[4] for t in values], dtype=np.float64)
+        self._window = np.array([t[5] for t in values], dtype=np.int64)
+        self._ops = [(OPERATORS[op], np.array([n for n, t in enumerate(values) if t[2]==op], dtype=np.intp))
+                     for op in OPERATORS]
+
+        # terms in the order they are evaluated: their signals and rules
+        users = list(kinds["set"].values())+list(kinds["changed"].values())+list(kinds["value"].values())
+        self._terms = [t[0] for t in bits["set"]+bits["changed"]+values]
+        self._incidence = np.zeros((len(users), len(self.rules)), dtype=np.float32)
+        for t, used in enumerate(users):
+            self._incidence[t, sorted(used)] = 1
+
+        self._hold = np.array([rule.hold for rule in self.rules], dtype=np.int64)
+        self.active = np.zeros((boards, len(self.rules)), dtype=bool)
+        self._run = np.zeros((boards, len(self.rules)), dtype=np.int64)
+
+        # last good snapshot of each board, for details
+        self._words = np.zeros((boards, status_fields.STATUS_WORDS), dtype=np.uint64)
+        self._hits = np.zeros((boards, len(self._terms)), dtype=bool)
+
+        # words, decoded values and times of the last good snapshots of each
+        # board, as many as the widest rate window or change debounce, for
+        # changes and rates: snapshot n of a board is kept at [n % depth, board]
+        self._depth = max([1]+self._window.tolist()+self._changed_lag.tolist())
+        self._word_history = np.zeros((self._depth, boards, status_fields.STATUS_WORDS), dtype=np.uint64)
+        self._history = np.zeros((self._depth, boards, len(self._names)))
+        self._history_stamps = np.zeros((self._depth, boards))
+        self._stored = np.zeros(boards, dtype=np.int64)
+
+    # raw and displayed values of the decoded signals, [board, signal], as
+    # floats (exact up to 53 bits)
+    def _decode(self, words):
+        parts = (words[:, self._part_word] >> self._part_lsb) & self._part_mask
+        raw = np.dot(parts*self._part_shift, self._assemble)
+        return raw, raw*self._scale+self._offset
+
+    # term results of a snapshot, [board, term]
+    def _evaluate(self, words, stamps):
+        board = np.arange(self.boards)[:, None]
+        # changes from the snapshot as many reads back as the rule's debounce,
+        # or the first one while there are fewer
+        lag = np.minimum(self._changed_lag, self._stored[:, None])
+        before = self._word_history[(self._stored[:, None]-lag) % self._depth, board, self._changed_word]
+        changed = ((words[:, self._changed_word] ^ before) & self._changed_mask)!=0
+        held = [(words[:, self._set_word] & self._set_mask)!=0, changed & (lag > 0)]
+
+        raw, values = self._decode(words)
+        measured = values[:, self._column]
+        measured[:, self._raw] = raw[:, self._column[self._raw]]
+        if self._rate.any():
+            # the snapshot window snapshots before this one, or the first one
+            # while there are fewer
+            columns = self._column[self._rate]
+            window = np.minimum(self._window[self._rate], self._stored[:, None])
+            slot = (self._stored[:, None]-window) % self._depth
+            elapsed = stamps[:, None]-self._history_stamps[slot, board]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rate = (values[:, columns]-self._history[slot, board, columns])/elapsed*self._per[self._rate]
+            # a counter going back was reset, not a rate
+            known = window > 0
+            measured[:, self._rate] = np.where(known & (rate >= 0), rate, np.nan)
+        compared = np.zeros(measured.shape, dtype=bool)
+        with np.errstate(invalid="ignore"):
+            for test, terms in self._ops:
+                if terms.size:
+                    compared[:, terms] = test(measured[:, terms], self._threshold[terms])
+        held.append(compared)
+        return np.concatenate(held, axis=1), values
+
+    # check a snapshot of every board: words [board, word], taken at stamps (a
+    # time or one per board); boards whose valid entry is False are left as
+    # they are. Returns (board, rule, raised) for every alarm raised or cleared
+    def update(self, words, stamps, valid=None):
+        words = np.asarray(words, dtype=np.uint64)
+        stamps = np.broadcast_to(np.asarray(stamps, dtype=np.float64), (self.boards,))
+        valid = np.ones(self.boards, dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+
+        hits, values = self._evaluate(words, stamps)
+        held = np.dot(hits.astype(np.float32), self._incidence) > 0
+
+        # debounce: count the snapshots in a row that disagree with the state
+        run = np.where(held!=self.active, self._run+1, 0)
+        flip = (run >= self._hold) & valid[:, None]
+        run[flip] = 0
+        self._run = np.where(valid[:, None], run, self._run)
+        self.active ^= flip
+
+        # invalid boards keep their last good snapshot
+        self._words[valid] = words[valid]
+        self._hits[valid] = hits[valid]
+        slot = self._stored[valid] % self._depth
+        self._word_history[slot, valid] = words[valid]
+        self._history[slot, valid] = values[valid]
+        self._history_stamps[slot, valid] = stamps[valid]
+        self._stored[valid] += 1
+        return [(int(board), int(rule), bool(self.active[board, rule])) for board, rule in zip(*np.nonzero(flip))]
+
+    # signals of a rule that hold on a board in its last snapshot, with their
+    # values as read_status.py prints them
+    def detail(self, board, rule):
+        terms = np.flatnonzero((self._incidence[:, rule] > 0) & self._hits[board])
+        names = sorted(set(self._terms[t] for t in terms), key=lambda name: status_fields._INDEX[name])
+        decoded = status_fields.DECODE(self._words[board], names)
+        return [(name, status_fields.FORMAT(status_fields.FIELD[name], decoded[name])) for name in names]
+
+
+# regression check of the engine on made-up snapshots of one board, read once
+# a second: a single change of a word, early or late, must raise its "changed"
+# alarm under the default debounce and clear it again, and a bit that is set
+# or a counter that jumps must raise theirs. Returns what went wrong, empty if
+# all is well
+def CHECK(hold=3, reads=12):
+    cases = [("l12_tts_lock changed", "l12_tts_lock", 0x1, True),
+             ("alarm_temp set", "alarm_temp", 0x1, False),
+             ("ttc_sbit_error_cnt rate > 1/s", "ttc_sbit_error_cnt", 100, True)]
+    failed = []
+    for text, name, value, clears in cases:
+        for at in (1, 5):
+            engine = AlarmEngine([PARSE_RULE(text, hold)], 1)
+            word, lsb, width = status_fields.FIELD[name].parts[-1]
+            words = np.zeros((1, status_fields.STATUS_WORDS), dtype=np.uint64)
+            events = []
+            for n in range(reads):
+                # the word changes once and stays
+                if n==at:
+                    words[0, word] = value << lsb
+                events += [up for board, rule, up in engine.update(words, float(n))]
+            expected = [True, False] if clears else [True]
+            if events!=expected:
+                failed.append('"'+text+'" after a change at read '+str(at)+': '+str(events))
+    return failed
+
+
+# help menu
+def HELP_MENU():
+    print('usage: python status_alarms.py [crate numbers] [slot numbers] [rules file] [options]')
+    print('       python status_alarms.py -t')
+    print('')
+    print('options:')
+    print('  -h       : show this help menu and exit')
+    print('  -r RATE  : reads per second (default 1)')
+    print('  -n COUNT : stop after COUNT reads (default: run until interrupted)')
+    print('  -d HOLD  : snapshots in a row a rule must hold (or fail) to raise (or clear) an')
+    print('             alarm, for rules without "for N" (default 3)')
+    print('  -j       : print one json object per alarm instead of text')
+    print('  -t       : check the alarm engine on made-up snapshots and exit')
+
+
+if __name__ == '__main__':
+    import fc7_client, fc7_fanout, status_poll
+
+    # engine check, no boards needed
+    if sys.argv[1:]==['-t']:
+        failed = CHECK()
+        for text in failed:
+            print(RED+'Check failed: '+text+RESET)
+        if not failed:
+            print('Alarm engine check passed.')
+        sys.exit(1 if failed else 0)
+
+    # check number of arguments
+    if len(sys.argv)<4:
+        HELP_MENU()
+        sys.exit(2)
+
+    # parse argument options
+    try:
+        opts, args = getopt.getopt(sys.argv[4:],"hr:n:d:j")
+    except getopt.GetoptError:
+        HELP_MENU()
+        sys.exit(2)
+
+    rate = 1.0
+    count = None
+    hold = 3
+    as_json = False
+    for opt, arg in opts:
+        if opt in ("-h"):
+            HELP_MENU()
+            sys.exit()
+        elif opt in ("-r"):
+            rate = float(arg)
+        elif opt in ("-n"):
+            count = int(arg)
+        elif opt in ("-d"):
+            hold = int(arg)
+        elif opt in ("-j"):
+            as_json = True
+
+    try:
+        rules = READ_RULES(sys.argv[3], hold)
+    except (IOError, ValueError) as e:
+        print('Rules error: '+str(e))
+        sys.exit(2)
+
+    boards = [(crate, slot, fc7_client.getDevice(crate, slot))
+              for crate in fc7_fanout.PARSE_ARG(sys.argv[1]) for slot in fc7_fanout.PARSE_ARG(sys.argv[2])]
+    engine = AlarmEngine(rules, len(boards))
+    words = np.zeros((len(boards), status_fields.STATUS_WORDS), dtype=np.uint64)
+    stamps = np.zeros(len(boards))
+
+    if not as_json:
+        print(GRAY+'Checking '+str(len(rules))+' rule(s) on '+str(len(boards))+' board(s) at '+str(rate)+
+              ' Hz, Ctrl-C to stop'+RESET)
+
+    try:
+        for snapshots in status_poll.POLL([fc7 for crate, slot, fc7 in boards], 1.0/rate, count):
+            valid = np.zeros(len(boards), dtype=bool)
+            for b, (stamp, new, error) in enumerate(snapshots):
+                if error is not None:
+                    print(RED+'crate '+boards[b][0]+' slot '+boards[b][1]+': read failed: '+error+RESET)
+                    continue
+                stamps[b] = stamp
+                words[b] = new
+                valid[b] = True
+
+            for b, r, raised in engine.update(words, stamps, valid):
+                crate, slot = boards[b][0], boards[b][1]
+                detail = engine.detail(b, r) if raised else []
+                if as_json:
+                    print(json.dumps({"time": round(stamps[b], 3), "crate": crate, "slot": slot, "rule": rules[r].text,
+                                      "state": "alarm" if raised else "clear", "signals": dict(detail)}))
+                else:
+                    print(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stamps[b]))+
+                          '  crate '+crate+' slot '+slot+'  '+(RED+'ALARM ' if raised else BLUE+'clear ')+
+                          rules[r].text+RESET+('  ('+', '.join(name+'='+value for name, value in detail)+')' if detail else ''))
+                sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,205 @@
+# FC7 status metrics exporter
+# Usage: python status_exporter.py [crate numbers] [slot numbers] [options]
+#
+# Serves decoded STATUS signals of a set of boards over local HTTP in the
+# Prometheus text format (GET /metrics). One poller thread per board reads the
+# STATUS block at a fixed interval and keeps the decoded values in a shared
+# cache; scrapes only format the cache, so they never cause IPbus traffic.
+# Each sample is labelled with its crate and slot, and fc7_up and
+# fc7_status_age_seconds tell whether a board's values are current. Fields
+# that pack one value per TTS port are exported as one sample per port, with
+# a port label (1-8, port 1 in the low bits).
+
+import sys, getopt, threading, time
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    # python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+import fc7_fanout, status_fields, status_poll
+
+# help menu
+def HELP_MENU():
+    print('usage: python status_exporter.py [crate numbers] [slot numbers] [options]')
+    print('')
+    print('options:')
+    print('  -h         : show this help menu and exit')
+    print('  -i SECONDS : seconds between reads of each board (default 5)')
+    print('  -p PORT    : HTTP port (default 9750)')
+    print('  -a ADDRESS : address to listen on (default 127.0.0.1)')
+
+# exported signals: (status signal, metric, type, help); the per-port fields
+# and the trig_type_num counters are exported separately, with port and type
+# labels
+METRICS = [
+    ("measured_temp",      "fc7_temperature_celsius",          "gauge",   "FPGA temperature"),
+    ("measured_vccint",    "fc7_vccint_volts",                 "gauge",   "FPGA VCCINT supply"),
+    ("measured_vccaux",    "fc7_vccaux_volts",                 "gauge",   "FPGA VCCAUX supply"),
+    ("measured_vccbram",   "fc7_vccbram_volts",                "gauge",   "FPGA VCCBRAM supply"),
+    ("over_temp",          "fc7_over_temp",                    "gauge",   "FPGA over-temperature bit"),
+    ("alarm_temp",         "fc7_alarm_temp",                   "gauge",   "FPGA temperature alarm bit"),
+    ("alarm_vccint",       "fc7_alarm_vccint",                 "gauge",   "FPGA VCCINT alarm bit"),
+    ("alarm_vccaux",       "fc7_alarm_vccaux",                 "gauge",   "FPGA VCCAUX alarm bit"),
+    ("alarm_vccbram",      "fc7_alarm_vccbram",                "gauge",   "FPGA VCCBRAM alarm bit"),
+    ("ttc_sbit_error_cnt", "fc7_ttc_sbit_errors",              "counter", "TTC single-bit errors"),
+    ("ttc_mbit_error_cnt", "fc7_ttc_mbit_errors",              "counter", "TTC multi-bit errors"),
+    ("local_tts_state",    "fc7_local_tts_state",              "gauge",   "Local TTS state"),
+    ("run_in_progress",    "fc7_run_in_progress",              "gauge",   "Run in progress bit"),
+    ("trig_num",           "fc7_trig_num",                     "counter", "Triggers in the run"),
+    ("aborted_cycles",     "fc7_aborted_cycles",               "counter", "Aborted cycles"),
+]
+
+# per-port signals: (status signal, metric, bits per port, help)
+PORT_METRICS = [
+    ("l12_tts_lock",       "fc7_l12_tts_lock",                 1,         "L12 TTS lock bit of each port"),
+    ("l8_tts_lock",        "fc7_l8_tts_lock",                  1,         "L8 TTS lock bit of each port"),
+    ("l12_tts_state",      "fc7_l12_tts_state",                4,         "L12 TTS state of each port"),
+    ("l8_tts_state",       "fc7_l8_tts_state",                 4,         "L8 TTS state of each port"),
+]
+PORTS = 8
+
+TRIG_TYPES = 32
+TRIG_TYPE_METRIC = "fc7_trig_type_num"
+
+SIGNALS = ([signal for signal, metric, kind, text in METRICS]+[signal for signal, metric, bits, text in PORT_METRICS]+
+           ["trig_type_num"+str(n) for n in range(TRIG_TYPES)])
+
+# decoded values of every board, written by the pollers and read by scrapes
+class StatusCache(object):
+    def __init__(self, boards):
+        self._lock = threading.Lock()
+        self._boards = list(boards)
+        self._values = dict((board, None) for board in self._boards)
+        self._stamps = dict((board, None) for board in self._boards)
+        self._up = dict((board, 0) for board in self._boards)
+
+    def update(self, board, values):
+        with self._lock:
+            self._values[board] = values
+            self._stamps[board] = time.time()
+            self._up[board] = 1
+
+    def failed(self, board):
+        with self._lock:
+            self._up[board] = 0
+
+    # Prometheus text exposition of the cache
+    def render(self):
+        with self._lock:
+            values = dict(self._values)
+            stamps = dict(self._stamps)
+            up = dict(self._up)
+        now = time.time()
+        labels = dict((board, 'crate="'+board[0]+'",slot="'+board[1]+'"') for board in self._boards)
+
+        lines = ['# HELP fc7_up Whether the last STATUS read of the board succeeded',
+                 '# TYPE fc7_up gauge']
+        lines += ['fc7_up{'+labels[board]+'} '+str(up[board]) for board in self._boards]
+        lines += ['# HELP fc7_status_age_seconds Seconds since the last successful STATUS read',
+                  '# TYPE fc7_status_age_seconds gauge']
+        lines += ['fc7_status_age_seconds{'+labels[board]+'} '+repr(round(now-stamps[board], 3))
+                  for board in self._boards if stamps[board] is not None]
+
+        # boards never read have no samples
+        boards = [board for board in self._boards if values[board] is not None]
+        for signal, metric, kind, text in METRICS:
+            lines += ['# HELP '+metric+' '+text, '# TYPE '+metric+' '+kind]
+            lines += [metric+'{'+labels[board]+'} '+repr(values[board][signal]) for board in boards]
+        for signal, metric, bits, text in PORT_METRICS:
+            lines += ['# HELP '+metric+' '+text, '# TYPE '+metric+' gauge']
+            for board in boards:
+                lines += [metric+'{'+labels[board]+',port="'+str(n+1)+'"} '+
+                          repr((int(values[board][signal]) >> (bits*n)) & ((1 << bits)-1)) for n in range(PORTS)]
+        lines += ['# HELP '+TRIG_TYPE_METRIC+' Triggers of each type in the run',
+                  '# TYPE '+TRIG_TYPE_METRIC+' counter']
+        for board in boards:
+            lines += [TRIG_TYPE_METRIC+'{'+labels[board]+',type="'+str(n)+'"} '+
+                      repr(values[board]["trig_type_num"+str(n)]) for n in range(TRIG_TYPES)]
+        return '\n'.join(lines)+'\n'
+
+
+# read one board for ever, keeping its values in the cache
+def POLL(cache, crate, slot, interval):
+    board = (crate, slot)
+    failing = False
+    for stamp, words, error in status_poll.POLL_BOARD(crate, slot, interval):
+        if error is None:
+            decoded = status_fields.DECODE(words, SIGNALS)
+            cache.update(board, dict((signal, status_fields.VALUE(status_fields.FIELD[signal], decoded[signal]))
+                                     for signal in SIGNALS))
+            failing = False
+            continue
+        cache.failed(board)
+        # report when a board stops answering, not at every attempt
+        if not failing:
+            sys.stderr.write('crate '+crate+' slot '+slot+': read failed: '+error+'\n')
+        failing = True
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = self.server.cache.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # scrapes are routine, keep them out of the log
+    def log_message(self, format, *args):
+        pass
+
+
+class ExporterServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+if __name__ == '__main__':
+    # check number of arguments
+    if len(sys.argv)<3:
+        HELP_MENU()
+        sys.exit(2)
+
+    # parse argument options
+    try:
+        opts, args = getopt.getopt(sys.argv[3:],"hi:p:a:")
+    except getopt.GetoptError:
+        HELP_MENU()
+        sys.exit(2)
+
+    interval = 5.0
+    port = 9750
+    address = '127.0.0.1'
+    for opt, arg in opts:
+        if opt in ("-h"):
+            HELP_MENU()
+            sys.exit()
+        elif opt in ("-i"):
+            interval = float(arg)
+        elif opt in ("-p"):
+            port = int(arg)
+        elif opt in ("-a"):
+            address = arg
+
+    boards = [(crate, slot) for crate in fc7_fanout.PARSE_ARG(sys.argv[1]) for slot in fc7_fanout.PARSE_ARG(sys.argv[2])]
+    cache = StatusCache(boards)
+    for crate, slot in boards:
+        poller = threading.Thread(target=POLL, args=(cache, crate, slot, interval))
+        poller.daemon = True
+        poller.start()
+
+    server = ExporterServer((address, port), MetricsHandler)
+    server.cache = cache
+    print('FC7 status exporter for '+str(len(boards))+' board(s) on http://'+address+':'+str(port)+'/metrics')
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,321 @@
+# FC7 STATUS block field table
+#
+# Every firmware signal in the 209-word STATUS block, as read by read_status.py:
+# its type letter as listed there (B/D/H/A, None for signals decoded but not
+# listed), the bit fields it is made of, most significant first, as
+# (word, lsb, width), and how it is displayed. DECODE extracts all of them from
+# the raw words at once, for one snapshot or a [sample, word] array of them:
+#
+#   values = status_fields.DECODE(words)
+#   print(status_fields.FORMAT(status_fields.FIELD["measured_temp"], values["measured_temp"]))
+#
+# Displays: "bin" binary digits, "dec" decimal (plus offset), "hex" zero-padded
+# hex digits, "float" value*scale+offset with two decimals and a unit, "ascii"
+# the bytes as text.
+
+import binascii
+from collections import namedtuple, OrderedDict
+import numpy as np
+
+STATUS_WORDS = 209
+
+Field = namedtuple("Field", "name kind parts display scale offset unit")
+Field.__new__.__defaults__ = (1, 0, "")
+
+FIELDS = [
+    Field("patch_rev",                         "H", [(  0,  0,  8)], "hex"),
+    Field("minor_rev",                         "H", [(  0,  8,  8)], "hex"),
+    Field("major_rev",                         "H", [(  0, 16,  8)], "hex"),
+    Field("board_type",                        "B", [(  0, 30,  2)], "bin"),
+    Field("board_id",                          "D", [(  1,  0, 12)], "dec", offset=-90),
+    Field("l12_fmc_id",                        "H", [(  1, 12,  8)], "hex"),
+    Field("l8_fmc_id",                         "H", [(  1, 20,  8)], "hex"),
+    Field("ttc_clk_lock",                      "D", [(  2,  0,  1)], "bin"),
+    Field("ext_clk_lock",                      "D", [(  2,  1,  1)], "bin"),
+    Field("ttc_ready",                         "D", [(  2,  2,  1)], "bin"),
+    Field("l12_tts_lock_mux",                  "D", [(  2,  3,  1)], "bin"),
+    Field("l8_tts_lock_mux",                   "D", [(  2,  4,  1)], "bin"),
+    Field("fmcs_ready",                        "D", [(  2,  5,  1)], "bin"),
+    Field("fmc_eeprom_error_i2c",              "D", [(  2,  6,  1)], "bin"),
+    Field("fmc_eeprom_error_id",               "D", [(  2,  7,  1)], "bin"),
+    Field("fmc_ids_valid",                     "D", [(  2,  8,  1)], "bin"),
+    Field("async_enable_sent",                 "D", [(  2, 11,  1)], "bin"),
+    Field("measured_temp",                     "D", [(  3,  4, 12)], "float", scale=503.975/4096.0, offset=-273.15, unit=u" \N{DEGREE SIGN}C"),
+    Field("measured_vccint",                   "D", [(  3, 20, 12)], "float", scale=3.0/4096.0, unit=" V"),
+    Field("measured_vccaux",                   "D", [(  4,  4, 12)], "float", scale=3.0/4096.0, unit=" V"),
+    Field("measured_vccbram",                  "D", [(  4, 20, 12)], "float", scale=3.0/4096.0, unit=" V"),
+    Field("over_temp",                         "D", [(  5,  0,  1)], "bin"),
+    Field("alarm_temp",                        "D", [(  5,  1,  1)], "bin"),
+    Field("alarm_vccint",                      "D", [(  5,  2,  1)], "bin"),
+    Field("alarm_vccaux",                      "D", [(  5,  3,  1)], "bin"),
+    Field("alarm_vccbram",                     "D", [(  5,  4,  1)], "bin"),
+    Field("l12_eeprom_reg_out",                "H", [(  9,  0, 32), (  8,  0, 32), (  7,  0, 32), (  6,  0, 32)], "hex"),
+    Field("l8_eeprom_reg_out",                 "H", [( 13,  0, 32), ( 12,  0, 32), ( 11,  0, 32), ( 10,  0, 32)], "hex"),
+    Field("error_l12_fmc_absent",              "D", [( 14,  0,  1)], "bin"),
+    Field("error_l12_fmc_mod_type",            "D", [( 14,  1,  1)], "bin"),
+    Field("error_l12_fmc_int_n",               "D", [( 14,  2,  1)], "bin"),
+    Field("error_l12_startup_i2c",             "D", [( 14,  3,  1)], "bin"),
+    Field("sfp_en_error_l12_mod_abs",          "B", [( 14,  4,  8)], "bin"),
+    Field("sfp_en_error_l12_sfp_type",         "B", [( 14, 12,  2)], "bin"),
+    Field("sfp_en_error_l12_tx_fault",         "B", [( 14, 14,  8)], "bin"),
+    Field("sfp_en_error_l12_sfp_alarms",       "B", [( 14, 22,  1)], "bin"),
+    Field("sfp_en_error_l12_i2c_chip",         None, [( 14, 23,  1)], "bin"),
+    Field("error_l8_fmc_absent",               "D", [( 15,  0,  1)], "bin"),
+    Field("error_l8_fmc_mod_type",             "D", [( 15,  1,  1)], "bin"),
+    Field("error_l8_fmc_int_n",                "D", [( 15,  2,  1)], "bin"),
+    Field("error_l8_startup_i2c",              "D", [( 15,  3,  1)], "bin"),
+    Field("sfp_en_error_l8_mod_abs",           "B", [( 15,  4,  8)], "bin"),
+    Field("sfp_en_error_l8_sfp_type",          "B", [( 15, 12,  2)], "bin"),
+    Field("sfp_en_error_l8_tx_fault",          "B", [( 15, 14,  8)], "bin"),
+    Field("sfp_en_error_l8_sfp_alarms",        "B", [( 15, 22,  1)], "bin"),
+    Field("sfp_en_error_l8_i2c_chip",          None, [( 15, 23,  1)], "bin"),
+    Field("sfp_en_alarm_l12_temp_high",        "B", [( 16,  0,  8)], "bin"),
+    Field("sfp_en_alarm_l12_temp_low",         "B", [( 16,  8,  8)], "bin"),
+    Field("sfp_en_alarm_l12_vcc_high",         "B", [( 16, 16,  8)], "bin"),
+    Field("sfp_en_alarm_l12_vcc_low",          "B", [( 16, 24,  8)], "bin"),
+    Field("sfp_en_alarm_l12_tx_bias_high",     "B", [( 17,  0,  8)], "bin"),
+    Field("sfp_en_alarm_l12_tx_bias_low",      "B", [( 17,  8,  8)], "bin"),
+    Field("sfp_en_alarm_l12_tx_power_high",    "B", [( 17, 16,  8)], "bin"),
+    Field("sfp_en_alarm_l12_tx_power_low",     "B", [( 17, 24,  8)], "bin"),
+    Field("sfp_en_alarm_l12_rx_power_high",    "B", [( 18,  0,  8)], "bin"),
+    Field("sfp_en_alarm_l12_rx_power_low",     "B", [( 18,  8,  8)], "bin"),
+    Field("sfp_en_alarm_l8_temp_high",         "B", [( 19,  0,  8)], "bin"),
+    Field("sfp_en_alarm_l8_temp_low",          "B", [( 19,  8,  8)], "bin"),
+    Field("sfp_en_alarm_l8_vcc_high",          "B", [( 19, 16,  8)], "bin"),
+    Field("sfp_en_alarm_l8_vcc_low",           "B", [( 19, 24,  8)], "bin"),
+    Field("sfp_en_alarm_l8_tx_bias_high",      "B", [( 20,  0,  8)], "bin"),
+    Field("sfp_en_alarm_l8_tx_bias_low",       "B", [( 20,  8,  8)], "bin"),
+    Field("sfp_en_alarm_l8_tx_power_high",     "B", [( 20, 16,  8)], "bin"),
+    Field("sfp_en_alarm_l8_tx_power_low",      "B", [( 20, 24,  8)], "bin"),
+    Field("sfp_en_alarm_l8_rx_power_high",     "B", [( 21,  0,  8)], "bin"),
+    Field("sfp_en_alarm_l8_rx_power_low",      "B", [( 21,  8,  8)], "bin"),
+    Field("sfp_en_warning_l12_temp_high",      "B", [( 22,  0,  8)], "bin"),
+    Field("sfp_en_warning_l12_temp_low",       "B", [( 22,  8,  8)], "bin"),
+    Field("sfp_en_warning_l12_vcc_high",       "B", [( 22, 16,  8)], "bin"),
+    Field("sfp_en_warning_l12_vcc_low",        "B", [( 22, 24,  8)], "bin"),
+    Field("sfp_en_warning_l12_tx_bias_high",   "B", [( 23,  0,  8)], "bin"),
+    Field("sfp_en_warning_l12_tx_bias_low",    "B", [( 23,  8,  8)], "bin"),
+    Field("sfp_en_warning_l12_tx_power_high",  "B", [( 23, 16,  8)], "bin"),
+    Field("sfp_en_warning_l12_tx_power_low",   "B", [( 23, 24,  8)], "bin"),
+    Field("sfp_en_warning_l12_rx_power_high",  "B", [( 24,  0,  8)], "bin"),
+    Field("sfp_en_warning_l12_rx_power_low",   "B", [( 24,  8,  8)], "bin"),
+    Field("sfp_en_warning_l8_temp_high",       "B", [( 25,  0,  8)], "bin"),
+    Field("sfp_en_warning_l8_temp_low",        "B", [( 25,  8,  8)], "bin"),
+    Field("sfp_en_warning_l8_vcc_high",        "B", [( 25, 16,  8)], "bin"),
+    Field("sfp_en_warning_l8_vcc_low",         "B", [( 25, 24,  8)], "bin"),
+    Field("sfp_en_warning_l8_tx_bias_high",    "B", [( 26,  0,  8)], "bin"),
+    Field("sfp_en_warning_l8_tx_bias_low",     "B", [( 26,  8,  8)], "bin"),
+    Field("sfp_en_warning_l8_tx_power_high",   "B", [( 26, 16,  8)], "bin"),
+    Field("sfp_en_warning_l8_tx_power_low",    "B", [( 26, 24,  8)], "bin"),
+    Field("sfp_en_warning_l8_rx_power_high",   "B", [( 27,  0,  8)], "bin"),
+    Field("sfp_en_warning_l8_rx_power_low",    "B", [( 27,  8,  8)], "bin"),
+    Field("sfp_l12_enabled_ports",             "B", [( 28,  0,  8)], "bin"),
+    Field("sfp_l8_enabled_ports",              "B", [( 28,  8,  8)], "bin"),
+    Field("sfp_l12_mod_abs",                   "B", [( 29,  0,  8)], "bin"),
+    Field("change_l12_mod_abs",                "B", [( 29,  8,  8)], "bin"),
+    Field("change_error_l12_mod_abs",          "B", [( 29, 16,  8)], "bin"),
+    Field("sfp_l8_mod_abs",                    "B", [( 30,  0,  8)], "bin"),
+    Field("change_l8_mod_abs",                 "B", [( 30,  8,  8)], "bin"),
+    Field("change_error_l8_mod_abs",           "B", [( 30, 16,  8)], "bin"),
+    Field("sfp_l12_tx_fault",                  "B", [( 31,  0,  8)], "bin"),
+    Field("change_l12_tx_fault",               "B", [( 31,  8,  8)], "bin"),
+    Field("change_error_l12_tx_fault",         "B", [( 31, 16,  8)], "bin"),
+    Field("sfp_l8_tx_fault",                   "B", [( 32,  0,  8)], "bin"),
+    Field("change_l8_tx_fault",                "B", [( 32,  8,  8)], "bin"),
+    Field("change_error_l8_tx_fault",          "B", [( 32, 16,  8)], "bin"),
+    Field("sfp_l12_rx_los",                    "B", [( 33,  0,  8)], "bin"),
+    Field("change_l12_rx_los",                 "B", [( 33,  8,  8)], "bin"),
+    Field("change_error_l12_rx_los",           "B", [( 33, 16,  8)], "bin"),
+    Field("sfp_l8_rx_los",                     "B", [( 34,  0,  8)], "bin"),
+    Field("change_l8_rx_los",                  "B", [( 34,  8,  8)], "bin"),
+    Field("change_error_l8_rx_los",            "B", [( 34, 16,  8)], "bin"),
+    Field("l12_tts_lock",                      "B", [( 35,  0,  8)], "bin"),
+    Field("l8_tts_lock",                       "B", [( 35,  8,  8)], "bin"),
+    Field("l12_tts_state",                     "B", [( 36,  0, 32)], "bin"),
+    Field("l8_tts_state",                      "B", [( 37,  0, 32)], "bin"),
+    Field("system_status",                     "B", [( 38,  0,  6)], "bin"),
+    Field("local_tts_state",                   "B", [( 38,  6,  4)], "bin"),
+    Field("l12_tts_status",                    "B", [( 38, 10,  6)], "bin"),
+    Field("l8_tts_status",                     "B", [( 38, 16,  6)], "bin"),
+    Field("ts_state",                          "B", [( 41, 29,  1), ( 39,  0, 16)], "bin"),
+    Field("eb_state",                          "B", [( 40, 29,  1), ( 39, 16, 16)], "bin"),
+    Field("tis_state",                         "B", [( 44, 22,  2)], "bin"),
+    Field("l12_fs_state",                      "B", [( 40,  0, 28)], "bin"),
+    Field("l12_st_state",                      "B", [( 40, 28,  1), ( 42,  0, 32)], "bin"),
+    Field("l8_fs_state",                       "B", [( 41,  0, 28)], "bin"),
+    Field("l8_st_state",                       "B", [( 41, 28,  1), ( 43,  0, 32)], "bin"),
+    Field("l12_ssc_state",                     "B", [( 44,  0, 11)], "bin"),
+    Field("l8_ssc_state",                      "B", [( 44, 11, 11)], "bin"),
+    Field("l12_sgr_state",                     "B", [( 45,  0,  7)], "bin"),
+    Field("l8_sgr_state",                      "B", [( 45,  7,  7)], "bin"),
+    Field("fe_state",                          "B", [( 45, 14, 11)], "bin"),
+    Field("run_in_progress",                   "D", [( 46,  0,  1)], "bin"),
+    Field("doing_run_checks",                  "D", [( 46,  1,  1)], "bin"),
+    Field("resetting_clients",                 "D", [( 46,  2,  1)], "bin"),
+    Field("finding_cycle_start",               "D", [( 46,  3,  1)], "bin"),
+    Field("run_aborted",                       "D", [( 46,  4,  1)], "bin"),
+    Field("trig_index",                        "D", [( 46,  5,  4)], "dec"),
+    Field("trig_sub_index",                    "D", [( 46,  9,  4)], "dec"),
+    Field("trig_num",                          "D", [( 47,  0, 24)], "dec"),
+    Field("trig_timestamp",                    "D", [( 49,  0, 12), ( 48,  0, 32)], "dec"),
+    Field("ttc_sbit_error_cnt",                "D", [( 50,  0, 32)], "dec"),
+    Field("ttc_mbit_error_cnt",                "D", [( 51,  0, 32)], "dec"),
+    Field("error_ttc_sbit_limit",              "D", [( 52,  0,  1)], "bin"),
+    Field("error_ttc_mbit_limit",              "D", [( 52,  1,  1)], "bin"),
+    Field("ofw_trig_count_running",            "D", [( 52,  4, 24)], "dec"),
+    Field("ofw_trig_count",                    "D", [( 53,  0, 24)], "dec"),
+    Field("ofw_limit_reached",                 "D", [( 53, 24,  1)], "bin"),
+    Field("l12_tts_tap_delay_1",               "D", [( 54,  0,  5)], "bin"),
+    Field("l12_tts_tap_delay_2",               "D", [( 54,  5,  5)], "bin"),
+    Field("l12_tts_tap_delay_3",               "D", [( 54, 10,  5)], "bin"),
+    Field("l12_tts_tap_delay_4",               "D", [( 54, 15,  5)], "bin"),
+    Field("l12_tts_tap_delay_5",               "D", [( 55,  0,  5)], "bin"),
+    Field("l12_tts_tap_delay_6",               "D", [( 55,  5,  5)], "bin"),
+    Field("l12_tts_tap_delay_7",               "D", [( 55, 10,  5)], "bin"),
+    Field("l12_tts_tap_delay_8",               "D", [( 55, 15,  5)], "bin"),
+    Field("l8_tts_tap_delay_1",                "D", [( 56,  0,  5)], "bin"),
+    Field("l8_tts_tap_delay_2",                "D", [( 56,  5,  5)], "bin"),
+    Field("l8_tts_tap_delay_3",                "D", [( 56, 10,  5)], "bin"),
+    Field("l8_tts_tap_delay_4",                "D", [( 56, 15,  5)], "bin"),
+    Field("l8_tts_tap_delay_5",                "D", [( 57,  0,  5)], "bin"),
+    Field("l8_tts_tap_delay_6",                "D", [( 57,  5,  5)], "bin"),
+    Field("l8_tts_tap_delay_7",                "D", [( 57, 10,  5)], "bin"),
+    Field("l8_tts_tap_delay_8",                "D", [( 57, 15,  5)], "bin"),
+    Field("sfp_l12_sn0",                       "A", [( 67,  0, 32), ( 66,  0, 32), ( 65,  0, 32), ( 64,  0, 32)], "ascii"),
+    Field("sfp_l12_sn1",                       "A", [( 71,  0, 32), ( 70,  0, 32), ( 69,  0, 32), ( 68,  0, 32)], "ascii"),
+    Field("sfp_l12_sn2",                       "A", [( 75,  0, 32), ( 74,  0, 32), ( 73,  0, 32), ( 72,  0, 32)], "ascii"),
+    Field("sfp_l12_sn3",                       "A", [( 79,  0, 32), ( 78,  0, 32), ( 77,  0, 32), ( 76,  0, 32)], "ascii"),
+    Field("sfp_l12_sn4",                       "A", [( 83,  0, 32), ( 82,  0, 32), ( 81,  0, 32), ( 80,  0, 32)], "ascii"),
+    Field("sfp_l12_sn5",                       "A", [( 87,  0, 32), ( 86,  0, 32), ( 85,  0, 32), ( 84,  0, 32)], "ascii"),
+    Field("sfp_l12_sn6",                       "A", [( 91,  0, 32), ( 90,  0, 32), ( 89,  0, 32), ( 88,  0, 32)], "ascii"),
+    Field("sfp_l12_sn7",                       "A", [( 95,  0, 32), ( 94,  0, 32), ( 93,  0, 32), ( 92,  0, 32)], "ascii"),
+    Field("sfp_l8_sn0",                        "A", [( 99,  0, 32), ( 98,  0, 32), ( 97,  0, 32), ( 96,  0, 32)], "ascii"),
+    Field("sfp_l8_sn1",                        "A", [(103,  0, 32), (102,  0, 32), (101,  0, 32), (100,  0, 32)], "ascii"),
+    Field("sfp_l8_sn2",                        "A", [(107,  0, 32), (106,  0, 32), (105,  0, 32), (104,  0, 32)], "ascii"),
+    Field("sfp_l8_sn3",                        "A", [(111,  0, 32), (110,  0, 32), (109,  0, 32), (108,  0, 32)], "ascii"),
+    Field("sfp_l8_sn4",                        "A", [(115,  0, 32), (114,  0, 32), (113,  0, 32), (112,  0, 32)], "ascii"),
+    Field("sfp_l8_sn5",                        "A", [(119,  0, 32), (118,  0, 32), (117,  0, 32), (116,  0, 32)], "ascii"),
+    Field("sfp_l8_sn6",                        "A", [(123,  0, 32), (122,  0, 32), (121,  0, 32), (120,  0, 32)], "ascii"),
+    Field("sfp_l8_sn7",                        "A", [(127,  0, 32), (126,  0, 32), (125,  0, 32), (124,  0, 32)], "ascii"),
+    Field("trig_type_num0",                    "D", [(128,  0, 24)], "dec"),
+    Field("trig_type_num1",                    "D", [(129,  0, 24)], "dec"),
+    Field("trig_type_num2",                    "D", [(130,  0, 24)], "dec"),
+    Field("trig_type_num3",                    "D", [(131,  0, 24)], "dec"),
+    Field("trig_type_num4",                    "D", [(132,  0, 24)], "dec"),
+    Field("trig_type_num5",                    "D", [(133,  0, 24)], "dec"),
+    Field("trig_type_num6",                    "D", [(134,  0, 24)], "dec"),
+    Field("trig_type_num7",                    "D", [(135,  0, 24)], "dec"),
+    Field("trig_type_num8",                    "D", [(136,  0, 24)], "dec"),
+    Field("trig_type_num9",                    "D", [(137,  0, 24)], "dec"),
+    Field("trig_type_num10",                   "D", [(138,  0, 24)], "dec"),
+    Field("trig_type_num11",                   "D", [(139,  0, 24)], "dec"),
+    Field("trig_type_num12",                   "D", [(140,  0, 24)], "dec"),
+    Field("trig_type_num13",                   "D", [(141,  0, 24)], "dec"),
+    Field("trig_type_num14",                   "D", [(142,  0, 24)], "dec"),
+    Field("trig_type_num15",                   "D", [(143,  0, 24)], "dec"),
+    Field("trig_type_num16",                   "D", [(144,  0, 24)], "dec"),
+    Field("trig_type_num17",                   "D", [(145,  0, 24)], "dec"),
+    Field("trig_type_num18",                   "D", [(146,  0, 24)], "dec"),
+    Field("trig_type_num19",                   "D", [(147,  0, 24)], "dec"),
+    Field("trig_type_num20",                   "D", [(148,  0, 24)], "dec"),
+    Field("trig_type_num21",                   "D", [(149,  0, 24)], "dec"),
+    Field("trig_type_num22",                   "D", [(150,  0, 24)], "dec"),
+    Field("trig_type_num23",                   "D", [(151,  0, 24)], "dec"),
+    Field("trig_type_num24",                   "D", [(152,  0, 24)], "dec"),
+    Field("trig_type_num25",                   "D", [(153,  0, 24)], "dec"),
+    Field("trig_type_num26",                   "D", [(154,  0, 24)], "dec"),
+    Field("trig_type_num27",                   "D", [(155,  0, 24)], "dec"),
+    Field("trig_type_num28",                   "D", [(156,  0, 24)], "dec"),
+    Field("trig_type_num29",                   "D", [(157,  0, 24)], "dec"),
+    Field("trig_type_num30",                   "D", [(158,  0, 24)], "dec"),
+    Field("trig_type_num31",                   "D", [(159,  0, 24)], "dec"),
+    Field("aborted_cycles",                    "D", [(195,  0, 32)], "dec"),
+    Field("next_up_state",                     "D", [(202,  0, 18)], "bin"),
+]
+
+FIELD = dict((field.name, field) for field in FIELDS)
+
+
+def WIDTH(field):
+    return sum(width for word, lsb, width in field.parts)
+
+
+# every part of every field as arrays of word index, lsb and mask, for each
+# field its range of parts, and for each word the fields that use it
+_WORD  = np.array([word for field in FIELDS for word, lsb, width in field.parts], dtype=np.intp)
+_LSB   = np.array([lsb for field in FIELDS for word, lsb, width in field.parts], dtype=np.uint64)
+_MASK  = np.array([(1 << width)-1 for field in FIELDS for word, lsb, width in field.parts], dtype=np.uint64)
+_FIRST = np.cumsum([0]+[len(field.parts) for field in FIELDS])
+_INDEX = dict((field.name, n) for n, field in enumerate(FIELDS))
+_USERS = [[] for word in range(STATUS_WORDS)]
+for n, field in enumerate(FIELDS):
+    for word in sorted(set(word for word, lsb, width in field.parts)):
+        _USERS[word].append(n)
+
+
+# values of fields (all of them, or the names given) from raw STATUS words
+# [..., word]: integers, or arrays of them for several snapshots; fields over
+# 64 bits are python integers. Only the parts of the fields asked for are
+# extracted
+def DECODE(words, fields=None):
+    words = np.asarray(words, dtype=np.uint64)
+    if fields is None:
+        numbers = range(len(FIELDS))
+        positions = slice(None)
+    else:
+        numbers = sorted(_INDEX[name] for name in fields)
+        positions = np.array([p for n in numbers for p in range(_FIRST[n], _FIRST[n+1])], dtype=np.intp)
+    parts = (words[..., _WORD[positions]] >> _LSB[positions]) & _MASK[positions]
+
+    values = OrderedDict()
+    first = 0
+    for n in numbers:
+        field = FIELDS[n]
+        if len(field.parts)==1:
+            value = parts[..., first]
+        else:
+            wide = WIDTH(field) > 64
+            value = parts[..., first].astype(object) if wide else parts[..., first]
+            for p, (word, lsb, width) in enumerate(field.parts[1:]):
+                part = parts[..., first+1+p]
+                value = (value << (int(width) if wide else np.uint64(width))) | (part.astype(object) if wide else part)
+        values[field.name] = int(value) if np.ndim(value)==0 else value
+        first += len(field.parts)
+    return values
+
+
+# names of the fields (of those given, or all) that use a word that differs
+# between two snapshots, in table order
+def CHANGED(old, new, fields=None):
+    words = np.flatnonzero(np.asarray(old, dtype=np.uint64)!=np.asarray(new, dtype=np.uint64))
+    numbers = sorted(set(n for word in words for n in _USERS[word]))
+    names = [FIELDS[n].name for n in numbers]
+    if fields is not None:
+        names = [name for name in names if name in fields]
+    return names
+
+
+# a field value as a number in the unit it is displayed in: scaled for
+# "float", with the offset for "dec", unchanged otherwise; works on arrays
+def VALUE(field, value):
+    if field.display=="float":
+        return value*field.scale+field.offset
+    if field.display=="dec" and field.offset:
+        return value+field.offset
+    return value
+
+
+# a field value as read_status.py prints it
+def FORMAT(field, value):
+    value = int(value)
+    if field.display=="bin":
+        return format(value, "0"+str(WIDTH(field))+"b")
+    if field.display=="dec":
+        return str(value+field.offset)
+    if field.display=="hex":
+        return ('%x' % value).zfill((WIDTH(field)+3)//4)
+    if field.display=="float":
+        return '%.2f' % (value*field.scale+field.offset) + field.unit
+    if field.display=="ascii":
+        return binascii.unhexlify(('%x' % value).zfill(8)).decode("utf-8")
+    raise ValueError("unknown display "+str(field.display)+" for "+field.name)
@@ -0,0 +1,70 @@
+# FC7 STATUS polling
+#
+# The status tools read the 209-word STATUS block of their boards on a fixed
+# schedule. POLL reads a list of devices in turn, once per period, and yields
+# the snapshots of each round, one per device:
+#
+#   for snapshots in status_poll.POLL(devices, 1.0):
+#       for stamp, words, error in snapshots:
+#           ...
+#
+# POLL_BOARD does the same for one board, for a poller thread of its own,
+# connecting when it first can. A failed read gives no words and the error
+# text, so a board that stops answering does not hold up the others.
+
+import time
+import fc7_client, status_fields
+
+
+# the STATUS words of a device, in one dispatch; IOError if the block is short
+def READ(fc7):
+    regs = fc7.getNode("STATUS").readBlock(status_fields.STATUS_WORDS)
+    fc7.dispatch()
+    words = [int(v) for v in regs.value()]
+    if len(words)!=status_fields.STATUS_WORDS:
+        raise IOError(str(len(words))+' words')
+    return words
+
+
+# (time, words, None) of a read, or (time, None, error) if it failed
+def _snapshot(fc7):
+    try:
+        words = READ(fc7)
+    except Exception as e:
+        return time.time(), None, str(e)
+    return time.time(), words, None
+
+
+# one step per period, for count steps (default: for ever)
+def _schedule(period, count=None):
+    start = time.time()
+    steps = 0
+    while count is None or steps < count:
+        yield steps
+        # keep to the schedule rather than sleeping a full period after each read
+        steps += 1
+        delay = start+steps*period-time.time()
+        if delay > 0:
+            time.sleep(delay)
+        elif delay < -period:
+            # too far behind (slow board or suspended process): skip the missed reads
+            start -= delay
+
+
+# snapshots of every device, a list per round, one round per period
+def POLL(devices, period, count=None):
+    for step in _schedule(period, count):
+        yield [_snapshot(fc7) for fc7 in devices]
+
+
+# snapshots of one board, one per period, over one connection
+def POLL_BOARD(crate, slot, period, count=None):
+    fc7 = None
+    for step in _schedule(period, count):
+        if fc7 is None:
+            try:
+                fc7 = fc7_client.getDevice(crate, slot)
+            except Exception as e:
+                yield time.time(), None, str(e)
+                continue
+        yield _snapshot(fc7)
@@ -0,0 +1,108 @@
+# FC7 STATUS snapshot ring file
+#
+# A fixed-size file of timestamped raw STATUS snapshots (all 209 words) from any
+# number of boards, written round-robin so that it always holds the latest
+# ones. The file is memory-mapped: appending writes one record in place and
+# reading a time range looks at only the records it needs, found by binary
+# search on the timestamps.
+#
+#   ring = status_ring.StatusRing("status.ring", capacity=100000)
+#   ring.append(time.time(), 1, 5, words)
+#   records = status_ring.StatusRing("status.ring").select(begin, end)
+#   values = status_fields.DECODE(records["words"], ["l12_tts_state"])
+#
+# Timestamps are expected to increase from one append to the next.
+
+import os
+import numpy as np
+import status_fields
+
+MAGIC   = b"FC7RING1"
+VERSION = 1
+
+HEADER = np.dtype([("magic", "S8"), ("version", "<u4"), ("words", "<u4"),
+                   ("capacity", "<u8"), ("written", "<u8"), ("reserved", "<u8", (4,))])
+
+RECORD = np.dtype([("time", "<f8"), ("crate", "<u2"), ("slot", "<u2"), ("reserved", "<u4"),
+                   ("words", "<u4", (status_fields.STATUS_WORDS,))])
+
+
+class StatusRing(object):
+    # open a ring file, creating it with room for capacity snapshots if it does
+    # not exist; writable is needed to append
+    def __init__(self, path, capacity=None, writable=False):
+        self.path = path
+        if not os.path.exists(path):
+            if capacity is None:
+                raise IOError("no status ring file "+path)
+            header = np.zeros(1, dtype=HEADER)
+            header["magic"] = MAGIC
+            header["version"] = VERSION
+            header["words"] = status_fields.STATUS_WORDS
+            header["capacity"] = capacity
+            with open(path, "wb") as outfile:
+                outfile.write(header.tobytes())
+                outfile.truncate(HEADER.itemsize+int(capacity)*RECORD.itemsize)
+            writable = True
+
+        mode = "r+" if writable else "r"
+        self.header = np.memmap(path, dtype=HEADER, mode=mode, shape=(1,))
+        if self.header["magic"][0]!=MAGIC or int(self.header["version"][0])!=VERSION \
+           or int(self.header["words"][0])!=status_fields.STATUS_WORDS:
+            raise ValueError(path+" is not a status ring file")
+        if capacity is not None and int(capacity)!=self.capacity:
+            raise ValueError(path+" holds "+str(self.capacity)+" snapshots, not "+str(capacity))
+        self.records = np.memmap(path, dtype=RECORD, mode=mode, offset=HEADER.itemsize, shape=(self.capacity,))
+
+    @property
+    def capacity(self):
+        return int(self.header["capacity"][0])
+
+    @property
+    def written(self):
+        return int(self.header["written"][0])
+
+    def __len__(self):
+        return min(self.written, self.capacity)
+
+    # add one snapshot; the record is complete before the count moves on
+    def append(self, stamp, crate, slot, words):
+        written = self.written
+        record = self.records[written % self.capacity]
+        record["time"] = stamp
+        record["crate"] = int(crate)
+        record["slot"] = int(slot)
+        record["words"] = words
+        self.header["written"][0] = written+1
+
+    def flush(self):
+        self.records.flush()
+        self.header.flush()
+
+    # record positions in the file of snapshots first to last, oldest first
+    def _position(self, index):
+        return (self.written-len(self)+index) % self.capacity
+
+    # index of the first snapshot taken at or after a time
+    def _search(self, stamp):
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low+high)//2
+            if self.records["time"][self._position(middle)] < stamp:
+                low = middle+1
+            else:
+                high = middle
+        return low
+
+    # snapshots with begin <= time < end (either may be None), oldest first,
+    # as a RECORD array; only those records are read from the file
+    def select(self, begin=None, end=None):
+        first = 0 if begin is None else self._search(begin)
+        last = len(self) if end is None else self._search(end)
+        if last <= first:
+            return np.zeros(0, dtype=RECORD)
+        start = self._position(first)
+        stop = start+(last-first)
+        if stop <= self.capacity:
+            return np.array(self.records[start:stop])
+        return np.concatenate([self.records[start:], self.records[:stop-self.capacity]])
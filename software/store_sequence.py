@@ -0,0 +1,68 @@
+# Encoder FC7 sequencer storage script
+# Usage: python store_sequence.py [crate] [slot] [csv file] [options]
+#
+# Programs the whole TTC sequencer from a TTC csv file (GetTriggerValuesFromDB.py
+# --type ttc): SEQ.COUNT, every SEQn.COUNT and the gap and type of every
+# trigger, as block writes in one dispatch that also reads them back.
+
+import fc7_client, fc7_fanout, ttc_sequencer, sys, getopt
+
+# colors
+RED   = "\033[0;31m"
+RESET = "\033[m\017"
+
+# crate/slot lists run the script once per board
+fc7_fanout.FANOUT()
+
+# help menu
+def HELP_MENU():
+    print( 'usage: python store_sequence.py [crate] [slot] [csv file] [options]')
+    print( '')
+    print( 'options:')
+    print( '  -h : show this help menu and exit')
+    print( '  -t : gaps in the file are in clock ticks rather than ns')
+    print( '  -n : do not read back to verify')
+
+# check number of arguments
+if len(sys.argv)<4:
+    HELP_MENU()
+    sys.exit(2)
+
+# parse argument options
+try:
+    opts, args = getopt.getopt(sys.argv[4:],"htn")
+except getopt.GetoptError:
+    HELP_MENU()
+    sys.exit(2)
+
+ticks = False
+verify = True
+for opt, arg in opts:
+    if opt in ("-h"):
+        HELP_MENU()
+        sys.exit()
+    elif opt in ("-t"):
+        ticks = True
+    elif opt in ("-n"):
+        verify = False
+
+# .csv file format:
+# [sequence], [index], [gap], [type]
+
+# read and verify settings
+table, errors = ttc_sequencer.READ_CHECKED(sys.argv[3], ticks)
+for error in errors:
+    print( 'File format error: '+error+'!')
+if errors:
+    sys.exit(2)
+
+fc7 = fc7_client.getDevice(sys.argv[1], sys.argv[2])
+
+# write registers
+errors = ttc_sequencer.WRITE_BOARD(fc7, table, verify=verify)
+for address, expected, read in errors:
+    print( RED+'Verify error: 0x%08x wrote 0x%08x read 0x%08x' % (address, expected, read)+RESET)
+if errors:
+    sys.exit(1)
+
+print( str(table.count+1)+' sequence(s), '+str(len(table.rows()))+' trigger(s) stored successfully!')
@@ -0,0 +1,177 @@
+# Analog trigger register addressing
+#
+# Address and mask arrays for the DELAY and WIDTH trigger blocks, indexed
+# [channel, sequence, loop, pulse] (enables [channel, sequence, pulse]), built
+# once from the address table so that whole tables can be read and written
+# without building node names or looking nodes up one by one:
+#
+#   addresses = trigger_addresses.ADDRESSES(fc7)
+#   loops = trigger_addresses.READ_WORDS(fc7, addresses.delay, addresses.delay_mask)
+#   delays = trigger_codec.DECODE_DELAY(loops)            # [channel, sequence, pulse]
+#
+# Channels, sequences, loops and pulses are counted from 0 here, as in the
+# node names. The number of channels is that of the table the board was
+# opened with (its DELAY.CHANn and WIDTH.CHANn nodes).
+
+import numpy as np
+import fc7_address_table, trigger_codec
+
+SEQUENCES   = 16
+PULSES      = 4
+DELAY_LOOPS = trigger_codec.DELAY_LOOPS
+WIDTH_LOOPS = trigger_codec.WIDTH_LOOPS
+
+
+# number of analog trigger channels in an address table: CHAN0, CHAN1, ...
+# present under both DELAY and WIDTH
+def TABLE_CHANNELS(table):
+    channels = 0
+    while "DELAY.CHAN"+str(channels) in table and "WIDTH.CHAN"+str(channels) in table:
+        channels += 1
+    return channels
+
+
+class TriggerAddresses(object):
+    def __init__(self, table):
+        self.channels = TABLE_CHANNELS(table)
+        shape = (self.channels, SEQUENCES)
+        self.delay = np.zeros(shape+(DELAY_LOOPS, PULSES), dtype=np.uint32)
+        self.delay_mask = np.zeros(shape+(DELAY_LOOPS, PULSES), dtype=np.uint32)
+        self.width = np.zeros(shape+(WIDTH_LOOPS, PULSES), dtype=np.uint32)
+        self.width_mask = np.zeros(shape+(WIDTH_LOOPS, PULSES), dtype=np.uint32)
+        self.enable = np.zeros(shape+(PULSES,), dtype=np.uint32)
+        self.enable_mask = np.zeros(shape+(PULSES,), dtype=np.uint32)
+
+        for channel in range(self.channels):
+            for sequence in range(SEQUENCES):
+                prefix = "CHAN"+str(channel)+".SEQ"+str(sequence)
+                for pulse in range(PULSES):
+                    for loop in range(DELAY_LOOPS):
+                        node = table.node("DELAY."+prefix+".LOOP"+str(loop)+"_PULSE"+str(pulse))
+                        self.delay[channel, sequence, loop, pulse] = node.address
+                        self.delay_mask[channel, sequence, loop, pulse] = node.mask
+                    for loop in range(WIDTH_LOOPS):
+                        node = table.node("WIDTH."+prefix+".LOOP"+str(loop)+"_PULSE"+str(pulse))
+                        self.width[channel, sequence, loop, pulse] = node.address
+                        self.width_mask[channel, sequence, loop, pulse] = node.mask
+                    node = table.node("WIDTH."+prefix+".ENABLE_PULSE"+str(pulse))
+                    self.enable[channel, sequence, pulse] = node.address
+                    self.enable_mask[channel, sequence, pulse] = node.mask
+
+
+# trigger addresses for a device, from the table it was opened with
+# (fc7_address_table.DEVICE_TABLE)
+def ADDRESSES(fc7):
+    return TriggerAddresses(fc7_address_table.DEVICE_TABLE(fc7))
+
+
+# fc7_address_table.SHIFT of every mask of an array, at once
+def SHIFTS(masks):
+    masks = np.asarray(masks, dtype=np.uint32)
+    shifts = np.zeros(masks.shape, dtype=np.uint32)
+    for bit in range(31, -1, -1):
+        shifts[(masks >> bit) & 1 == 1] = bit
+    return shifts
+
+
+# sorted distinct addresses of an array, split into runs of consecutive
+# addresses, and the position of every original address in the sorted list
+def RUNS(addresses):
+    unique, inverse = np.unique(np.asarray(addresses, dtype=np.uint32).ravel(), return_inverse=True)
+    return np.split(unique, np.flatnonzero(np.diff(unique)!=1)+1), inverse
+
+
+# read the words at an array of addresses in one dispatch, masks applied; each
+# run of consecutive addresses is a single block read
+def READ_WORDS(fc7, addresses, masks=None):
+    client = fc7.getClient()
+    runs, inverse = RUNS(addresses)
+    results = [client.readBlock(int(run[0]), len(run)) for run in runs]
+    fc7.dispatch()
+    words = np.array([int(v) for result in results for v in result.value()], dtype=np.uint32)
+    values = words[inverse].reshape(np.shape(addresses))
+    if masks is None:
+        return values
+    return (values & masks) >> SHIFTS(masks)
+
+
+# queue writes of an array of values to an array of addresses, masks applied;
+# full-word writes are merged into a register image (a later write to the same
+# address wins) and each run of consecutive addresses is one block write.
+# The caller dispatches.
+def WRITE_WORDS(fc7, addresses, values, masks=None):
+    client = fc7.getClient()
+    values = np.broadcast_to(np.asarray(values, dtype=np.uint32), np.shape(addresses)).ravel()
+    addresses = np.asarray(addresses, dtype=np.uint32).ravel()
+    if masks is None:
+        masks = np.full(addresses.shape, 0xFFFFFFFF, dtype=np.uint32)
+    else:
+        masks = np.broadcast_to(np.asarray(masks, dtype=np.uint32), addresses.shape).ravel()
+
+    full = masks==0xFFFFFFFF
+    image_addresses, last = np.unique(addresses[full][::-1], return_index=True)
+    image_values = values[full][::-1][last]
+    runs = np.split(np.arange(image_addresses.size), np.flatnonzero(np.diff(image_addresses)!=1)+1)
+    for run in runs:
+        if run.size:
+            client.writeBlock(int(image_addresses[run[0]]), [int(v) for v in image_values[run]])
+
+    # masked fields share their word with other bits and are written singly
+    for address, value, mask in zip(addresses[~full], values[~full], masks[~full]):
+        client.write(int(address), int(value), int(mask))
+
+
+# register writes for a list of settings, given as arrays of channel, sequence
+# and pulse indices with their delay, width and enable values: addresses,
+# words and masks, in setting order (ValueError for out-of-range values,
+# unless check is off because they have been checked already)
+def TRIGGER_IMAGE(addresses, channel, sequence, pulse, delay, width, enable, check=True):
+    channel = np.asarray(channel, dtype=np.intp)
+    sequence = np.asarray(sequence, dtype=np.intp)
+    pulse = np.asarray(pulse, dtype=np.intp)
+    parts = [(addresses.delay[channel, sequence, :, pulse], trigger_codec.ENCODE_DELAY(delay, check).T,
+              addresses.delay_mask[channel, sequence, :, pulse]),
+             (addresses.width[channel, sequence, :, pulse], trigger_codec.ENCODE_WIDTH(width, check).T,
+              addresses.width_mask[channel, sequence, :, pulse]),
+             (addresses.enable[channel, sequence, pulse][:, None], np.asarray(enable, dtype=np.uint32)[:, None],
+              addresses.enable_mask[channel, sequence, pulse][:, None])]
+    # one row of registers per setting, so that later settings come later
+    return (np.hstack([a for a, v, m in parts]).ravel(),
+            np.hstack([v for a, v, m in parts]).ravel(),
+            np.hstack([m for a, v, m in parts]).ravel())
+
+
+# delays, widths and enables [channel, sequence, pulse] of the selected
+# channels (an index or slice), read in one dispatch
+def READ_TRIGGERS(fc7, addresses, channels=slice(None)):
+    parts = [(addresses.delay[channels], addresses.delay_mask[channels]),
+             (addresses.width[channels], addresses.width_mask[channels]),
+             (addresses.enable[channels], addresses.enable_mask[channels])]
+    words = READ_WORDS(fc7, np.concatenate([a.ravel() for a, m in parts]), np.concatenate([m.ravel() for a, m in parts]))
+    values = []
+    for a, m in parts:
+        values.append(words[:a.size].reshape(a.shape))
+        words = words[a.size:]
+    return trigger_codec.DECODE_DELAY(values[0]), trigger_codec.DECODE_WIDTH(values[1]), values[2]
+
+
+# queue the writes of a list of settings, given as arrays of channel,
+# sequence and pulse indices with their delay, width and enable values
+def WRITE_TRIGGERS(fc7, addresses, channel, sequence, pulse, delay, width, enable):
+    WRITE_WORDS(fc7, *TRIGGER_IMAGE(addresses, channel, sequence, pulse, delay, width, enable))
+
+
+# only the writes of an image that change the board: full words are compared
+# with the board contents, read back in one dispatch; masked fields are always
+# written
+def DELTA(fc7, image):
+    addresses, values, masks = image
+    full = masks==0xFFFFFFFF
+    target, last = np.unique(addresses[full][::-1], return_index=True)
+    words = values[full][::-1][last]
+    current = READ_WORDS(fc7, target)
+
+    changed = words!=current
+    return (np.concatenate([target[changed], addresses[~full]]),
+            np.concatenate([words[changed], values[~full]]),
+            np.concatenate([np.full(changed.sum(), 0xFFFFFFFF, dtype=np.uint32), masks[~full]]))
@@ -0,0 +1,73 @@
+# Analog trigger delay/width codec
+#
+# The firmware counts a trigger delay in four 6-bit loops (LOOP0-3, 24 bits in
+# all) and a width in two 4-bit loops (LOOP0-1, 8 bits). These functions
+# convert whole arrays of values at once:
+#
+#   values [..., pulse]  <->  loop fields [..., loop, pulse]
+#
+# which matches the [channel, sequence, loop, pulse] layout of the
+# trigger_addresses arrays; a single value gives a [loop] vector. Encoding
+# checks the range of every value first and raises ValueError listing the
+# offending ones.
+
+import numpy as np
+
+DELAY_LOOPS = 4
+DELAY_BITS  = 6
+DELAY_MAX   = (1 << DELAY_LOOPS*DELAY_BITS)-1
+
+WIDTH_LOOPS = 2
+WIDTH_BITS  = 4
+WIDTH_MAX   = (1 << WIDTH_LOOPS*WIDTH_BITS)-1
+
+# at most this many offending values are listed in an error
+REPORTED = 10
+
+
+# positions of the values outside [low, high], as index tuples
+def OUT_OF_RANGE(values, low, high):
+    values = np.asarray(values, dtype=np.int64)
+    return [tuple(int(i) for i in index) for index in np.argwhere((values < low) | (values > high))]
+
+
+# raise ValueError if any value is outside [low, high]
+def CHECK_RANGE(values, low, high, name):
+    bad = OUT_OF_RANGE(values, low, high)
+    if not bad:
+        return
+    values = np.asarray(values, dtype=np.int64)
+    listed = ', '.join(str(index)+': '+str(int(values[index])) for index in bad[:REPORTED])
+    if len(bad) > REPORTED:
+        listed += ', ...'
+    raise ValueError(str(len(bad))+' '+name+' value(s) out of range ('+str(low)+'-'+str(high)+') at '+listed)
+
+
+def _encode(values, loops, bits, maximum, name, check):
+    if check:
+        CHECK_RANGE(values, 0, maximum, name)
+    shifts = np.arange(loops, dtype=np.uint32)*bits
+    values = np.asarray(values, dtype=np.int64).astype(np.uint32)
+    if values.ndim==0:
+        return (values >> shifts) & ((1 << bits)-1)
+    return (np.expand_dims(values, -2) >> shifts[:, None]) & ((1 << bits)-1)
+
+def _decode(fields, loops, bits):
+    shifts = np.arange(loops, dtype=np.uint32)*bits
+    fields = np.asarray(fields, dtype=np.uint32) & ((1 << bits)-1)
+    if fields.ndim==1:
+        return (fields << shifts).sum(dtype=np.uint32)
+    return (fields << shifts[:, None]).sum(axis=-2, dtype=np.uint32)
+
+
+def ENCODE_DELAY(delays, check=True):
+    return _encode(delays, DELAY_LOOPS, DELAY_BITS, DELAY_MAX, 'delay', check)
+
+def DECODE_DELAY(loops):
+    return _decode(loops, DELAY_LOOPS, DELAY_BITS)
+
+def ENCODE_WIDTH(widths, check=True):
+    return _encode(widths, WIDTH_LOOPS, WIDTH_BITS, WIDTH_MAX, 'width', check)
+
+def DECODE_WIDTH(loops):
+    return _decode(loops, WIDTH_LOOPS, WIDTH_BITS)
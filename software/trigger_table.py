@@ -0,0 +1,174 @@
+# Analog trigger settings table
+#
+# A TriggerTable holds A6 analog trigger settings as integer arrays indexed
+# [channel, sequence, pulse] (counted from 0), with a mask of the settings that
+# are present, so that CSV files, A6 JSON files, database rows and boards
+# convert into each other without going through strings more than once:
+#
+#   table = trigger_table.READ_CSV("kicker.csv")
+#   table.delay[0:3, :, 0] += 100
+#   trigger_table.WRITE_CSV(table, "kicker.csv")
+#
+#   image = trigger_table.BOARD_IMAGE(table, trigger_addresses.ADDRESSES(fc7))
+#
+# Loaders raise ValueError for settings that do not fit the table, except
+# READ_CHECKED, which reads and checks a CSV file once, like
+# trigger_validate.VALIDATE, and returns its violations instead.
+
+import csv, json
+import numpy as np
+import trigger_addresses, trigger_codec, trigger_validate
+
+# channel numbers allowed in files and the database; a board has those of
+# its address table (trigger_addresses.TABLE_CHANNELS)
+CHANNELS  = 16
+SEQUENCES = 16
+PULSES    = 4
+
+HEADER = ["Channel", "Sequence", "Pulse", "Delay", "Width", "Enable"]
+
+
+class TriggerTable(object):
+    def __init__(self, channels=CHANNELS, sequences=SEQUENCES, pulses=PULSES):
+        shape = (channels, sequences, pulses)
+        self.delay = np.zeros(shape, dtype=np.int64)
+        self.width = np.zeros(shape, dtype=np.int64)
+        self.enable = np.zeros(shape, dtype=np.int64)
+        self.present = np.zeros(shape, dtype=bool)
+
+    def __len__(self):
+        return int(self.present.sum())
+
+    @property
+    def shape(self):
+        return self.present.shape
+
+    # store settings given as arrays of channel, sequence and pulse indices with
+    # their delay, width and enable values; a later setting of the same pulse
+    # wins. rows numbers the settings in error messages (default 1, 2, ...)
+    def set(self, channel, sequence, pulse, delay, width, enable, rows=None):
+        index = [np.asarray(channel, dtype=np.intp).ravel(),
+                 np.asarray(sequence, dtype=np.intp).ravel(),
+                 np.asarray(pulse, dtype=np.intp).ravel()]
+        if rows is None:
+            rows = np.arange(index[0].size)+1
+        for values, size, name in zip(index, self.shape, ("channel", "sequence", "pulse")):
+            bad = (values < 0) | (values >= size)
+            if bad.any():
+                raise ValueError(name+' number out of range (1-'+str(size)+') in row(s) '+
+                                 ', '.join(str(row) for row in np.asarray(rows)[bad]))
+
+        flat, last = np.unique(np.ravel_multi_index(index, self.shape)[::-1], return_index=True)
+        for array, values in ((self.delay, delay), (self.width, width), (self.enable, enable)):
+            values = np.broadcast_to(np.asarray(values, dtype=np.int64).ravel(), index[0].shape)
+            array.flat[flat] = values[::-1][last]
+        self.present.flat[flat] = True
+
+    # raise ValueError for values the board cannot take
+    def check(self):
+        trigger_codec.CHECK_RANGE(np.where(self.present, self.delay, 0), 0, trigger_codec.DELAY_MAX, 'delay')
+        trigger_codec.CHECK_RANGE(np.where(self.present, self.width, 0), 0, trigger_codec.WIDTH_MAX, 'width')
+        trigger_codec.CHECK_RANGE(np.where(self.present, self.enable, 0), 0, 1, 'enable')
+
+    # channel, sequence and pulse indices of the present settings, in that
+    # order, with their delay, width and enable values
+    def settings(self):
+        index = np.nonzero(self.present)
+        return index + (self.delay[index], self.width[index], self.enable[index])
+
+    # present settings as (channel, sequence, pulse, delay, width, enable)
+    # tuples, counted from 1 as in files and the database
+    def rows(self):
+        channel, sequence, pulse, delay, width, enable = self.settings()
+        return list(zip((channel+1).tolist(), (sequence+1).tolist(), (pulse+1).tolist(),
+                        delay.tolist(), width.tolist(), enable.tolist()))
+
+
+# table from (channel, sequence, pulse, delay, width, enable) rows, numbers or
+# strings counted from 1; first is the number of the first row in messages
+def FROM_ROWS(rows, first=1):
+    numbers = trigger_validate.NUMBERS(rows, trigger_validate.A6, first)
+    return FROM_ARRAY(numbers, np.arange(len(numbers))+first)
+
+
+# table from an integer array of (channel, sequence, pulse, delay, width,
+# enable) rows counted from 1; rows numbers them in error messages
+def FROM_ARRAY(numbers, rows=None):
+    table = TriggerTable()
+    table.set(numbers[:, 0]-1, numbers[:, 1]-1, numbers[:, 2]-1, numbers[:, 3], numbers[:, 4], numbers[:, 5], rows)
+    return table
+
+
+# .csv file format, after a header row:
+# [channel], [sequence], [pulse], [delay], [width], [enable]
+def READ_CSV(path):
+    with open(path, 'r') as infile:
+        settings = list(csv.reader(infile))
+    return FROM_ROWS(settings[1:], 2)
+
+# table and violations (trigger_validate.VALIDATE messages) of a CSV file for a
+# board with the given number of channels; the table is None if there are any
+def READ_CHECKED(path, channels=CHANNELS):
+    schema = [column._replace(high=channels) if column.name=="channel" else column for column in trigger_validate.A6]
+    numbers, rows, errors = trigger_validate.READ(path, schema)
+    if errors:
+        return None, errors
+    return FROM_ARRAY(numbers, rows), []
+
+def WRITE_CSV(table, path):
+    with open(path, 'w') as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(HEADER)
+        writer.writerows(table.rows())
+
+
+# A6 analog json files hold one channel: "SequenceN-Trigger-Delay" and
+# "SequenceN-Trigger-Width" lists of the pulses of each sequence (from 0),
+# all enabled. The channel (from 1) is added to table, or to a new one
+def READ_JSON(path, channel, table=None):
+    with open(path, 'r') as infile:
+        data = json.load(infile)
+    if table is None:
+        table = TriggerTable()
+    sequences, pulses = table.shape[1:]
+    delay = np.array([data["Sequence%d-Trigger-Delay" % sequence] for sequence in range(sequences)], dtype=np.int64)
+    width = np.array([data["Sequence%d-Trigger-Width" % sequence] for sequence in range(sequences)], dtype=np.int64)
+    if delay.shape != (sequences, pulses) or width.shape != (sequences, pulses):
+        raise ValueError('expected '+str(pulses)+' delays and widths per sequence in '+path)
+    table.set(np.full(delay.size, channel-1), np.repeat(np.arange(sequences), pulses), np.tile(np.arange(pulses), sequences),
+              delay, width, 1)
+    return table
+
+def WRITE_JSON(table, path, channel):
+    data = {}
+    for sequence in range(table.shape[1]):
+        data["Sequence%d-Trigger-Delay" % sequence] = table.delay[channel-1, sequence].tolist()
+        data["Sequence%d-Trigger-Width" % sequence] = table.width[channel-1, sequence].tolist()
+    with open(path, 'w') as outfile:
+        json.dump(data, outfile, indent=2, sort_keys=True)
+
+
+# settings of the first channels of a board (all of them by default), read in
+# one dispatch
+def READ_BOARD(fc7, channels=None, addresses=None):
+    if addresses is None:
+        addresses = trigger_addresses.ADDRESSES(fc7)
+    if channels is None:
+        channels = addresses.channels
+    delay, width, enable = trigger_addresses.READ_TRIGGERS(fc7, addresses, slice(0, channels))
+    table = TriggerTable()
+    table.delay[:channels] = delay
+    table.width[:channels] = width
+    table.enable[:channels] = enable
+    table.present[:channels] = True
+    return table
+
+# register writes of the present settings (trigger_addresses.TRIGGER_IMAGE);
+# check can be turned off for a table from READ_CHECKED
+def BOARD_IMAGE(table, addresses, check=True):
+    channel, sequence, pulse, delay, width, enable = table.settings()
+    if check:
+        table.check()
+        if (channel >= addresses.channels).any():
+            raise ValueError('channel number out of range for the board (1-'+str(addresses.channels)+')')
+    return trigger_addresses.TRIGGER_IMAGE(addresses, channel, sequence, pulse, delay, width, enable, check)
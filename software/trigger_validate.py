@@ -0,0 +1,139 @@
+# Trigger csv file validation
+# Usage: python trigger_validate.py [a6|t9|ttc] [csv files]
+#
+# Each csv format is described by a schema: its columns, in order, with the
+# range of values each can take. VALIDATE checks a whole file at once, column by
+# column, and returns every violation with its row number (the header is row 1)
+# instead of stopping at the first one:
+#
+#   errors = trigger_validate.VALIDATE("kicker.csv", trigger_validate.A6)
+#   for error in errors:
+#       print('File format error: '+error)
+#
+# READ does the same and also returns the values, so that a file is read and
+# checked once before it is loaded. NUMBERS converts rows already in memory
+# (database rows), raising ValueError for the first one that does not fit.
+
+import sys, csv
+from collections import namedtuple
+import numpy as np
+import trigger_codec
+
+Column = namedtuple("Column", "name low high")
+
+# A6-based analog triggers
+# [channel], [sequence], [pulse], [delay], [width], [enable]
+A6 = [Column("channel",  1, 16),
+      Column("sequence", 1, 16),
+      Column("pulse",    1, 4),
+      Column("delay",    0, trigger_codec.DELAY_MAX),
+      Column("width",    0, trigger_codec.WIDTH_MAX),
+      Column("enable",   0, 1)]
+
+# T9-based analog triggers
+# [channel], [sequence], [delay], [enable], [global_width]
+T9 = [Column("channel",      1, 4),
+      Column("sequence",     1, 16),
+      Column("delay",        0, trigger_codec.DELAY_MAX),
+      Column("enable",       0, 1),
+      Column("global width", 0, 255)]
+
+# TTC sequencer, gaps in ns (25 ns per clock tick)
+# [sequence], [index], [gap], [type]
+TTC = [Column("sequence", 1, 16),
+       Column("index",    1, 16),
+       Column("gap",      0, 25*0xFFFFFFFF),
+       Column("type",     0, 31)]
+
+SCHEMAS = {"a6": A6, "t9": T9, "ttc": TTC}
+
+
+# a file or database value as an integer: decimal, or with a 0x, 0o or 0b
+# prefix; numbers are converted as they are
+def INT(value):
+    if not hasattr(value, 'strip'):
+        return int(value)
+    try:
+        return int(value, 0)
+    except ValueError:
+        return int(value)
+
+
+# integer array of rows, numbered from first, their row numbers, which cells
+# are numbers and the (row, message) violations found getting there: rows
+# with the wrong number of columns, which are left out, and cells that are not
+# numbers
+def PARSE_ROWS(settings, schema, first=1):
+    errors = []
+    numbers = np.arange(len(settings))+first
+    good = np.array([len(setting)==len(schema) for setting in settings], dtype=bool)
+    for row in numbers[~good]:
+        errors.append((int(row), 'incorrect number of columns ('+str(len(schema))+')'))
+    settings = [setting for setting, ok in zip(settings, good) if ok]
+    numbers = numbers[good]
+
+    # all plain decimal numbers is the common case and converts in one go
+    parsed = np.ones((len(settings), len(schema)), dtype=bool)
+    try:
+        values = np.array(settings, dtype=str).reshape(-1, len(schema)).astype(np.int64)
+    except (ValueError, OverflowError):
+        values = np.zeros((len(settings), len(schema)), dtype=np.int64)
+        for n, setting in enumerate(settings):
+            for c, value in enumerate(setting):
+                try:
+                    values[n, c] = INT(value)
+                except (TypeError, ValueError, OverflowError):
+                    errors.append((int(numbers[n]), schema[c].name+' "'+str(value)+'" is not a number'))
+                    parsed[n, c] = False
+    return values, numbers, parsed, errors
+
+
+# PARSE_ROWS of the rows of a file after its header
+def PARSE(path, schema):
+    with open(path, 'r') as infile:
+        settings = list(csv.reader(infile))[1:]
+    return PARSE_ROWS(settings, schema, 2)
+
+
+# integer array of rows, numbered from first in messages; ValueError for the
+# first row with the wrong number of columns or a value that is not a number
+def NUMBERS(rows, schema, first=1):
+    values, numbers, parsed, errors = PARSE_ROWS(list(rows), schema, first)
+    if errors:
+        row, message = min(errors)
+        raise ValueError('row '+str(row)+': '+message)
+    return values
+
+
+# integer array of the rows of a file after its header, their row numbers and
+# every violation of a schema, in row order; the values are only meaningful if
+# there are no violations
+def READ(path, schema):
+    values, numbers, parsed, errors = PARSE(path, schema)
+    for c, column in enumerate(schema):
+        bad = parsed[:, c] & ((values[:, c] < column.low) | (values[:, c] > column.high))
+        for n in np.flatnonzero(bad):
+            errors.append((int(numbers[n]), column.name+' '+str(values[n, c])+
+                           ' out of range ('+str(column.low)+'-'+str(column.high)+')'))
+    errors.sort(key=lambda error: error[0])
+    return values, numbers, ['row '+str(row)+': '+message for row, message in errors]
+
+
+# every violation of a schema in a file, in row order; empty if the file is fine
+def VALIDATE(path, schema):
+    return READ(path, schema)[2]
+
+
+if __name__ == '__main__':
+    # check number of arguments
+    if len(sys.argv)<3 or sys.argv[1] not in SCHEMAS:
+        print('usage: python trigger_validate.py [a6|t9|ttc] [csv files]')
+        sys.exit(2)
+
+    failed = False
+    for path in sys.argv[2:]:
+        errors = VALIDATE(path, SCHEMAS[sys.argv[1]])
+        for error in errors:
+            print(path+': '+error)
+        failed = failed or bool(errors)
+    sys.exit(1 if failed else 0)
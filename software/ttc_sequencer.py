@@ -0,0 +1,238 @@
+# TTC sequencer table
+#
+# The sequencer of a board is SEQ.COUNT (number of sequences - 1) and 16
+# sequences of sequencer_table.xml: SEQn.COUNT (triggers in the sequence - 1),
+# and the pre-trigger gap (clock ticks) and type of each of 16 triggers. A
+# SequenceTable holds all of it as arrays indexed [sequence, trigger] (counted
+# from 0), read from a board in one dispatch, one block read per sequence:
+#
+#   table = ttc_sequencer.READ_BOARD(fc7)
+#   for sequence, trigger, gap, kind in table.rows():
+#       ...
+#
+# and written back, from a TTC csv file, as block writes in one dispatch that
+# also reads them back:
+#
+#   table = ttc_sequencer.READ_CSV("ttc.csv")
+#   errors = ttc_sequencer.WRITE_BOARD(fc7, table)
+#
+# Counts are kept as the registers hold them, one less than the number.
+# Loaders raise ValueError for files that do not describe a sequencer setup,
+# except READ_CHECKED, which reads and checks a file once and returns its
+# problems instead.
+
+import csv
+import numpy as np
+import fc7_address_table, trigger_addresses, trigger_codec, trigger_validate
+
+SEQUENCES = 16
+TRIGGERS  = 16
+GAP_MAX   = 0xFFFFFFFF
+TYPE_MAX  = 31
+
+# gaps in TTC csv files are in ns, one clock tick is 25 ns
+TICK_NS = 25
+
+HEADER = ["Sequence", "Index", "Gap", "Type"]
+
+
+class SequencerAddresses(object):
+    def __init__(self, table):
+        # SEQ_COUNT in address_table.xml, SEQ.COUNT in FC7_CCC.xml
+        node = table.node("SEQ_COUNT" if "SEQ_COUNT" in table else "SEQ.COUNT")
+        self.count = np.uint32(node.address)
+        self.count_mask = np.uint32(node.mask)
+        self.counts = np.zeros(SEQUENCES, dtype=np.uint32)
+        self.counts_mask = np.zeros(SEQUENCES, dtype=np.uint32)
+        self.gap = np.zeros((SEQUENCES, TRIGGERS), dtype=np.uint32)
+        self.gap_mask = np.zeros((SEQUENCES, TRIGGERS), dtype=np.uint32)
+        self.type = np.zeros((SEQUENCES, TRIGGERS), dtype=np.uint32)
+        self.type_mask = np.zeros((SEQUENCES, TRIGGERS), dtype=np.uint32)
+
+        for sequence in range(SEQUENCES):
+            prefix = "SEQ"+str(sequence)
+            node = table.node(prefix+".COUNT")
+            self.counts[sequence] = node.address
+            self.counts_mask[sequence] = node.mask
+            for trigger in range(TRIGGERS):
+                node = table.node(prefix+".PRE_TRIG.GAP"+str(trigger))
+                self.gap[sequence, trigger] = node.address
+                self.gap_mask[sequence, trigger] = node.mask
+                node = table.node(prefix+".TRIG.TYPE"+str(trigger))
+                self.type[sequence, trigger] = node.address
+                self.type_mask[sequence, trigger] = node.mask
+        self.type_shift = trigger_addresses.SHIFTS(self.type_mask)
+
+    # every sequencer register: addresses and masks, SEQ.COUNT first, then
+    # the sequence counts, gaps and types
+    def registers(self):
+        return (np.concatenate([[self.count], self.counts, self.gap.ravel(), self.type.ravel()]).astype(np.uint32),
+                np.concatenate([[self.count_mask], self.counts_mask, self.gap_mask.ravel(),
+                                self.type_mask.ravel()]).astype(np.uint32))
+
+
+# sequencer addresses for a device (fc7_address_table.DEVICE_TABLE)
+def ADDRESSES(fc7):
+    return SequencerAddresses(fc7_address_table.DEVICE_TABLE(fc7))
+
+
+class SequenceTable(object):
+    def __init__(self, sequences=SEQUENCES, triggers=TRIGGERS):
+        self.count = 0
+        self.counts = np.zeros(sequences, dtype=np.int64)
+        self.gap = np.zeros((sequences, triggers), dtype=np.int64)
+        self.type = np.zeros((sequences, triggers), dtype=np.int64)
+
+    @property
+    def shape(self):
+        return self.gap.shape
+
+    # which [sequence, trigger] the sequencer runs: the first count+1
+    # triggers of the first SEQ.COUNT+1 sequences
+    def active(self):
+        sequences, triggers = self.shape
+        used = np.arange(sequences) <= self.count
+        return used[:, None] & (np.arange(triggers)[None, :] <= self.counts[:, None])
+
+    # raise ValueError for values the board cannot take
+    def check(self):
+        sequences, triggers = self.shape
+        active = self.active()
+        trigger_codec.CHECK_RANGE([self.count], 0, sequences-1, 'sequence count')
+        trigger_codec.CHECK_RANGE(self.counts, 0, triggers-1, 'trigger count')
+        trigger_codec.CHECK_RANGE(np.where(active, self.gap, 0).ravel(), 0, GAP_MAX, 'gap')
+        trigger_codec.CHECK_RANGE(np.where(active, self.type, 0).ravel(), 0, TYPE_MAX, 'type')
+
+    # triggers the sequencer runs as (sequence, trigger, gap, type) tuples,
+    # counted from 0, in sequence and trigger order
+    def rows(self):
+        sequence, trigger = np.nonzero(self.active())
+        return list(zip(sequence.tolist(), trigger.tolist(), self.gap[sequence, trigger].tolist(),
+                        self.type[sequence, trigger].tolist()))
+
+
+# the sequencer of a board, read in one dispatch
+def READ_BOARD(fc7, addresses=None):
+    if addresses is None:
+        addresses = ADDRESSES(fc7)
+    words = trigger_addresses.READ_WORDS(fc7, *addresses.registers()).astype(np.int64)
+    table = SequenceTable()
+    table.count = int(words[0])
+    table.counts[:] = words[1:1+SEQUENCES]
+    words = words[1+SEQUENCES:]
+    table.gap[:] = words[:SEQUENCES*TRIGGERS].reshape(SEQUENCES, TRIGGERS)
+    table.type[:] = words[SEQUENCES*TRIGGERS:].reshape(SEQUENCES, TRIGGERS)
+    return table
+
+
+def _listed(rows):
+    return ', '.join(str(row) for row in rows)
+
+
+# table from (sequence, index, gap, type) rows, numbers or strings counted
+# from 1; first is the number of the first row in messages. Gaps are in ns,
+# whole clock ticks, unless ticks is set. Every sequence up to the last one
+# given needs its triggers numbered from 1 without holes, and no trigger may
+# be given twice
+def FROM_ROWS(rows, first=1, ticks=False):
+    numbers = trigger_validate.NUMBERS(rows, trigger_validate.TTC, first)
+    return FROM_ARRAY(numbers, np.arange(len(numbers))+first, ticks)
+
+
+# table from an integer array of (sequence, index, gap, type) rows counted from
+# 1, as FROM_ROWS; row_numbers numbers them in messages
+def FROM_ARRAY(numbers, row_numbers, ticks=False):
+    if not len(numbers):
+        raise ValueError('no triggers')
+    sequence, trigger, gap, kind = numbers[:, 0]-1, numbers[:, 1]-1, numbers[:, 2], numbers[:, 3]
+
+    for values, size, name in ((sequence, SEQUENCES, "sequence"), (trigger, TRIGGERS, "index")):
+        bad = (values < 0) | (values >= size)
+        if bad.any():
+            raise ValueError(name+' number out of range (1-'+str(size)+') in row(s) '+_listed(row_numbers[bad]))
+    if not ticks:
+        bad = gap % TICK_NS != 0
+        if bad.any():
+            raise ValueError('gap not a multiple of '+str(TICK_NS)+' ns in row(s) '+_listed(row_numbers[bad]))
+        gap = gap // TICK_NS
+
+    flat = np.ravel_multi_index((sequence, trigger), (SEQUENCES, TRIGGERS))
+    unique, counts = np.unique(flat, return_counts=True)
+    twice = np.isin(flat, unique[counts > 1])
+    if twice.any():
+        raise ValueError('trigger given more than once in row(s) '+_listed(row_numbers[twice]))
+
+    table = SequenceTable()
+    given = np.zeros(table.shape, dtype=bool)
+    given[sequence, trigger] = True
+    table.gap[sequence, trigger] = gap
+    table.type[sequence, trigger] = kind
+    table.count = int(sequence.max())
+    table.counts[:] = np.maximum(TRIGGERS-1-np.argmax(given[:, ::-1], axis=1), 0)
+    table.counts[~given.any(axis=1)] = 0
+    missing = np.argwhere(table.active() & ~given)
+    if len(missing):
+        raise ValueError('missing trigger(s) '+', '.join('sequence '+str(s+1)+' index '+str(t+1)
+                                                         for s, t in missing.tolist()))
+    table.check()
+    return table
+
+
+# .csv file format, after a header row (GetTriggerValuesFromDB.py --type ttc):
+# [sequence], [index], [gap], [type]
+def READ_CSV(path, ticks=False):
+    with open(path, 'r') as infile:
+        settings = list(csv.reader(infile))
+    return FROM_ROWS(settings[1:], 2, ticks)
+
+# table and problems (trigger_validate.VALIDATE messages, then the first
+# FROM_ARRAY error) of a TTC csv file; the table is None if there are any
+def READ_CHECKED(path, ticks=False):
+    schema = trigger_validate.TTC
+    if ticks:
+        schema = [column._replace(high=GAP_MAX) if column.name=="gap" else column for column in schema]
+    numbers, rows, errors = trigger_validate.READ(path, schema)
+    if errors:
+        return None, errors
+    try:
+        return FROM_ARRAY(numbers, rows, ticks), []
+    except ValueError as e:
+        return None, [str(e)]
+
+
+# register writes of a table: addresses, words and masks. Every register of
+# the 16 sequences is written, unused triggers as 0, so each sequence is one
+# run of consecutive words. The type fields of a word are all its used bits
+# and are joined into whole words; SEQ.COUNT shares its word and is masked
+def BOARD_IMAGE(table, addresses):
+    table.check()
+    active = table.active()
+    gap = np.where(active, table.gap, 0).astype(np.uint32)
+    kind = np.where(active, table.type, 0).astype(np.uint32) << addresses.type_shift
+    type_words, inverse = np.unique(addresses.type, return_inverse=True)
+    words = np.zeros(type_words.shape, dtype=np.uint32)
+    np.bitwise_or.at(words, inverse.ravel(), kind.ravel())
+
+    full = np.uint32(0xFFFFFFFF)
+    image = [([addresses.count], [table.count], [addresses.count_mask]),
+             (addresses.counts, table.counts, np.full(SEQUENCES, full)),
+             (addresses.gap.ravel(), gap.ravel(), np.full(gap.size, full)),
+             (type_words, words, np.full(words.size, full))]
+    return tuple(np.concatenate([np.asarray(part[n]).astype(np.uint32) for part in image]) for n in range(3))
+
+
+# write a table to a board with block writes, reading the registers back in
+# the same dispatch; returns the (address, expected, read) of the registers
+# that differ, empty if all is well
+def WRITE_BOARD(fc7, table, addresses=None, verify=True):
+    if addresses is None:
+        addresses = ADDRESSES(fc7)
+    image = BOARD_IMAGE(table, addresses)
+    trigger_addresses.WRITE_WORDS(fc7, *image)
+    if not verify:
+        fc7.dispatch()
+        return []
+    target, expected, masks = image
+    words = trigger_addresses.READ_WORDS(fc7, target, masks)
+    bad = np.flatnonzero(words != expected)
+    return [(int(target[n]), int(expected[n]), int(words[n])) for n in bad]
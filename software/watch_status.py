@@ -0,0 +1,117 @@
+# FC7 status watch script
+# Usage: python watch_status.py [crate numbers] [slot numbers] [options]
+#
+# Reads the STATUS block of every board a few times a second over one
+# connection per board and prints the firmware signals that changed since the
+# previous read, with the time they were seen. Only the signals that use a
+# word that changed are decoded (status_fields.py). Runs until interrupted or
+# for -n reads.
+
+import fc7_client, fc7_fanout, status_fields, status_poll, sys, getopt, json, time
+import numpy as np
+
+# colors
+GRAY  = "\033[47;30m"
+BLUE  = "\033[0;34m"
+RED   = "\033[0;31m"
+RESET = "\033[m\017"
+
+# help menu
+def HELP_MENU():
+    print('usage: python watch_status.py [crate numbers] [slot numbers] [options]')
+    print('')
+    print('options:')
+    print('  -h        : show this help menu and exit')
+    print('  -r RATE   : reads per second (default 1)')
+    print('  -n COUNT  : stop after COUNT reads (default: run until interrupted)')
+    print('  -f FIELDS : comma-separated signals to watch (default: all, see read_status.py expert)')
+    print('  -a        : print every watched signal at the first read')
+    print('  -j        : print one json object per change instead of text')
+
+# check number of arguments
+if len(sys.argv)<3:
+    HELP_MENU()
+    sys.exit(2)
+
+# parse argument options
+try:
+    opts, args = getopt.getopt(sys.argv[3:],"hr:n:f:aj")
+except getopt.GetoptError:
+    HELP_MENU()
+    sys.exit(2)
+
+rate = 1.0
+count = None
+fields = None
+initial = False
+as_json = False
+for opt, arg in opts:
+    if opt in ("-h"):
+        HELP_MENU()
+        sys.exit()
+    elif opt in ("-r"):
+        rate = float(arg)
+    elif opt in ("-n"):
+        count = int(arg)
+    elif opt in ("-f"):
+        fields = set(arg.split(','))
+        unknown = [name for name in fields if name not in status_fields.FIELD]
+        if unknown:
+            print('Unknown status signal(s): '+', '.join(sorted(unknown)))
+            sys.exit(2)
+    elif opt in ("-a"):
+        initial = True
+    elif opt in ("-j"):
+        as_json = True
+
+# one change, as text or json
+def EMIT(stamp, crate, slot, name, old, new):
+    field = status_fields.FIELD[name]
+    if as_json:
+        print(json.dumps({"time": round(stamp, 3), "crate": crate, "slot": slot, "field": name,
+                          "old": None if old is None else status_fields.FORMAT(field, old),
+                          "new": status_fields.FORMAT(field, new)}))
+    else:
+        text = status_fields.FORMAT(field, new)
+        if old is not None:
+            text = status_fields.FORMAT(field, old)+' -> '+text
+        print(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stamp))+'.%03d' % int(1000*(stamp % 1))+
+              '  crate '+crate+' slot '+slot+'  '+name.ljust(33)+': '+BLUE+text+RESET)
+    sys.stdout.flush()
+
+boards = [(crate, slot, fc7_client.getDevice(crate, slot))
+          for crate in fc7_fanout.PARSE_ARG(sys.argv[1]) for slot in fc7_fanout.PARSE_ARG(sys.argv[2])]
+words = {}
+values = {}
+
+if not as_json:
+    print(GRAY+'Watching '+str(len(boards))+' board(s) at '+str(rate)+' Hz, Ctrl-C to stop'+RESET)
+
+try:
+    for snapshots in status_poll.POLL([fc7 for crate, slot, fc7 in boards], 1.0/rate, count):
+        for (crate, slot, fc7), (stamp, new, error) in zip(boards, snapshots):
+            if error is not None:
+                print(RED+'crate '+crate+' slot '+slot+': read failed: '+error+RESET)
+                continue
+            new = np.array(new, dtype=np.uint64)
+
+            # first read: everything is new
+            if (crate, slot) not in words:
+                words[(crate, slot)] = new
+                values[(crate, slot)] = status_fields.DECODE(new, fields)
+                if initial:
+                    for name, value in values[(crate, slot)].items():
+                        EMIT(stamp, crate, slot, name, None, value)
+                continue
+
+            changed = status_fields.CHANGED(words[(crate, slot)], new, fields)
+            words[(crate, slot)] = new
+            if not changed:
+                continue
+            known = values[(crate, slot)]
+            for name, value in status_fields.DECODE(new, changed).items():
+                if value!=known[name]:
+                    EMIT(stamp, crate, slot, name, known[name], value)
+                    known[name] = value
+except KeyboardInterrupt:
+    pass